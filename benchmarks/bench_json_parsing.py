@@ -0,0 +1,36 @@
+"""Compare validating JSON API responses from a decoded dict with validating them from bytes."""
+
+import json
+import timeit
+
+from payloads import build_payload_bytes
+
+from letsbuilda.pypi import JSONPackageMetadata
+
+PAYLOADS = {
+    "small (10 releases)": build_payload_bytes("small", 10, description_size=1_000),
+    "boto3-like (2000 releases)": build_payload_bytes("boto3", 2_000),
+    "numpy-like (150 releases, 500 KB description)": build_payload_bytes("numpy", 150, description_size=500_000),
+}
+
+
+def main() -> None:
+    """Run the benchmark."""
+    for name, payload in PAYLOADS.items():
+        number = max(1, 2_000_000 // len(payload))
+        from_dict = min(
+            timeit.repeat(lambda: JSONPackageMetadata.model_validate(json.loads(payload)), number=number, repeat=5),  # noqa: B023
+        )
+        from_bytes = min(
+            timeit.repeat(lambda: JSONPackageMetadata.model_validate_json(payload), number=number, repeat=5),  # noqa: B023
+        )
+        print(
+            f"{name}: {len(payload) / 1024:.0f} KiB, "
+            f"model_validate(json.loads()) {from_dict / number * 1000:.3f} ms, "
+            f"model_validate_json() {from_bytes / number * 1000:.3f} ms, "
+            f"{from_dict / from_bytes:.1f}x faster",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Compare the memory held by many validated JSON API responses, with and without the model options."""
+
+import json
+import tracemalloc
+
+from payloads import build_payload
+
+from letsbuilda.pypi import JSONPackageMetadata, ModelOptions
+
+PACKAGE_COUNT = 2_000
+# Many projects put the whole text of their license in the metadata
+LICENSE = (
+    "Permission is hereby granted, free of charge, to any person obtaining a copy of this software and "
+    'associated documentation files (the "Software"), to deal in the Software without restriction.'
+)
+CLASSIFIERS = [
+    "Development Status :: 5 - Production/Stable",
+    "License :: OSI Approved :: GNU Lesser General Public License v3 or later (LGPLv3+)",
+    "Programming Language :: Python :: Implementation :: CPython",
+    "Topic :: Software Development :: Libraries :: Application Frameworks",
+]
+OPTIONS: dict[str, ModelOptions | None] = {
+    "default": None,
+    "intern_strings": {"intern_strings": True},
+    "drop_description": {"drop_description": True},
+    "both": {"intern_strings": True, "drop_description": True},
+}
+
+
+def build_payloads() -> list[bytes]:
+    """Build the responses of many distinct projects, sharing licenses, classifiers and Python versions."""
+    payloads = []
+    for index in range(PACKAGE_COUNT):
+        payload = build_payload(f"project-{index}", 3, description_size=5_000)
+        payload["info"] |= {"license": LICENSE, "classifiers": CLASSIFIERS}
+        payload.pop("releases")
+        payloads.append(json.dumps(payload).encode())
+    return payloads
+
+
+def measure(payloads: list[bytes], options: ModelOptions | None) -> int:
+    """Validate every payload, keeping the models, and get the memory they hold."""
+    tracemalloc.start()
+    models = [JSONPackageMetadata.model_validate_json(payload, context=options) for payload in payloads]
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del models
+    return held
+
+
+def main() -> None:
+    """Run the benchmark."""
+    payloads = build_payloads()
+    baseline = None
+    for name, options in OPTIONS.items():
+        held = measure(payloads, options)
+        baseline = baseline or held
+        print(f"{name:<18} {held / 1024 / 1024:>8.2f} MiB for {PACKAGE_COUNT} packages, {held / baseline:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Synthetic JSON API payloads shaped like those of large real projects."""
+
+import hashlib
+import json
+from typing import Any
+
+
+def build_file(project: str, version: str, packagetype: str) -> dict[str, Any]:
+    """Build the entry for one distribution file."""
+    filename = (
+        f"{project}-{version}-py3-none-any.whl" if packagetype == "bdist_wheel" else f"{project}-{version}.tar.gz"
+    )
+    md5 = hashlib.md5(filename.encode(), usedforsecurity=False).hexdigest()
+    return {
+        "comment_text": "",
+        "digests": {
+            "blake2b_256": hashlib.blake2b(filename.encode(), digest_size=32).hexdigest(),
+            "md5": md5,
+            "sha256": hashlib.sha256(filename.encode()).hexdigest(),
+        },
+        "downloads": -1,
+        "filename": filename,
+        "has_sig": False,
+        "md5_digest": md5,
+        "packagetype": packagetype,
+        "python_version": "py3" if packagetype == "bdist_wheel" else "source",
+        "requires_python": ">=3.9",
+        "size": 140_000,
+        "upload_time": "2024-11-14T20:31:03",
+        "upload_time_iso_8601": "2024-11-14T20:31:03.919027Z",
+        "url": f"https://files.pythonhosted.org/packages/cb/63/f897bdaa98710f9cb96ca13917421929/{filename}",
+        "yanked": False,
+        "yanked_reason": None,
+    }
+
+
+def build_payload(project: str, release_count: int, description_size: int = 20_000) -> dict[str, Any]:
+    """
+    Build the JSON API response for a project with many releases.
+
+    The `releases` map dominates the size of responses for projects like `boto3` and `numpy`.
+    """
+    versions = [f"1.{minor}.{patch}" for minor in range(release_count // 50 + 1) for patch in range(50)]
+    versions = versions[:release_count]
+    latest = versions[-1]
+    return {
+        "info": {
+            "author": "Example Author",
+            "author_email": "author@example.com",
+            "bugtrack_url": None,
+            "classifiers": [
+                "Development Status :: 5 - Production/Stable",
+                "Intended Audience :: Developers",
+                "License :: OSI Approved :: Apache Software License",
+                "Programming Language :: Python :: 3",
+            ],
+            "description": "x" * description_size,
+            "description_content_type": "text/x-rst",
+            "docs_url": None,
+            "download_url": "",
+            "downloads": {"last_day": -1, "last_month": -1, "last_week": -1},
+            "home_page": f"https://github.com/example/{project}",
+            "keywords": "",
+            "license": "Apache License 2.0",
+            "license_expression": None,
+            "license_files": None,
+            "maintainer": "",
+            "maintainer_email": "",
+            "name": project,
+            "package_url": f"https://pypi.org/project/{project}/",
+            "platform": None,
+            "project_url": f"https://pypi.org/project/{project}/",
+            "project_urls": {"Source": f"https://github.com/example/{project}"},
+            "release_url": f"https://pypi.org/project/{project}/{latest}/",
+            "requires_dist": ["botocore<1.36.0,>=1.35.61", "jmespath<2.0.0,>=0.7.1"],
+            "requires_python": ">=3.8",
+            "summary": "An example project",
+            "version": latest,
+            "yanked": False,
+            "yanked_reason": None,
+        },
+        "last_serial": 26000000,
+        "releases": {
+            version: [build_file(project, version, "bdist_wheel"), build_file(project, version, "sdist")]
+            for version in versions
+        },
+        "urls": [build_file(project, latest, "bdist_wheel"), build_file(project, latest, "sdist")],
+        "vulnerabilities": [],
+    }
+
+
+def build_payload_bytes(project: str, release_count: int, description_size: int = 20_000) -> bytes:
+    """Build the JSON API response for a project with many releases, encoded as it is sent."""
+    return json.dumps(build_payload(project, release_count, description_size)).encode()
@@ -0,0 +1,185 @@
+"""
+Run the offline benchmark suite.
+
+Every benchmark runs against recorded or generated fixtures, with clients talking to a replaying transport,
+so results only reflect this package's own overhead. Results are written as JSON, and can be compared
+with those of another version::
+
+    python benchmarks/run.py --output baseline.json
+    python benchmarks/run.py --compare baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from functools import partial
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any
+
+import httpx
+from payloads import build_payload_bytes
+
+from letsbuilda.pypi import JSONPackageMetadata, Package, PyPIServices, RSSPackageMetadata, RSSPackageRecord
+from letsbuilda.pypi.async_client import PyPIServices as AsyncPyPIServices
+from letsbuilda.pypi.feeds import iter_rss_items
+
+FIXTURES = Path(__file__).parent / "fixtures"
+SMALL_PAYLOAD = (FIXTURES / "letsbuilda-pypi.json").read_bytes()
+HUGE_PAYLOAD = build_payload_bytes("boto3", 2_000)
+RSS_FEED = (FIXTURES / "packages.xml").read_bytes()
+THROUGHPUT_REQUESTS = 200
+
+
+def replay_handler(request: httpx.Request) -> httpx.Response:
+    """Replay the fixtures: the huge payload for `boto3`, the small one for any other package."""
+    if request.url.path.startswith("/rss/"):
+        return httpx.Response(200, content=RSS_FEED, headers={"Content-Type": "text/xml"})
+    payload = HUGE_PAYLOAD if request.url.path.startswith("/pypi/boto3/") else SMALL_PAYLOAD
+    return httpx.Response(200, content=payload, headers={"Content-Type": "application/json"})
+
+
+def parse_rss_feed() -> list[RSSPackageMetadata]:
+    """Parse the recorded RSS feed."""
+    return [RSSPackageMetadata.model_validate(item) for item in iter_rss_items([RSS_FEED])]
+
+
+def parse_rss_feed_compact() -> list[RSSPackageRecord]:
+    """Parse the recorded RSS feed into compact records."""
+    return [RSSPackageRecord.from_rss_item(item) for item in iter_rss_items([RSS_FEED])]
+
+
+def sync_client_throughput() -> None:
+    """Fetch the small payload repeatedly with the sync client's batch API."""
+    with httpx.Client(transport=httpx.MockTransport(replay_handler)) as http_client:
+        pypi_client = PyPIServices(http_client)
+        for _ in pypi_client.get_many_json_metadata((f"package-{index}", None) for index in range(THROUGHPUT_REQUESTS)):
+            pass
+
+
+def async_client_throughput() -> None:
+    """Fetch the small payload repeatedly with the async client's batch API."""
+
+    async def fetch() -> None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(replay_handler)) as http_client:
+            pypi_client = AsyncPyPIServices(http_client)
+            async for _ in pypi_client.get_many_json_metadata(
+                (f"package-{index}", None) for index in range(THROUGHPUT_REQUESTS)
+            ):
+                pass
+
+    asyncio.run(fetch())
+
+
+def rss_client_throughput() -> None:
+    """Fetch and parse the RSS feed with the sync client."""
+    with httpx.Client(transport=httpx.MockTransport(replay_handler)) as http_client:
+        PyPIServices(http_client).get_rss_feed(PyPIServices.NEWEST_PACKAGES_FEED_URL)
+
+
+def cold_start(statement: str) -> Callable[[], object]:
+    """Build a benchmark of running a statement in a fresh interpreter, such as a short-lived job's imports."""
+    return partial(subprocess.run, [sys.executable, "-c", statement], check=True)
+
+
+BENCHMARKS: dict[str, Callable[[], object]] = {
+    "import_interpreter_baseline": cold_start("pass"),
+    # The floor of the client imports, which this package cannot go below
+    "import_dependencies": cold_start("import httpx, pydantic"),
+    "import_package": cold_start("import letsbuilda.pypi"),
+    "import_models": cold_start("from letsbuilda.pypi import JSONPackageMetadata, RSSPackageMetadata"),
+    "import_sync_client": cold_start("from letsbuilda.pypi import PyPIServices"),
+    "import_async_client": cold_start("from letsbuilda.pypi.async_client import PyPIServices"),
+    # Programs using the async client have already imported asyncio to run it
+    "import_async_client_after_asyncio": cold_start(
+        "import asyncio; from letsbuilda.pypi.async_client import PyPIServices",
+    ),
+    "json_model_validate_small": lambda: JSONPackageMetadata.model_validate(json.loads(SMALL_PAYLOAD)),
+    "json_model_validate_json_small": lambda: JSONPackageMetadata.model_validate_json(SMALL_PAYLOAD),
+    "json_model_validate_huge": lambda: JSONPackageMetadata.model_validate(json.loads(HUGE_PAYLOAD)),
+    "json_model_validate_json_huge": lambda: JSONPackageMetadata.model_validate_json(HUGE_PAYLOAD),
+    "package_from_json_api_small": lambda: Package.from_json_api(SMALL_PAYLOAD),
+    "package_from_json_api_huge": lambda: Package.from_json_api(HUGE_PAYLOAD),
+    "rss_parse_feed": parse_rss_feed,
+    "rss_parse_feed_compact": parse_rss_feed_compact,
+    "rss_client_get_rss_feed": rss_client_throughput,
+    f"sync_client_batch_{THROUGHPUT_REQUESTS}": sync_client_throughput,
+    f"async_client_batch_{THROUGHPUT_REQUESTS}": async_client_throughput,
+}
+
+
+def measure(function: Callable[[], object], min_time: float, repeat: int) -> dict[str, Any]:
+    """Time a function, calibrating the number of calls per round so each round takes about `min_time`."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed == 0 else max(2, min(10, int(min_time / elapsed) + 1))
+    rounds = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        rounds.append((time.perf_counter() - start) / number)
+    return {
+        "calls_per_round": number,
+        "rounds": len(rounds),
+        "min": min(rounds),
+        "median": statistics.median(rounds),
+        "mean": statistics.fmean(rounds),
+        "stdev": statistics.stdev(rounds) if len(rounds) > 1 else 0.0,
+    }
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any]) -> None:
+    """Print how each benchmark's median changed relative to a baseline."""
+    print(f"{'benchmark':<36} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, result in results["benchmarks"].items():
+        previous = baseline["benchmarks"].get(name)
+        if previous is None:
+            print(f"{name:<36} {'-':>12} {result['median'] * 1000:>10.3f}ms {'new':>8}")
+            continue
+        change = result["median"] / previous["median"] - 1
+        print(f"{name:<36} {previous['median'] * 1000:>10.3f}ms {result['median'] * 1000:>10.3f}ms {change:>+8.1%}")
+
+
+def main() -> None:
+    """Run the benchmarks selected on the command line."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", type=Path, help="write the results as JSON to this file")
+    parser.add_argument("--compare", type=Path, help="compare the results with those in this JSON file")
+    parser.add_argument("--filter", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--min-time", type=float, default=0.2, help="the minimum duration of a round, in seconds")
+    parser.add_argument("--repeat", type=int, default=5, help="the number of rounds")
+    arguments = parser.parse_args()
+
+    results: dict[str, Any] = {
+        "package_version": version("letsbuilda-pypi"),
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "benchmarks": {},
+    }
+    for name, function in BENCHMARKS.items():
+        if arguments.filter not in name:
+            continue
+        results["benchmarks"][name] = result = measure(function, arguments.min_time, arguments.repeat)
+        print(f"{name:<36} {result['median'] * 1000:>10.3f}ms median of {result['rounds']}", file=sys.stderr)
+
+    if arguments.output is not None:
+        arguments.output.write_text(json.dumps(results, indent=2) + "\n")
+    if arguments.compare is not None:
+        compare(results, json.loads(arguments.compare.read_text()))
+
+
+if __name__ == "__main__":
+    main()
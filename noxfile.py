@@ -39,6 +39,12 @@ def lints(session: nox.Session) -> None:
     session.run("mypy", "--strict", "src/")
 
 
+@nox.session
+def benchmarks(session: nox.Session) -> None:
+    """Run the offline benchmark suite, passing any extra arguments through."""
+    session.run("python", "benchmarks/run.py", *session.posargs)
+
+
 @nox.session
 def clean(_: nox.Session) -> None:
     """Clean cache, .pyc, .pyo, and test/build artifact files from project."""
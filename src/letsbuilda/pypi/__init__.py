@@ -1,13 +1,126 @@
 """A wrapper for PyPI's API and RSS feed."""
 
-from .exceptions import PackageNotFoundError
-from .models import JSONPackageMetadata, Package, RSSPackageMetadata
-from .sync_client import PyPIServices
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .async_concurrency import AsyncAdaptiveLimiter, AsyncBandwidthLimiter, CoalescingStatistics, SingleFlight
+    from .changelog import SerialCheckpoint
+    from .concurrency import AdaptiveLimiter, BandwidthLimiter
+    from .dependencies import AsyncDependencyCrawler, DependencyCrawler, DependencyGraph
+    from .exceptions import DigestMismatchError, PackageNotFoundError
+    from .exporters import NDJSONExporter, ParquetExporter
+    from .feeds import FeedState
+    from .http_cache import HTTPCache
+    from .instrumentation import Histogram, MetricsAggregator, ParseFinished, RequestFinished, RequestStarted
+    from .metadata_cache import CacheStatistics, MetadataCache
+    from .models import (
+        ChangelogEvent,
+        JSONPackageMetadata,
+        ModelOptions,
+        Package,
+        RSSPackageMetadata,
+        RSSPackageRecord,
+        SimpleFile,
+        SimpleProject,
+        project_model,
+    )
+    from .names import normalize_package_title
+    from .retries import RetryPolicy
+    from .store import MetadataStore
+    from .sync_client import PyPIServices
+
+# The module each public name is imported from when it is first used, so importing the package stays cheap
+_LAZY_IMPORTS = {
+    "AdaptiveLimiter": ".concurrency",
+    "AsyncAdaptiveLimiter": ".async_concurrency",
+    "AsyncBandwidthLimiter": ".async_concurrency",
+    "AsyncDependencyCrawler": ".dependencies",
+    "BandwidthLimiter": ".concurrency",
+    "CacheStatistics": ".metadata_cache",
+    "ChangelogEvent": ".models",
+    "CoalescingStatistics": ".async_concurrency",
+    "DependencyCrawler": ".dependencies",
+    "DependencyGraph": ".dependencies",
+    "DigestMismatchError": ".exceptions",
+    "FeedState": ".feeds",
+    "HTTPCache": ".http_cache",
+    "Histogram": ".instrumentation",
+    "JSONPackageMetadata": ".models",
+    "MetadataCache": ".metadata_cache",
+    "MetadataStore": ".store",
+    "MetricsAggregator": ".instrumentation",
+    "ModelOptions": ".models",
+    "NDJSONExporter": ".exporters",
+    "Package": ".models",
+    "PackageNotFoundError": ".exceptions",
+    "ParquetExporter": ".exporters",
+    "ParseFinished": ".instrumentation",
+    "PyPIServices": ".sync_client",
+    "RSSPackageMetadata": ".models",
+    "RSSPackageRecord": ".models",
+    "RequestFinished": ".instrumentation",
+    "RequestStarted": ".instrumentation",
+    "RetryPolicy": ".retries",
+    "SerialCheckpoint": ".changelog",
+    "SimpleFile": ".models",
+    "SimpleProject": ".models",
+    "SingleFlight": ".async_concurrency",
+    "normalize_package_title": ".names",
+    "project_model": ".models",
+}
 
 __all__ = [
+    "AdaptiveLimiter",
+    "AsyncAdaptiveLimiter",
+    "AsyncBandwidthLimiter",
+    "AsyncDependencyCrawler",
+    "BandwidthLimiter",
+    "CacheStatistics",
+    "ChangelogEvent",
+    "CoalescingStatistics",
+    "DependencyCrawler",
+    "DependencyGraph",
+    "DigestMismatchError",
+    "FeedState",
+    "HTTPCache",
+    "Histogram",
     "JSONPackageMetadata",
+    "MetadataCache",
+    "MetadataStore",
+    "MetricsAggregator",
+    "ModelOptions",
+    "NDJSONExporter",
     "Package",
     "PackageNotFoundError",
+    "ParquetExporter",
+    "ParseFinished",
     "PyPIServices",
     "RSSPackageMetadata",
+    "RSSPackageRecord",
+    "RequestFinished",
+    "RequestStarted",
+    "RetryPolicy",
+    "SerialCheckpoint",
+    "SimpleFile",
+    "SimpleProject",
+    "SingleFlight",
+    "normalize_package_title",
+    "project_model",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import a public name from its module when it is first used."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the package's attributes, including the public names not imported yet."""
+    return sorted({*globals(), *__all__})
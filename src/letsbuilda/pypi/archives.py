@@ -0,0 +1,345 @@
+"""Reading the core metadata and file lists of remote distribution archives, without downloading them."""
+
+import hashlib
+import io
+import tarfile
+import zlib
+from collections.abc import Callable, Iterator
+from typing import Final, Self, TypeVar
+from zipfile import ZipFile
+
+from httpx import Response
+
+from .exceptions import DigestMismatchError
+
+T = TypeVar("T")
+
+ZIP_SUFFIXES: Final[tuple[str, ...]] = (".whl", ".zip", ".egg")
+TAR_GZ_SUFFIXES: Final[tuple[str, ...]] = (".tar.gz", ".tgz")
+# Enough for the end of central directory record, its comment, and the central directory of most wheels
+ZIP_TAIL_SIZE: Final[int] = 64 * 1024
+MIN_RANGE_SIZE: Final[int] = 64 * 1024
+# Far more than any genuine core metadata, so that crafted archives cannot exhaust memory
+MAX_CORE_METADATA_SIZE: Final[int] = 16 * 1024 * 1024
+# The most decompressed data to buffer from each chunk of a gzipped tar archive, however well it compresses
+_DECOMPRESSION_CHUNK_SIZE: Final[int] = 256 * 1024
+
+
+class MissingRangeError(Exception):
+    """Raised by `SparseFile` when reading bytes which have not been fetched yet."""
+
+    def __init__(self: Self, start: int, end: int) -> None:
+        """Initialize the superclass with the appropriate information."""
+        self.start = start
+        self.end = end
+        super().__init__(f"Bytes {self.start} to {self.end} have not been fetched!")
+
+
+class SparseFile(io.RawIOBase):
+    """
+    A seekable, read-only file, of which only some ranges are known.
+
+    Reading anything else raises `MissingRangeError`, so that the caller can fetch the range,
+    add it, and try again. This lets `zipfile` read a remote archive with range requests.
+    """
+
+    def __init__(self: Self, size: int) -> None:
+        super().__init__()
+        self.size = size
+        self._position = 0
+        self._ranges: list[tuple[int, bytes]] = []
+
+    def add(self: Self, start: int, data: bytes) -> None:
+        """
+        Add a range of the file, merging it with any ranges it overlaps or touches.
+
+        Parameters
+        ----------
+        start
+            The offset of the range.
+        data
+            The bytes of the range.
+        """
+        end = start + len(data)
+        kept = []
+        for range_start, range_data in self._ranges:
+            range_end = range_start + len(range_data)
+            if range_end < start or range_start > end:
+                kept.append((range_start, range_data))
+                continue
+            if range_start < start:
+                data = range_data[: start - range_start] + data
+                start = range_start
+            if range_end > end:
+                data += range_data[end - range_start :]
+                end = range_end
+        kept.append((start, data))
+        self._ranges = sorted(kept)
+
+    def range_to_fetch(self: Self, error: MissingRangeError) -> tuple[int, int]:
+        """Get the range to fetch for a missing range, read ahead to at least `MIN_RANGE_SIZE` bytes."""
+        return error.start, min(self.size, max(error.end, error.start + MIN_RANGE_SIZE))
+
+    def readable(self: Self) -> bool:
+        """Whether the file is readable, which it is."""
+        return True
+
+    def seekable(self: Self) -> bool:
+        """Whether the file is seekable, which it is."""
+        return True
+
+    def tell(self: Self) -> int:
+        """Get the current position."""
+        return self._position
+
+    def seek(self: Self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Move to a position, relative to the start, the current position, or the end."""
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self.size
+        if offset < 0:
+            msg = f"Negative seek position {offset}"
+            raise OSError(msg)
+        self._position = offset
+        return self._position
+
+    def read(self: Self, size: int | None = -1) -> bytes:
+        """Read bytes from the current position, raising `MissingRangeError` if they have not been fetched."""
+        start = self._position
+        end = self.size if size is None or size < 0 else min(self.size, start + size)
+        if start >= end:
+            return b""
+        for range_start, range_data in self._ranges:
+            if range_start <= start and end <= range_start + len(range_data):
+                self._position = end
+                return range_data[start - range_start : end - range_start]
+        raise MissingRangeError(start, end)
+
+    def readinto(self: Self, buffer: memoryview) -> int:  # type: ignore[override]
+        """Read bytes into a buffer, raising `MissingRangeError` if they have not been fetched."""
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def parse_content_range(response: Response) -> tuple[int, int]:
+    """
+    Get the offset of a range response's body, and the size of the whole file.
+
+    Parameters
+    ----------
+    response
+        A response to a range request. Servers which ignore ranges respond with the whole file.
+
+    Returns
+    -------
+    tuple[int, int]
+        The offset and the size.
+    """
+    content_range = response.headers.get("Content-Range")
+    if content_range is None:
+        return 0, len(response.content)
+    byte_range, _, size = content_range.removeprefix("bytes ").partition("/")
+    if not size.isdigit():
+        msg = f"Content-Range {content_range!r} does not give the file's size"
+        raise ValueError(msg)
+    return int(byte_range.partition("-")[0]), int(size)
+
+
+def is_core_metadata_path(name: str) -> bool:
+    """Check whether a path in an archive is its core metadata: `*.dist-info/METADATA` or `*/PKG-INFO`."""
+    directory, _, filename = name.partition("/")
+    if "/" in filename:
+        return False
+    return (directory.endswith(".dist-info") and filename == "METADATA") or filename == "PKG-INFO"
+
+
+def read_zip(archive: SparseFile, operation: Callable[[ZipFile], T]) -> T:  # noqa: UP047 - type parameter syntax needs Python 3.12
+    """Open a zip archive and read from it, raising `MissingRangeError` for any range still to be fetched."""
+    with ZipFile(archive) as zip_file:
+        return operation(zip_file)
+
+
+def list_zip_files(zip_file: ZipFile) -> list[str]:
+    """List the paths of the files in a zip archive, from its central directory."""
+    return [info.filename for info in zip_file.infolist() if not info.is_dir()]
+
+
+def read_zip_core_metadata(zip_file: ZipFile) -> bytes | None:
+    """
+    Read the core metadata of a wheel or zipped sdist, if it has any.
+
+    `zipfile` never decompresses more than a member's declared size, which is checked first.
+
+    Raises
+    ------
+    ValueError
+        If the core metadata is larger than `MAX_CORE_METADATA_SIZE`.
+    """
+    for info in zip_file.infolist():
+        if is_core_metadata_path(info.filename):
+            if info.file_size > MAX_CORE_METADATA_SIZE:
+                msg = f"{info.filename} is {info.file_size} bytes, more than the limit of {MAX_CORE_METADATA_SIZE}"
+                raise ValueError(msg)
+            return zip_file.read(info)
+    return None
+
+
+def verify_core_metadata(filename: str, metadata: bytes, hashes: dict[str, str]) -> None:
+    """
+    Check a PEP 658 core metadata file against its published hashes.
+
+    Raises
+    ------
+    DigestMismatchError
+        If a hash does not match.
+
+    Parameters
+    ----------
+    filename
+        The name of the distribution the metadata is for.
+    metadata
+        The core metadata.
+    hashes
+        The hashes published with it, by algorithm. Unsupported algorithms are ignored.
+    """
+    for algorithm, expected in hashes.items():
+        if algorithm not in hashlib.algorithms_guaranteed:
+            continue
+        actual = hashlib.new(algorithm, metadata).hexdigest()
+        if actual != expected.lower():
+            metadata_filename = f"{filename}.metadata"
+            raise DigestMismatchError(metadata_filename, algorithm, expected, actual)
+
+
+class TarGzStreamParser:
+    """
+    An incremental parser of gzipped tar archives, which yields members as soon as they have been fed.
+
+    Only wanted members' contents are kept, so streaming an archive through it does not need
+    memory proportional to its size, and a scan can stop as soon as it has found what it needs.
+    Members larger than `max_member_size` are rejected before they are buffered, and each chunk
+    is decompressed a bounded amount at a time, so crafted archives cannot exhaust memory either.
+    """
+
+    def __init__(self: Self, want: Callable[[str], bool], max_member_size: int = MAX_CORE_METADATA_SIZE) -> None:
+        self._want = want
+        self.max_member_size = max_member_size
+        self._decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+        self._buffer = bytearray()
+        self._skip = 0
+        self._header: tarfile.TarInfo | None = None
+        self._long_name: str | None = None
+        self.finished = False
+
+    def feed(self: Self, data: bytes) -> Iterator[tuple[str, bytes | None]]:
+        """
+        Feed the next chunk of the archive to the parser.
+
+        Parameters
+        ----------
+        data
+            The next chunk of the compressed archive.
+
+        Raises
+        ------
+        ValueError
+            If a wanted member, or an extended header, is larger than `max_member_size`.
+
+        Yields
+        ------
+        tuple[str, bytes | None]
+            The path of each regular file completed by this chunk, and its contents if it is wanted.
+        """
+        while True:
+            self._buffer += self._decompressor.decompress(data, _DECOMPRESSION_CHUNK_SIZE)
+            yield from self._read_buffer()
+            data = self._decompressor.unconsumed_tail
+            if not data or self.finished:
+                return
+
+    def _read_buffer(self: Self) -> Iterator[tuple[str, bytes | None]]:
+        """Read as many headers and members as the buffer holds."""
+        while not self.finished:
+            if self._skip:
+                skipped = min(self._skip, len(self._buffer))
+                del self._buffer[:skipped]
+                self._skip -= skipped
+                if self._skip:
+                    return
+            elif self._header is None:
+                if len(self._buffer) < tarfile.BLOCKSIZE:
+                    return
+                yield from self._read_header()
+            else:
+                padded_size = _padded_size(self._header.size)
+                if len(self._buffer) < padded_size:
+                    return
+                contents = bytes(self._buffer[: self._header.size])
+                del self._buffer[:padded_size]
+                yield from self._read_contents(contents)
+
+    def _read_header(self: Self) -> Iterator[tuple[str, bytes | None]]:
+        """Read the next header, from the start of the buffer."""
+        block = bytes(self._buffer[: tarfile.BLOCKSIZE])
+        del self._buffer[: tarfile.BLOCKSIZE]
+        if not any(block):
+            # The end of the archive
+            self.finished = True
+            return
+        try:
+            header = tarfile.TarInfo.frombuf(block, "utf-8", "surrogateescape")
+        except tarfile.HeaderError as error:
+            raise tarfile.ReadError(str(error)) from error
+        if header.type in {tarfile.GNUTYPE_LONGNAME, tarfile.XHDTYPE}:
+            self._buffer_member(header)
+            return
+        name = header.name if self._long_name is None else self._long_name
+        self._long_name = None
+        header.name = name
+        if header.isreg() and self._want(name):
+            self._buffer_member(header)
+            return
+        if header.isreg():
+            yield name, None
+        self._skip = _padded_size(header.size)
+
+    def _buffer_member(self: Self, header: tarfile.TarInfo) -> None:
+        """Buffer the contents of a member, unless it is larger than `max_member_size`."""
+        if header.size > self.max_member_size:
+            msg = f"{header.name} is {header.size} bytes, more than the limit of {self.max_member_size}"
+            raise ValueError(msg)
+        self._header = header
+
+    def _read_contents(self: Self, contents: bytes) -> Iterator[tuple[str, bytes | None]]:
+        """Handle the contents of the member whose header was last read."""
+        header, self._header = self._header, None
+        if header is None:
+            return
+        if header.type == tarfile.GNUTYPE_LONGNAME:
+            self._long_name = contents.rstrip(b"\0").decode("utf-8", "surrogateescape")
+        elif header.type == tarfile.XHDTYPE:
+            self._long_name = _pax_path(contents) or self._long_name
+        else:
+            yield header.name, contents
+
+
+def _padded_size(size: int) -> int:
+    """Round a member's size up to whole blocks."""
+    return -(-size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+
+
+def _pax_path(records: bytes) -> str | None:
+    """Get the path from the `<length> <key>=<value>` records of a PAX extended header, if it has one."""
+    position = 0
+    while position < len(records):
+        length, _, _ = records[position:].partition(b" ")
+        if not length.isdigit() or int(length) == 0:
+            return None
+        record = records[position : position + int(length)]
+        position += int(length)
+        key, _, value = record.partition(b" ")[2].partition(b"=")
+        if key == b"path":
+            return value.removesuffix(b"\n").decode("utf-8", "surrogateescape")
+    return None
@@ -1,13 +1,62 @@
 """The async client."""
 
+import asyncio
+import time
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Collection, Iterable
+from contextlib import aclosing, asynccontextmanager
+from functools import partial
 from http import HTTPStatus
-from typing import Final, Self
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final, Literal, Self, TypeVar, overload
 
-import xmltodict
-from httpx import AsyncClient
+from httpx import AsyncClient, Limits, Response, Timeout, TransportError
+from pydantic import BaseModel
 
-from .exceptions import PackageNotFoundError
-from .models import JSONPackageMetadata, Package, RSSPackageMetadata
+from .async_concurrency import SingleFlight
+from .exceptions import DigestMismatchError, PackageNotFoundError
+from .instrumentation import (
+    Instrument,
+    ParseFinished,
+    RequestFinished,
+    RequestStarted,
+    StreamTimer,
+    emit,
+    timed_parse,
+)
+from .models import (
+    JSONPackageMetadata,
+    Package,
+    RSSPackageMetadata,
+    RSSPackageRecord,
+    SimpleFile,
+    SimpleProject,
+    project_model,
+)
+from .models.models_json import URL
+from .models.models_package import Distribution
+from .names import normalize_package_title
+from .retries import THROTTLING_STATUSES, RetryPolicy
+
+# The optional features' modules are imported when they are first used, so importing the client stays cheap
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from zipfile import ZipFile
+
+    from .async_concurrency import AsyncAdaptiveLimiter, AsyncBandwidthLimiter
+    from .changelog import SerialCheckpoint
+    from .downloads import StreamingDigests
+    from .feeds import FeedState
+    from .http_cache import HTTPCache
+    from .metadata_cache import MetadataCache
+    from .models import ChangelogEvent
+    from .models.models_interning import ModelOptions
+    from .store import MetadataStore
+
+T = TypeVar("T")
+
+# Responses this large take long enough to parse to stall other requests noticeably
+PARSE_OFFLOAD_THRESHOLD: Final[int] = 256 * 1024
 
 
 class PyPIServices:
@@ -15,35 +64,485 @@ class PyPIServices:
 
     NEWEST_PACKAGES_FEED_URL: Final[str] = "https://pypi.org/rss/packages.xml"
     PACKAGE_UPDATES_FEED_URL: Final[str] = "https://pypi.org/rss/updates.xml"
+    XMLRPC_URL: Final[str] = "https://pypi.org/pypi"
+    SIMPLE_API_URL: Final[str] = "https://pypi.org/simple/"
+    SIMPLE_API_CONTENT_TYPE: Final[str] = "application/vnd.pypi.simple.v1+json"
 
-    def __init__(self: Self, http_client: AsyncClient) -> None:
+    def __init__(  # noqa: PLR0913 - optional features are configured by keyword
+        self: Self,
+        http_client: AsyncClient,
+        *,
+        http_cache: "HTTPCache | None" = None,
+        metadata_cache: "MetadataCache | None" = None,
+        metadata_store: "MetadataStore | None" = None,
+        retry_policy: RetryPolicy | None = None,
+        concurrency_limiter: "AsyncAdaptiveLimiter | None" = None,
+        instruments: Iterable[Instrument] = (),
+        model_options: "ModelOptions | None" = None,
+        parse_executor: "Executor | None" = None,
+        parse_offload_threshold: int = PARSE_OFFLOAD_THRESHOLD,
+    ) -> None:
         self.http_client = http_client
+        self.http_cache = http_cache
+        self.metadata_cache = metadata_cache
+        self.metadata_store = metadata_store
+        self.retry_policy = retry_policy
+        self.concurrency_limiter = concurrency_limiter
+        self.instruments = tuple(instruments)
+        self.model_options = model_options
+        # Not owned by the client, so not shut down along with it
+        self.parse_executor = parse_executor
+        self.parse_offload_threshold = parse_offload_threshold
+        self._owns_http_client = False
+        self.single_flight: SingleFlight[JSONPackageMetadata | BaseModel] = SingleFlight()
+
+    @classmethod
+    def create(
+        cls: type[Self],
+        *,
+        http2: bool | None = None,
+        limits: Limits | None = None,
+        timeout: Timeout | None = None,
+        **options: Any,  # noqa: ANN401 - passed through to the constructor
+    ) -> Self:
+        """
+        Create a client with its own HTTP client, tuned for PyPI, which is closed along with it.
+
+        The HTTP client multiplexes requests over HTTP/2 when `h2` is installed (the `http2` extra),
+        keeps connections alive between requests, accepts compressed responses and follows redirects.
+        Use the client as a context manager so that its connections are closed.
+
+        Parameters
+        ----------
+        http2
+            Whether to use HTTP/2. By default, when `h2` is installed.
+        limits
+            The connection pool limits. `http_clients.DEFAULT_LIMITS` by default.
+        timeout
+            The timeouts. `http_clients.DEFAULT_TIMEOUT` by default.
+        **options
+            The other options of the constructor, such as `metadata_cache`.
+
+        Returns
+        -------
+        PyPIServices
+            The client.
+
+        Examples
+        --------
+        >>> async with PyPIServices.create(metadata_cache=MetadataCache()) as pypi_client:
+        ...     metadata = await pypi_client.get_package_json_metadata("letsbuilda-pypi")
+        """
+        from .http_clients import http_client_options  # noqa: PLC0415 - imported on first use
+
+        pypi_client = cls(AsyncClient(**http_client_options(http2=http2, limits=limits, timeout=timeout)), **options)
+        pypi_client._owns_http_client = True
+        return pypi_client
+
+    async def __aenter__(self: Self) -> Self:
+        """Use the client as an async context manager that closes it on exit."""
+        return self
+
+    async def __aexit__(self: Self, *_: object) -> None:
+        """Close the client."""
+        await self.aclose()
+
+    async def aclose(self: Self) -> None:
+        """Close the HTTP client's connections, if it was created by `create`, rather than passed in."""
+        if self._owns_http_client:
+            await self.http_client.aclose()
+
+    async def _send_once(self: Self, method: str, url: str, **kwargs: Any) -> Response:  # noqa: ANN401 - passed through to httpx
+        """Send a request within the concurrency limit, if any, recording whether it was throttled."""
+        if self.concurrency_limiter is not None:
+            await self.concurrency_limiter.acquire()
+        if self.instruments:
+            emit(self.instruments, RequestStarted(method, url))
+        start = time.perf_counter()
+        response = None
+        try:
+            response = await self.http_client.request(method, url, **kwargs)
+        finally:
+            if self.concurrency_limiter is not None:
+                await self.concurrency_limiter.release(
+                    throttled=response is None or response.status_code in THROTTLING_STATUSES,
+                )
+            if self.instruments:
+                emit(
+                    self.instruments,
+                    RequestFinished(
+                        method,
+                        url,
+                        None if response is None else response.status_code,
+                        0 if response is None else response.num_bytes_downloaded or len(response.content),
+                        time.perf_counter() - start,
+                    ),
+                )
+        return response
+
+    async def _send(self: Self, method: str, url: str, **kwargs: Any) -> Response:  # noqa: ANN401 - passed through to httpx
+        """Send a request, retrying according to the retry policy, if any."""
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await self._send_once(method, url, **kwargs)
+            except TransportError:
+                if self.retry_policy is None or not self.retry_policy.should_retry(attempt, None):
+                    raise
+                await asyncio.sleep(self.retry_policy.delay(attempt, None))
+                continue
+            if self.retry_policy is None or not self.retry_policy.should_retry(attempt, response):
+                return response
+            await asyncio.sleep(self.retry_policy.delay(attempt, response))
+
+    async def _get(self: Self, url: str, headers: dict[str, str] | None = None) -> Response:
+        """
+        Send a GET request, revalidating against the HTTP cache when there is one.
+
+        The cache is read and written in a worker thread, so that its disk I/O does not block the event loop.
+        """
+        if self.http_cache is None:
+            return await self._send("GET", url, headers=headers)
+        conditional_headers = await asyncio.to_thread(self.http_cache.conditional_headers, url)
+        response = await self._send("GET", url, headers={**(headers or {}), **conditional_headers})
+        if response.status_code == HTTPStatus.NOT_MODIFIED:
+            cached_response = await asyncio.to_thread(self.http_cache.load, url)
+            if cached_response is not None:
+                cached_response.request = response.request
+                return cached_response
+            # The entry was evicted between building the headers and loading it
+            response = await self._send("GET", url, headers=headers)
+        if response.status_code == HTTPStatus.OK:
+            await asyncio.to_thread(self.http_cache.store, url, response)
+        return response
+
+    async def _open_stream(
+        self: Self,
+        url: str,
+        model: str,
+        headers: dict[str, str] | None,
+    ) -> tuple[Response, StreamTimer]:
+        """Open a streamed GET request within the concurrency limit, if any, which is held until it is closed."""
+        if self.concurrency_limiter is not None:
+            await self.concurrency_limiter.acquire()
+        if self.instruments:
+            emit(self.instruments, RequestStarted("GET", url))
+        timer = StreamTimer()
+        start = time.perf_counter()
+        try:
+            response = await self.http_client.send(
+                self.http_client.build_request("GET", url, headers=headers),
+                stream=True,
+            )
+        except BaseException:
+            timer.network_time = time.perf_counter() - start
+            await self._close_stream(url, model, None, timer)
+            raise
+        timer.network_time += time.perf_counter() - start
+        return response, timer
+
+    async def _close_stream(self: Self, url: str, model: str, response: Response | None, timer: StreamTimer) -> None:
+        """Close a streamed response, releasing the concurrency limit and recording whether it was throttled."""
+        try:
+            if response is not None:
+                await response.aclose()
+        finally:
+            if self.concurrency_limiter is not None:
+                await self.concurrency_limiter.release(
+                    throttled=response is None or response.status_code in THROTTLING_STATUSES,
+                )
+            if self.instruments:
+                timer.report(self.instruments, url, model, response)
+
+    @asynccontextmanager
+    async def _stream(
+        self: Self,
+        url: str,
+        model: str,
+        headers: dict[str, str] | None = None,
+        *,
+        retry: bool = True,
+    ) -> AsyncIterator[tuple[Response, StreamTimer]]:
+        """
+        Stream a GET request, reporting the time spent on the network and parsing once the response closes.
+
+        Like `_send`, the request is sent within the concurrency limit and retried according to the retry policy,
+        before any of the response is read. Callers which resume failed streams themselves pass `retry=False`.
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response, timer = await self._open_stream(url, model, headers)
+            except TransportError:
+                if not retry or self.retry_policy is None or not self.retry_policy.should_retry(attempt, None):
+                    raise
+                await asyncio.sleep(self.retry_policy.delay(attempt, None))
+                continue
+            if not retry or self.retry_policy is None or not self.retry_policy.should_retry(attempt, response):
+                break
+            await self._close_stream(url, model, response, timer)
+            await asyncio.sleep(self.retry_policy.delay(attempt, response))
+        try:
+            yield response, timer
+        finally:
+            await self._close_stream(url, model, response, timer)
+
+    @overload
+    def iter_rss_feed(
+        self: Self,
+        feed_url: str,
+        *,
+        compact: Literal[False] = False,
+    ) -> AsyncIterator[RSSPackageMetadata]: ...
+
+    @overload
+    def iter_rss_feed(self: Self, feed_url: str, *, compact: Literal[True]) -> AsyncIterator[RSSPackageRecord]: ...
+
+    async def iter_rss_feed(
+        self: Self,
+        feed_url: str,
+        *,
+        compact: bool = False,
+    ) -> AsyncIterator[RSSPackageMetadata | RSSPackageRecord]:
+        """
+        Stream the entries of an RSS feed, parsing the response incrementally as it arrives.
+
+        Parameters
+        ----------
+        feed_url
+            The URL of the RSS feed.
+        compact
+            Whether to yield compact `RSSPackageRecord` objects, without descriptions, instead of models.
+
+        Yields
+        ------
+        RSSPackageMetadata | RSSPackageRecord
+            Each entry, in feed order.
+        """
+        from .feeds import aiter_rss_items  # noqa: PLC0415 - imported on first use
+
+        build_entry: Callable[[dict[str, str | None]], RSSPackageMetadata | RSSPackageRecord] = (
+            RSSPackageRecord.from_rss_item if compact else RSSPackageMetadata.model_validate
+        )
+        async with self._stream(
+            feed_url,
+            RSSPackageRecord.__name__ if compact else RSSPackageMetadata.__name__,
+        ) as (response, timer):
+            response.raise_for_status()
+            async with aclosing(
+                timer.aiter_items(aiter_rss_items(timer.aiter_chunks(response.aiter_bytes()))),
+            ) as items:
+                async for item in items:
+                    yield timer.time_validation(partial(build_entry, item))
+
+    @staticmethod
+    def _json_api_url(package_title: str, package_version: str | None) -> str:
+        """Get the JSON API URL for a package."""
+        if package_version is not None:
+            return f"https://pypi.org/pypi/{package_title}/{package_version}/json"
+        return f"https://pypi.org/pypi/{package_title}/json"
+
+    def _shares_metadata(self: Self, fields: Collection[str] | None) -> bool:
+        """
+        Whether metadata is read from and written to the metadata cache and store, which other clients may share.
+
+        Partial models, and models validated with model options, such as without their description, are not shared.
+        """
+        return fields is None and self.model_options is None
+
+    def _json_metadata_parser(self: Self) -> Callable[[bytes], JSONPackageMetadata]:
+        """Get the parser of JSON API responses, which validates them with the client's model options."""
+        if self.model_options is None:
+            return JSONPackageMetadata.model_validate_json
+        return partial(JSONPackageMetadata.model_validate_json, context=self.model_options)
+
+    async def _parse(
+        self: Self,
+        response: Response,
+        model: str,
+        parse: Callable[[bytes], T],
+        *,
+        offload: bool = True,
+    ) -> T:
+        """
+        Parse a response's body, reporting the time taken to the instruments.
+
+        Bodies of at least `parse_offload_threshold` bytes are parsed in `parse_executor`, if there is one,
+        so that the event loop keeps serving other requests meanwhile. For a process pool, `parse` must be
+        picklable, as the models' own methods and the module-level parsers are.
+        """
+        content = response.content
+        if not offload or self.parse_executor is None or len(content) < self.parse_offload_threshold:
+            return timed_parse(self.instruments, str(response.url), model, len(content), lambda: parse(content))
+        start = time.perf_counter()
+        result = await asyncio.get_running_loop().run_in_executor(self.parse_executor, parse, content)
+        elapsed = time.perf_counter() - start
+        emit(self.instruments, ParseFinished(str(response.url), model, "decode_and_validate", len(content), elapsed))
+        return result
+
+    async def _get_json_api_response(self: Self, package_title: str, package_version: str | None) -> Response:
+        """Get the JSON API response for a package, raising `PackageNotFoundError` if there is none."""
+        response = await self._get(self._json_api_url(package_title, package_version))
+        if response.status_code == HTTPStatus.NOT_FOUND:
+            raise PackageNotFoundError(package_title, package_version)
+        response.raise_for_status()
+        return response
+
+    @overload
+    async def get_rss_feed(
+        self: Self,
+        feed_url: str,
+        *,
+        compact: Literal[False] = False,
+    ) -> list[RSSPackageMetadata]: ...
+
+    @overload
+    async def get_rss_feed(self: Self, feed_url: str, *, compact: Literal[True]) -> list[RSSPackageRecord]: ...
 
-    async def get_rss_feed(self: Self, feed_url: str) -> list[RSSPackageMetadata]:
+    async def get_rss_feed(
+        self: Self,
+        feed_url: str,
+        *,
+        compact: bool = False,
+    ) -> list[RSSPackageMetadata] | list[RSSPackageRecord]:
         """Get the new packages RSS feed.
 
         Parameters
         ----------
         feed_url
             The URL of the RSS feed.
+        compact
+            Whether to return compact `RSSPackageRecord` objects, without descriptions, instead of models.
+            They use a fraction of the memory, which matters when buffering many entries.
 
         Returns
         -------
-        list[RSSPackageMetadata]
+        list[RSSPackageMetadata] | list[RSSPackageRecord]
             The list of new packages.
         """
-        response = await self.http_client.get(feed_url)
-        rss_data = xmltodict.parse(response.text)["rss"]["channel"]["item"]
-        return [RSSPackageMetadata.model_validate(package_data) for package_data in rss_data]
+        from .feeds import aiter_rss_items, parse_rss_items  # noqa: PLC0415 - imported on first use
+
+        if compact:
+            return [record async for record in self.iter_rss_feed(feed_url, compact=True)]
+        async with self._stream(feed_url, RSSPackageMetadata.__name__) as (response, timer):
+            response.raise_for_status()
+            items = [
+                item async for item in timer.aiter_items(aiter_rss_items(timer.aiter_chunks(response.aiter_bytes())))
+            ]
+            return timer.time_validation(partial(parse_rss_items, items))
+
+    async def get_new_rss_entries(self: Self, feed_url: str, feed_state: "FeedState") -> list[RSSPackageMetadata]:
+        """
+        Get the entries of an RSS feed that have not been seen before.
+
+        The feed is requested conditionally, and the response is parsed incrementally,
+        stopping at the first entry already seen.
+
+        Parameters
+        ----------
+        feed_url
+            The URL of the RSS feed.
+        feed_state
+            What has already been seen of the feed. Updated with the new entries.
+
+        Returns
+        -------
+        list[RSSPackageMetadata]
+            The new entries, oldest first.
+        """
+        from .feeds import aiter_rss_items, parse_rss_items, rss_item_key  # noqa: PLC0415 - imported on first use
+
+        async with self._stream(
+            feed_url,
+            RSSPackageMetadata.__name__,
+            headers=feed_state.conditional_headers(),
+        ) as (response, timer):
+            if response.status_code == HTTPStatus.NOT_MODIFIED:
+                return []
+            response.raise_for_status()
+            new_keys = []
+            new_items = []
+            async with aclosing(
+                timer.aiter_items(aiter_rss_items(timer.aiter_chunks(response.aiter_bytes()))),
+            ) as items:
+                async for item in items:
+                    key = rss_item_key(item)
+                    if feed_state.has_seen(key):
+                        break
+                    new_keys.append(key)
+                    new_items.append(item)
+            new_packages = timer.time_validation(partial(parse_rss_items, new_items))
+        # Only once every new entry has been parsed, so that a failed poll is repeated rather than revalidated
+        feed_state.mark_all_seen(new_keys)
+        feed_state.update_validators(response)
+        new_packages.reverse()
+        return new_packages
+
+    async def poll_rss_feed(
+        self: Self,
+        feed_url: str,
+        *,
+        interval: float = 5.0,
+        feed_state: "FeedState | None" = None,
+    ) -> AsyncIterator[RSSPackageMetadata]:
+        """
+        Poll an RSS feed forever, yielding only entries that have not been seen before.
+
+        Parameters
+        ----------
+        feed_url
+            The URL of the RSS feed.
+        interval
+            The number of seconds to wait between polls.
+        feed_state
+            What has already been seen of the feed, to resume polling. A new state is used by default.
+
+        Yields
+        ------
+        RSSPackageMetadata
+            Each new entry, oldest first.
+        """
+        from .feeds import FeedState  # noqa: PLC0415 - imported on first use
+
+        if feed_state is None:
+            feed_state = FeedState()
+        while True:
+            for package in await self.get_new_rss_entries(feed_url, feed_state):
+                yield package
+            await asyncio.sleep(interval)
+
+    @overload
+    async def get_package_json_metadata(
+        self: Self,
+        package_title: str,
+        package_version: str | None = None,
+        *,
+        fields: None = None,
+    ) -> JSONPackageMetadata: ...
 
+    @overload
     async def get_package_json_metadata(
         self: Self,
         package_title: str,
         package_version: str | None = None,
-    ) -> JSONPackageMetadata:
+        *,
+        fields: Collection[str],
+    ) -> BaseModel: ...
+
+    async def get_package_json_metadata(
+        self: Self,
+        package_title: str,
+        package_version: str | None = None,
+        *,
+        fields: Collection[str] | None = None,
+    ) -> JSONPackageMetadata | BaseModel:
         """
         Retrieve metadata for a package.
 
+        Concurrent calls for the same package share a single request, counted by `single_flight.statistics`.
+
         Raises
         ------
         PackageNotFoundError
@@ -55,20 +554,244 @@ class PyPIServices:
             The title of the package.
         package_version
             The version of the package.
+        fields
+            Dotted paths of the only fields to validate and keep, such as `{"info.name", "urls.digests"}`.
+            See `project_model`. The metadata cache and store are bypassed for partial models,
+            and when the client has model options.
 
         Returns
         -------
-        JSONPackageMetadata
-            The metadata for the package.
+        JSONPackageMetadata | BaseModel
+            The metadata for the package, or a partial model of it if `fields` is given.
         """
-        if package_version is not None:
-            url = f"https://pypi.org/pypi/{package_title}/{package_version}/json"
-        else:
-            url = f"https://pypi.org/pypi/{package_title}/json"
-        response = await self.http_client.get(url)
+        shares_metadata = self._shares_metadata(fields)
+        if self.metadata_cache is not None and shares_metadata:
+            cached_metadata = self.metadata_cache.get(package_title, package_version)
+            if cached_metadata is not None:
+                return cached_metadata
+        if self.metadata_store is not None and shares_metadata:
+            # Only the latest version goes stale, as a new one can be released at any time
+            stored_metadata = await asyncio.to_thread(
+                self.metadata_store.get,
+                package_title,
+                max_age=self.metadata_store.max_age if package_version is None else None,
+            )
+            if stored_metadata is not None and package_version in {None, stored_metadata.info.version}:
+                return stored_metadata
+        return await self.single_flight.run(
+            (self._json_api_url(package_title, package_version), None if fields is None else frozenset(fields)),
+            lambda: self._fetch_package_json_metadata(package_title, package_version, fields),
+        )
+
+    async def _fetch_package_json_metadata(
+        self: Self,
+        package_title: str,
+        package_version: str | None,
+        fields: Collection[str] | None,
+    ) -> JSONPackageMetadata | BaseModel:
+        """Fetch and parse the metadata for a package, without checking the metadata cache or store first."""
+        shares_metadata = self._shares_metadata(fields)
+        response = await self._get_json_api_response(package_title, package_version)
+        if fields is not None:
+            projection = project_model(JSONPackageMetadata, fields)
+            # Projections are built at runtime, so cannot be pickled for a process pool
+            return await self._parse(response, projection.__name__, projection.model_validate_json, offload=False)
+        metadata = None
+        if self.metadata_cache is not None and shares_metadata and "X-PyPI-Last-Serial" in response.headers:
+            metadata = self.metadata_cache.revalidate(
+                package_title,
+                package_version,
+                int(response.headers["X-PyPI-Last-Serial"]),
+            )
+        if metadata is None:
+            metadata = await self._parse(
+                response,
+                JSONPackageMetadata.__name__,
+                self._json_metadata_parser(),
+            )
+            if self.metadata_cache is not None and shares_metadata:
+                self.metadata_cache.put(package_title, package_version, metadata)
+        if self.metadata_store is not None and shares_metadata and package_version is None:
+            await asyncio.to_thread(self.metadata_store.upsert, metadata)
+        return metadata
+
+    async def _get_package_json_metadata_or_error(
+        self: Self,
+        package_title: str,
+        package_version: str | None,
+    ) -> tuple[str, str | None, JSONPackageMetadata | PackageNotFoundError]:
+        """Retrieve metadata for a package, returning a `PackageNotFoundError` instead of raising it."""
+        try:
+            return package_title, package_version, await self.get_package_json_metadata(package_title, package_version)
+        except PackageNotFoundError as error:
+            return package_title, package_version, error
+
+    async def get_many_json_metadata(
+        self: Self,
+        packages: Iterable[tuple[str, str | None]],
+        *,
+        max_concurrency: int = 10,
+    ) -> AsyncIterator[tuple[str, str | None, JSONPackageMetadata | PackageNotFoundError]]:
+        """
+        Retrieve metadata for many packages concurrently.
+
+        Results are yielded as soon as they complete, which is not necessarily the input order.
+        At most `max_concurrency` requests are in flight at once, and `packages` is consumed lazily,
+        so it may be an arbitrarily long iterator.
+        With a `concurrency_limiter`, the number of requests in flight also adapts to throttling.
+
+        Parameters
+        ----------
+        packages
+            The `(title, version)` pairs to retrieve. `version` may be `None` for the latest release.
+        max_concurrency
+            The maximum number of requests in flight at once.
+
+        Yields
+        ------
+        tuple[str, str | None, JSONPackageMetadata | PackageNotFoundError]
+            The title, the version, and either the metadata or the error raised for that package.
+        """
+        if max_concurrency < 1:
+            msg = "max_concurrency must be at least 1"
+            raise ValueError(msg)
+        pending_packages = iter(packages)
+        in_flight: set[asyncio.Task[tuple[str, str | None, JSONPackageMetadata | PackageNotFoundError]]] = set()
+        try:
+            while True:
+                for package_title, package_version in islice(pending_packages, max_concurrency - len(in_flight)):
+                    in_flight.add(
+                        asyncio.create_task(self._get_package_json_metadata_or_error(package_title, package_version)),
+                    )
+                if not in_flight:
+                    return
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    async def get_simple_project(self: Self, package_title: str) -> SimpleProject:
+        """
+        List the files of a package with the Simple Repository API (PEP 691).
+
+        This is much smaller and cheaper than the JSON API when only filenames, URLs and hashes are needed.
+
+        Raises
+        ------
+        PackageNotFoundError
+            If the package is not found.
+
+        Parameters
+        ----------
+        package_title
+            The title of the package.
+
+        Returns
+        -------
+        SimpleProject
+            The files of every release of the package.
+        """
+        url = f"{self.SIMPLE_API_URL}{normalize_package_title(package_title)}/"
+        response = await self._get(url, headers={"Accept": self.SIMPLE_API_CONTENT_TYPE})
         if response.status_code == HTTPStatus.NOT_FOUND:
-            raise PackageNotFoundError(package_title, package_version)
-        return JSONPackageMetadata.model_validate(response.json())
+            raise PackageNotFoundError(package_title, None)
+        response.raise_for_status()
+        return await self._parse(response, SimpleProject.__name__, SimpleProject.model_validate_json)
+
+    async def _call_xmlrpc(self: Self, request: bytes, model: str, parse: Callable[[bytes], T]) -> T:
+        """Send an XML-RPC request to PyPI, and parse the response."""
+        response = await self._send("POST", self.XMLRPC_URL, content=request, headers={"Content-Type": "text/xml"})
+        response.raise_for_status()
+        return await self._parse(response, model, parse)
+
+    async def get_last_serial(self: Self) -> int:
+        """
+        Get the serial of the latest event in PyPI's changelog.
+
+        Returns
+        -------
+        int
+            The serial.
+        """
+        from .changelog import build_last_serial_request, parse_last_serial_response  # noqa: PLC0415 - imported on first use
+
+        return await self._call_xmlrpc(build_last_serial_request(), int.__name__, parse_last_serial_response)
+
+    async def get_changelog_since_serial(self: Self, serial: int) -> "list[ChangelogEvent]":
+        """
+        Get the events in PyPI's changelog after a serial.
+
+        Parameters
+        ----------
+        serial
+            The serial of the last event already processed.
+
+        Returns
+        -------
+        list[ChangelogEvent]
+            The events, in serial order.
+        """
+        from .changelog import build_changelog_request, parse_changelog_response  # noqa: PLC0415 - imported on first use
+        from .models import ChangelogEvent  # noqa: PLC0415 - imported on first use
+
+        return await self._call_xmlrpc(
+            build_changelog_request(serial),
+            ChangelogEvent.__name__,
+            parse_changelog_response,
+        )
+
+    async def sync_changed_packages(
+        self: Self,
+        checkpoint: "SerialCheckpoint",
+        *,
+        max_concurrency: int = 10,
+    ) -> AsyncIterator[tuple[str, JSONPackageMetadata | PackageNotFoundError]]:
+        """
+        Fetch the metadata of every package changed since the checkpoint, then advance the checkpoint.
+
+        Each changed package is fetched once, however many events it has. Removed packages are reported
+        as `PackageNotFoundError`. The checkpoint is only saved once every package has been yielded,
+        so an interrupted sync is repeated in full. A checkpoint that has never been saved is
+        initialized to the current serial, without fetching anything.
+
+        Parameters
+        ----------
+        checkpoint
+            The serial of the last event processed.
+        max_concurrency
+            The maximum number of requests in flight at once.
+
+        Yields
+        ------
+        tuple[str, JSONPackageMetadata | PackageNotFoundError]
+            The title and either the metadata or the error raised for each changed package.
+        """
+        from .changelog import changed_package_titles  # noqa: PLC0415 - imported on first use
+
+        serial = checkpoint.load()
+        if serial is None:
+            checkpoint.save(await self.get_last_serial())
+            return
+        events = await self.get_changelog_since_serial(serial)
+        if not events:
+            return
+        package_titles = changed_package_titles(events)
+        if self.metadata_cache is not None:
+            for event in events:
+                self.metadata_cache.invalidate(event.package_title, event.serial)
+        if self.metadata_store is not None:
+            await asyncio.to_thread(
+                self.metadata_store.invalidate_many,
+                [(event.package_title, event.serial) for event in events],
+            )
+        async for package_title, _, result in self.get_many_json_metadata(
+            ((package_title, None) for package_title in package_titles),
+            max_concurrency=max_concurrency,
+        ):
+            yield package_title, result
+        checkpoint.save(events[-1].serial)
 
     async def get_package_metadata(
         self: Self,
@@ -77,6 +800,13 @@ class PyPIServices:
     ) -> Package:
         """Create a `Package` object from its metadata.
 
+        The package is built in a single pass over the JSON API response, keeping only the fields it needs.
+
+        Raises
+        ------
+        PackageNotFoundError
+            If the package is not found.
+
         Parameters
         ----------
         package_title
@@ -89,6 +819,361 @@ class PyPIServices:
         Package
             The package object.
         """
-        return Package.model_validate(
-            (await self.get_package_json_metadata(package_title, package_version)).model_dump(),
+        response = await self._get_json_api_response(package_title, package_version)
+        return await self._parse(response, Package.__name__, Package.from_json_api)
+
+    async def _download_once(
+        self: Self,
+        url: URL,
+        write: Callable[[bytes], object],
+        digests: "StreamingDigests",
+        bandwidth_limiter: "AsyncBandwidthLimiter | None",
+        chunk_size: int,
+    ) -> Response | None:
+        """Stream the rest of a file, from `digests.size` on, returning the response if it failed."""
+        headers = {"Range": f"bytes={digests.size}-"} if digests.size else None
+        async with self._stream(url.url, URL.__name__, headers=headers, retry=False) as (response, timer):
+            if response.status_code == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE and digests.size == url.size:
+                return None
+            if response.is_error:
+                return response
+            # Servers ignoring the range send the whole file, so skip what was already written
+            skip = 0 if response.status_code == HTTPStatus.PARTIAL_CONTENT else digests.size
+            async with aclosing(timer.aiter_chunks(response.aiter_bytes(chunk_size))) as chunks:
+                async for chunk in chunks:
+                    if bandwidth_limiter is not None:
+                        await bandwidth_limiter.consume(len(chunk))
+                    data = chunk[skip:] if skip else chunk
+                    skip = max(0, skip - len(chunk))
+                    if data:
+                        write(data)
+                        digests.update(data)
+        return None
+
+    async def _download(
+        self: Self,
+        url: URL,
+        write: Callable[[bytes], object],
+        digests: "StreamingDigests",
+        bandwidth_limiter: "AsyncBandwidthLimiter | None",
+        chunk_size: int,
+    ) -> None:
+        """Stream a file, resuming it with a range request for each retry according to the retry policy."""
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await self._download_once(url, write, digests, bandwidth_limiter, chunk_size)
+            except TransportError:
+                if self.retry_policy is None or not self.retry_policy.should_retry(attempt, None):
+                    raise
+                await asyncio.sleep(self.retry_policy.delay(attempt, None))
+                continue
+            if response is None:
+                return
+            if self.retry_policy is None or not self.retry_policy.should_retry(attempt, response):
+                response.raise_for_status()
+                return
+            await asyncio.sleep(self.retry_policy.delay(attempt, response))
+
+    async def download(
+        self: Self,
+        url: URL,
+        write: Callable[[bytes], object],
+        *,
+        bandwidth_limiter: "AsyncBandwidthLimiter | None" = None,
+        chunk_size: int | None = None,
+    ) -> None:
+        """
+        Stream a distribution file into a sink, verifying its digests.
+
+        The file is never held in memory. Failed transfers are retried according to the retry policy,
+        resuming from the last byte received.
+
+        Raises
+        ------
+        DigestMismatchError
+            If the file does not match its SHA-256 or BLAKE2b-256 digest. It has been written to the sink regardless.
+
+        Parameters
+        ----------
+        url
+            The file's entry in the JSON API, such as one of `JSONPackageMetadata.urls`.
+        write
+            Called with each chunk of the file, in order, such as a binary file's `write`.
+        bandwidth_limiter
+            A bandwidth cap, which may be shared between downloads.
+        chunk_size
+            The number of bytes to read at once. `downloads.DOWNLOAD_CHUNK_SIZE` by default.
+        """
+        from .downloads import DOWNLOAD_CHUNK_SIZE, StreamingDigests  # noqa: PLC0415 - imported on first use
+
+        if chunk_size is None:
+            chunk_size = DOWNLOAD_CHUNK_SIZE
+        digests = StreamingDigests()
+        await self._download(url, write, digests, bandwidth_limiter, chunk_size)
+        digests.verify(url)
+
+    async def download_file(
+        self: Self,
+        url: URL,
+        directory: str | Path,
+        *,
+        bandwidth_limiter: "AsyncBandwidthLimiter | None" = None,
+        chunk_size: int | None = None,
+    ) -> Path:
+        """
+        Download a distribution file into a directory, verifying its digests.
+
+        The file is written to a `.part` file, which is only renamed once it has been verified.
+        A `.part` file left by an interrupted download is resumed with a range request.
+
+        Raises
+        ------
+        DigestMismatchError
+            If the file does not match its SHA-256 or BLAKE2b-256 digest. The `.part` file is deleted.
+
+        Parameters
+        ----------
+        url
+            The file's entry in the JSON API, such as one of `JSONPackageMetadata.urls`.
+        directory
+            The directory to download the file into.
+        bandwidth_limiter
+            A bandwidth cap, which may be shared between downloads.
+        chunk_size
+            The number of bytes to read and write at once. `downloads.DOWNLOAD_CHUNK_SIZE` by default.
+
+        Returns
+        -------
+        Path
+            The path of the downloaded file.
+        """
+        from .downloads import DOWNLOAD_CHUNK_SIZE, StreamingDigests, partial_download_path  # noqa: PLC0415 - imported on first use
+
+        if chunk_size is None:
+            chunk_size = DOWNLOAD_CHUNK_SIZE
+        path = Path(directory) / url.filename
+        partial_path = partial_download_path(path)
+        digests = StreamingDigests()
+        if partial_path.exists() and partial_path.stat().st_size <= url.size:
+            digests.update_from_file(partial_path, chunk_size)
+        else:
+            partial_path.unlink(missing_ok=True)
+        with partial_path.open("ab") as file:
+            await self._download(url, file.write, digests, bandwidth_limiter, chunk_size)
+        try:
+            digests.verify(url)
+        except DigestMismatchError:
+            partial_path.unlink()
+            raise
+        return partial_path.replace(path)
+
+    async def _download_file_or_error(
+        self: Self,
+        url: URL,
+        directory: str | Path,
+        bandwidth_limiter: "AsyncBandwidthLimiter | None",
+    ) -> tuple[URL, Path | DigestMismatchError]:
+        """Download a distribution file, returning a `DigestMismatchError` instead of raising it."""
+        try:
+            return url, await self.download_file(url, directory, bandwidth_limiter=bandwidth_limiter)
+        except DigestMismatchError as error:
+            return url, error
+
+    async def download_files(
+        self: Self,
+        urls: Iterable[URL],
+        directory: str | Path,
+        *,
+        max_concurrency: int = 4,
+        bandwidth_limiter: "AsyncBandwidthLimiter | None" = None,
+    ) -> AsyncIterator[tuple[URL, Path | DigestMismatchError]]:
+        """
+        Download many distribution files into a directory concurrently.
+
+        At most `max_concurrency` downloads are in flight at once, and `urls` is consumed lazily,
+        so it may be an arbitrarily long iterator. Results are yielded as soon as they complete.
+
+        Parameters
+        ----------
+        urls
+            The files' entries in the JSON API.
+        directory
+            The directory to download the files into.
+        max_concurrency
+            The maximum number of downloads in flight at once.
+        bandwidth_limiter
+            A bandwidth cap shared by all of the downloads.
+
+        Yields
+        ------
+        tuple[URL, Path | DigestMismatchError]
+            Each file's entry, and either its path or the error raised verifying it.
+        """
+        if max_concurrency < 1:
+            msg = "max_concurrency must be at least 1"
+            raise ValueError(msg)
+        pending_urls = iter(urls)
+        in_flight: set[asyncio.Task[tuple[URL, Path | DigestMismatchError]]] = set()
+        try:
+            while True:
+                for url in islice(pending_urls, max_concurrency - len(in_flight)):
+                    in_flight.add(
+                        asyncio.create_task(self._download_file_or_error(url, directory, bandwidth_limiter)),
+                    )
+                if not in_flight:
+                    return
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    async def _get_range(self: Self, url: str, byte_range: str) -> tuple[int, int, bytes]:
+        """Get a range of a file, returning its offset, the size of the whole file, and its bytes."""
+        from .archives import parse_content_range  # noqa: PLC0415 - imported on first use
+
+        response = await self._send("GET", url, headers={"Range": f"bytes={byte_range}"})
+        response.raise_for_status()
+        return (*parse_content_range(response), response.content)
+
+    async def _read_remote_zip(self: Self, url: str, operation: "Callable[[ZipFile], T]") -> T:
+        """Read from a remote zip archive, fetching only the ranges that `zipfile` reads, starting from its end."""
+        from .archives import ZIP_TAIL_SIZE, MissingRangeError, SparseFile, read_zip  # noqa: PLC0415 - imported on first use
+
+        start, size, data = await self._get_range(url, f"-{ZIP_TAIL_SIZE}")
+        archive = SparseFile(size)
+        archive.add(start, data)
+        while True:
+            try:
+                return read_zip(archive, operation)
+            except MissingRangeError as error:
+                range_start, range_end = archive.range_to_fetch(error)
+                start, _, data = await self._get_range(url, f"{range_start}-{range_end - 1}")
+                archive.add(start, data)
+
+    async def _iter_remote_tar_gz(
+        self: Self,
+        url: str,
+        want: Callable[[str], bool],
+    ) -> AsyncGenerator[tuple[str, bytes | None]]:
+        """Stream a remote gzipped tar archive, yielding its files as they arrive. Stop iterating to stop the stream."""
+        from .archives import TarGzStreamParser  # noqa: PLC0415 - imported on first use
+
+        async with self._stream(url, URL.__name__) as (response, timer):
+            response.raise_for_status()
+            parser = TarGzStreamParser(want)
+            async with aclosing(timer.aiter_chunks(response.aiter_raw())) as chunks:
+                async for chunk in chunks:
+                    for member in parser.feed(chunk):
+                        yield member
+                    if parser.finished:
+                        return
+
+    async def _get_pep_658_metadata(self: Self, distribution: URL | Distribution) -> bytes | None:
+        """Get the PEP 658 core metadata file of a distribution, if it has one."""
+        from .archives import verify_core_metadata  # noqa: PLC0415 - imported on first use
+
+        if isinstance(distribution, SimpleFile):
+            if distribution.metadata_url is None:
+                return None
+            response = await self._send("GET", distribution.metadata_url)
+            response.raise_for_status()
+            if isinstance(distribution.dist_info_metadata, dict):
+                verify_core_metadata(distribution.filename, response.content, distribution.dist_info_metadata)
+            return response.content
+        # The JSON API does not say which files have one, but PyPI only publishes them for wheels
+        if not distribution.filename.endswith(".whl"):
+            return None
+        response = await self._send("GET", f"{distribution.url}.metadata")
+        if response.status_code == HTTPStatus.NOT_FOUND:
+            return None
+        response.raise_for_status()
+        return response.content
+
+    async def get_core_metadata(self: Self, distribution: URL | Distribution) -> bytes:
+        """
+        Get the core metadata of a distribution file, its `METADATA` or `PKG-INFO`, without downloading all of it.
+
+        The PEP 658 `.metadata` file is used when there is one, and verified when its hashes are listed.
+        Otherwise, wheels and zipped sdists are read with range requests, fetching only the end of the archive
+        and the metadata, and gzipped sdists, which cannot be read out of order, are streamed only until their
+        `PKG-INFO`.
+
+        Raises
+        ------
+        ValueError
+            If the file is neither a zip nor a gzipped tar archive, has no core metadata,
+            or its core metadata is larger than `archives.MAX_CORE_METADATA_SIZE`.
+        DigestMismatchError
+            If the PEP 658 file does not match its hash.
+
+        Parameters
+        ----------
+        distribution
+            The file, such as one of `JSONPackageMetadata.urls` or `SimpleProject.files`.
+
+        Returns
+        -------
+        bytes
+            The core metadata, in email header format.
+        """
+        from .archives import (  # noqa: PLC0415 - imported on first use
+            TAR_GZ_SUFFIXES,
+            ZIP_SUFFIXES,
+            is_core_metadata_path,
+            read_zip_core_metadata,
         )
+
+        metadata = await self._get_pep_658_metadata(distribution)
+        if metadata is not None:
+            return metadata
+        if distribution.filename.endswith(ZIP_SUFFIXES):
+            metadata = await self._read_remote_zip(distribution.url, read_zip_core_metadata)
+        elif distribution.filename.endswith(TAR_GZ_SUFFIXES):
+            metadata = None
+            async with aclosing(self._iter_remote_tar_gz(distribution.url, is_core_metadata_path)) as members:
+                async for _, contents in members:
+                    if contents is not None:
+                        metadata = contents
+                        break
+        else:
+            msg = f"{distribution.filename} is neither a zip nor a gzipped tar archive"
+            raise ValueError(msg)
+        if metadata is None:
+            msg = f"{distribution.filename} has no core metadata"
+            raise ValueError(msg)
+        return metadata
+
+    async def list_distribution_files(self: Self, distribution: URL | Distribution) -> list[str]:
+        """
+        List the paths of the files in a distribution, without downloading all of it where possible.
+
+        Wheels and zipped sdists are read with range requests, fetching only their central directory.
+        Gzipped sdists have no index, so they are streamed in full, though never held in memory.
+
+        Raises
+        ------
+        ValueError
+            If the file is neither a zip nor a gzipped tar archive.
+
+        Parameters
+        ----------
+        distribution
+            The file, such as one of `JSONPackageMetadata.urls` or `SimpleProject.files`.
+
+        Returns
+        -------
+        list[str]
+            The paths of the regular files in the archive.
+        """
+        from .archives import TAR_GZ_SUFFIXES, ZIP_SUFFIXES, list_zip_files  # noqa: PLC0415 - imported on first use
+
+        if distribution.filename.endswith(ZIP_SUFFIXES):
+            return await self._read_remote_zip(distribution.url, list_zip_files)
+        if distribution.filename.endswith(TAR_GZ_SUFFIXES):
+            return [name async for name, _ in self._iter_remote_tar_gz(distribution.url, lambda _: False)]
+        msg = f"{distribution.filename} is neither a zip nor a gzipped tar archive"
+        raise ValueError(msg)
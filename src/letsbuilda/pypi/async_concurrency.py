@@ -0,0 +1,118 @@
+"""Concurrency control for coroutines."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Generic, Self, TypeVar
+
+from .concurrency import _AIMDLimit, _TokenBucket
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class CoalescingStatistics:
+    """A snapshot of a `SingleFlight`'s counters."""
+
+    calls: int
+    coalesced: int
+
+
+class SingleFlight(Generic[T]):  # noqa: UP046 - type parameter syntax needs Python 3.12
+    """
+    Deduplicate concurrent calls with the same key, so that only one of them runs at a time.
+
+    Callers arriving while a call for their key is in flight await that call and share its result,
+    or its exception. Cancelling one caller does not cancel the shared call for the others.
+    """
+
+    def __init__(self: Self) -> None:
+        self._in_flight: dict[Hashable, asyncio.Future[T]] = {}
+        self._calls = 0
+        self._coalesced = 0
+
+    @property
+    def statistics(self: Self) -> CoalescingStatistics:
+        """A snapshot of the number of calls made, and of the callers that shared another's call."""
+        return CoalescingStatistics(self._calls, self._coalesced)
+
+    async def run(self: Self, key: Hashable, function: Callable[[], Awaitable[T]]) -> T:
+        """
+        Call a function, unless a call with the same key is already in flight.
+
+        Parameters
+        ----------
+        key
+            What identifies identical calls.
+        function
+            The function to call.
+
+        Returns
+        -------
+        T
+            The result of the call.
+        """
+        future = self._in_flight.get(key)
+        if future is not None:
+            self._coalesced += 1
+            return await asyncio.shield(future)
+        self._calls += 1
+        future = asyncio.ensure_future(function())
+        self._in_flight[key] = future
+        future.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(future)
+
+    def _finish(self: Self, key: Hashable, future: asyncio.Future[T]) -> None:
+        """Forget a finished call, marking its exception retrieved in case every caller was cancelled."""
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if not future.cancelled():
+            future.exception()
+
+
+class AsyncAdaptiveLimiter(_AIMDLimit):
+    """
+    A concurrency limit for coroutines that adapts to throttling, AIMD-style.
+
+    Each successful request grows the limit slowly, and each throttled request halves it,
+    so the number of requests in flight settles just under what the server accepts.
+    """
+
+    def __init__(
+        self: Self,
+        initial_limit: int = 10,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        backoff_ratio: float = 0.5,
+    ) -> None:
+        super().__init__(initial_limit, min_limit=min_limit, max_limit=max_limit, backoff_ratio=backoff_ratio)
+        self._condition = asyncio.Condition()
+
+    async def acquire(self: Self) -> None:
+        """Wait until another request is allowed in flight."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    async def release(self: Self, *, throttled: bool = False) -> None:
+        """Finish a request, recording whether it was throttled."""
+        async with self._condition:
+            self._in_flight -= 1
+            self._record(throttled=throttled)
+            self._condition.notify_all()
+
+
+class AsyncBandwidthLimiter(_TokenBucket):
+    """
+    A bandwidth cap shared by coroutines.
+
+    Bursts of up to `burst` bytes, one second's worth by default, pass at once, then throughput is capped
+    at `bytes_per_second` across every download sharing the limiter.
+    """
+
+    async def consume(self: Self, size: int) -> None:
+        """Wait until a number of bytes may be received."""
+        wait = self._reserve(size)
+        if wait:
+            await asyncio.sleep(wait)
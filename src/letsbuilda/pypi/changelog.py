@@ -0,0 +1,90 @@
+"""Incremental syncing with PyPI's changelog."""
+
+import os
+import tempfile
+import xmlrpc.client
+from pathlib import Path
+from typing import Self
+
+from pydantic import ConfigDict, TypeAdapter
+
+from .models import ChangelogEvent
+
+_last_serial_adapter = TypeAdapter(int, config=ConfigDict(defer_build=True))
+_changelog_adapter = TypeAdapter(
+    list[tuple[str, str | None, int, str, int]],
+    config=ConfigDict(defer_build=True),
+)
+
+
+def build_last_serial_request() -> bytes:
+    """Build the XML-RPC request for the serial of the latest event."""
+    return xmlrpc.client.dumps((), methodname="changelog_last_serial").encode()
+
+
+def parse_last_serial_response(content: bytes) -> int:
+    """Parse the XML-RPC response for the serial of the latest event."""
+    (last_serial,), _ = xmlrpc.client.loads(content)
+    return _last_serial_adapter.validate_python(last_serial)
+
+
+def build_changelog_request(serial: int) -> bytes:
+    """Build the XML-RPC request for the events after a serial."""
+    return xmlrpc.client.dumps((serial,), methodname="changelog_since_serial").encode()
+
+
+def parse_changelog_response(content: bytes) -> list[ChangelogEvent]:
+    """
+    Parse the XML-RPC response for the events after a serial.
+
+    Parameters
+    ----------
+    content
+        The body of the XML-RPC response.
+
+    Returns
+    -------
+    list[ChangelogEvent]
+        The events, in serial order.
+    """
+    (raw_events,), _ = xmlrpc.client.loads(content)
+    events = [
+        ChangelogEvent(
+            package_title=package_title,
+            package_version=package_version,
+            timestamp=timestamp,
+            action=action,
+            serial=serial,
+        )
+        for package_title, package_version, timestamp, action, serial in _changelog_adapter.validate_python(raw_events)
+    ]
+    events.sort(key=lambda event: event.serial)
+    return events
+
+
+def changed_package_titles(events: list[ChangelogEvent]) -> list[str]:
+    """Get the title of every package changed by some events, once each, in the order of their last change."""
+    last_serials = {event.package_title: event.serial for event in events}
+    return sorted(last_serials, key=last_serials.__getitem__)
+
+
+class SerialCheckpoint:
+    """The serial of the last changelog event processed, persisted to a file."""
+
+    def __init__(self: Self, path: str | os.PathLike[str]) -> None:
+        self.path = Path(path)
+
+    def load(self: Self) -> int | None:
+        """Load the serial, or `None` if none has been saved."""
+        try:
+            return int(self.path.read_text().strip())
+        except FileNotFoundError:
+            return None
+
+    def save(self: Self, serial: int) -> None:
+        """Save the serial, atomically replacing the previous one."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.path.parent)
+        with os.fdopen(file_descriptor, "w") as temporary_file:
+            temporary_file.write(f"{serial}\n")
+        Path(temporary_path).replace(self.path)
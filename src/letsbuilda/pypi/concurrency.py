@@ -0,0 +1,114 @@
+"""Concurrency control for threads."""
+
+import threading
+import time
+from typing import Self
+
+
+class _AIMDLimit:
+    """The additive increase, multiplicative decrease rule behind the adaptive limiters."""
+
+    def __init__(
+        self: Self,
+        initial_limit: int = 10,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        backoff_ratio: float = 0.5,
+    ) -> None:
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+
+    @property
+    def limit(self: Self) -> int:
+        """The number of requests currently allowed in flight at once."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self: Self) -> int:
+        """The number of requests in flight."""
+        return self._in_flight
+
+    def _record(self: Self, *, throttled: bool) -> None:
+        """Shrink the limit after throttling, or grow it by about one for each limit's worth of successes."""
+        if throttled:
+            self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+        else:
+            self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+
+
+class AdaptiveLimiter(_AIMDLimit):
+    """
+    A concurrency limit for threads that adapts to throttling, AIMD-style.
+
+    Each successful request grows the limit slowly, and each throttled request halves it,
+    so the number of requests in flight settles just under what the server accepts.
+    """
+
+    def __init__(
+        self: Self,
+        initial_limit: int = 10,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        backoff_ratio: float = 0.5,
+    ) -> None:
+        super().__init__(initial_limit, min_limit=min_limit, max_limit=max_limit, backoff_ratio=backoff_ratio)
+        self._condition = threading.Condition()
+
+    def acquire(self: Self) -> None:
+        """Wait until another request is allowed in flight."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    def release(self: Self, *, throttled: bool = False) -> None:
+        """Finish a request, recording whether it was throttled."""
+        with self._condition:
+            self._in_flight -= 1
+            self._record(throttled=throttled)
+            self._condition.notify_all()
+
+
+class _TokenBucket:
+    """A token bucket of bytes, which goes into debt to let each caller through in turn."""
+
+    def __init__(self: Self, bytes_per_second: float, *, burst: float | None = None) -> None:
+        if bytes_per_second <= 0:
+            msg = "bytes_per_second must be positive"
+            raise ValueError(msg)
+        self.bytes_per_second = bytes_per_second
+        self.burst = bytes_per_second if burst is None else burst
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+
+    def _reserve(self: Self, size: int) -> float:
+        """Take the tokens for a number of bytes, returning the number of seconds to wait until they are repaid."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.bytes_per_second)
+        self._updated = now
+        self._tokens -= size
+        return max(0.0, -self._tokens / self.bytes_per_second)
+
+
+class BandwidthLimiter(_TokenBucket):
+    """
+    A bandwidth cap shared by threads.
+
+    Bursts of up to `burst` bytes, one second's worth by default, pass at once, then throughput is capped
+    at `bytes_per_second` across every download sharing the limiter.
+    """
+
+    def __init__(self: Self, bytes_per_second: float, *, burst: float | None = None) -> None:
+        super().__init__(bytes_per_second, burst=burst)
+        self._lock = threading.Lock()
+
+    def consume(self: Self, size: int) -> None:
+        """Wait until a number of bytes may be received."""
+        with self._lock:
+            wait = self._reserve(size)
+        if wait:
+            time.sleep(wait)
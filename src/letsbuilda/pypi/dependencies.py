@@ -0,0 +1,232 @@
+"""Crawling dependency graphs."""
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Self
+
+from packaging.markers import default_environment
+from packaging.requirements import InvalidRequirement, Requirement
+
+from .async_client import PyPIServices as AsyncPyPIServices
+from .exceptions import PackageNotFoundError
+from .models import JSONPackageMetadata
+from .names import normalize_package_title
+from .sync_client import PyPIServices
+
+
+@dataclass
+class DependencyGraph:
+    """
+    A dependency graph, as an adjacency mapping from each package to the requirements that apply to it.
+
+    Packages are keyed by their normalized name. Each package's latest release is crawled: the version
+    specifiers of the requirements are recorded, not resolved.
+    """
+
+    roots: list[Requirement]
+    dependencies: dict[str, list[Requirement]] = field(default_factory=dict)
+    versions: dict[str, str] = field(default_factory=dict)
+    depths: dict[str, int] = field(default_factory=dict)
+    extras: dict[str, frozenset[str]] = field(default_factory=dict)
+    not_found: set[str] = field(default_factory=set)
+
+    def __len__(self: Self) -> int:
+        """Get the number of packages in the graph, including those not found."""
+        return len(self.depths)
+
+    def edges(self: Self) -> Iterator[tuple[str, str]]:
+        """
+        Iterate over the graph's edges.
+
+        Yields
+        ------
+        tuple[str, str]
+            The normalized names of each package and of a package it depends on.
+        """
+        for package_name, requirements in self.dependencies.items():
+            for requirement in requirements:
+                yield package_name, normalize_package_title(requirement.name)
+
+
+class _DependencyCrawlerBase:
+    """The breadth-first expansion behind the dependency crawlers, which caches what it fetches."""
+
+    def __init__(self: Self, environment: dict[str, str] | None = None) -> None:
+        if environment is None:
+            environment = {key: str(value) for key, value in default_environment().items()}
+        # The marker environment requirements are evaluated in, with `extra` set for each extra requested
+        self.environment = environment
+        # The version and requirements of each package crawled so far, or `None` if it was not found
+        self._packages: dict[str, tuple[str, list[Requirement]] | None] = {}
+
+    def _record(self: Self, package_name: str, result: JSONPackageMetadata | PackageNotFoundError) -> None:
+        """Cache the version and parsed requirements of a package."""
+        if isinstance(result, PackageNotFoundError):
+            self._packages[package_name] = None
+            return
+        requirements = []
+        for requirement_string in result.info.requires_dist or ():
+            try:
+                requirements.append(Requirement(requirement_string))
+            except InvalidRequirement:
+                continue
+        self._packages[package_name] = result.info.version, requirements
+
+    def _applies(self: Self, requirement: Requirement, extras: frozenset[str]) -> bool:
+        """Check whether a requirement applies in the crawler's environment, with some extras requested."""
+        if requirement.marker is None:
+            return True
+        return any(requirement.marker.evaluate({**self.environment, "extra": extra}) for extra in {"", *extras})
+
+    @staticmethod
+    def _start(roots: Iterable[str]) -> tuple[DependencyGraph, dict[str, frozenset[str]]]:
+        """Parse the root requirements, returning an empty graph and the first level to expand."""
+        graph = DependencyGraph([Requirement(root) for root in roots])
+        level: dict[str, frozenset[str]] = {}
+        for requirement in graph.roots:
+            package_name = normalize_package_title(requirement.name)
+            level[package_name] = level.get(package_name, frozenset()) | requirement.extras
+        return graph, level
+
+    def _expand(
+        self: Self,
+        graph: DependencyGraph,
+        level: dict[str, frozenset[str]],
+        depth: int,
+        max_depth: int | None,
+    ) -> dict[str, frozenset[str]]:
+        """
+        Add a level of fetched packages to the graph, returning the next level.
+
+        A package already in the graph, or still to be expanded in this level, is only expanded again
+        if it is now required with new extras.
+        """
+        next_level: dict[str, frozenset[str]] = {}
+        for package_name, extras in level.items():
+            graph.depths.setdefault(package_name, depth)
+            graph.extras[package_name] = graph.extras.get(package_name, frozenset()) | extras
+            package = self._packages[package_name]
+            if package is None:
+                graph.not_found.add(package_name)
+                continue
+            version, requirements = package
+            graph.versions[package_name] = version
+            graph.dependencies[package_name] = [
+                requirement for requirement in requirements if self._applies(requirement, graph.extras[package_name])
+            ]
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for requirement in graph.dependencies[package_name]:
+                dependency_name = normalize_package_title(requirement.name)
+                wanted_extras = next_level.get(dependency_name, frozenset()) | requirement.extras
+                if (dependency_name in graph.depths or dependency_name in level) and wanted_extras <= (
+                    graph.extras.get(dependency_name, frozenset()) | level.get(dependency_name, frozenset())
+                ):
+                    continue
+                next_level[dependency_name] = wanted_extras
+        return next_level
+
+    def _to_fetch(self: Self, level: dict[str, frozenset[str]]) -> list[tuple[str, str | None]]:
+        """Get the packages of a level which have not been fetched yet."""
+        return [(package_name, None) for package_name in level if package_name not in self._packages]
+
+    def clear(self: Self) -> None:
+        """Forget every package fetched, so that the next crawl fetches them again."""
+        self._packages.clear()
+
+
+class DependencyCrawler(_DependencyCrawlerBase):
+    """
+    A crawler of dependency graphs, expanding each level concurrently with a thread pool.
+
+    Requirements are parsed once per package and kept, so later crawls only fetch packages not seen before.
+    """
+
+    def __init__(self: Self, pypi_client: PyPIServices, environment: dict[str, str] | None = None) -> None:
+        super().__init__(environment)
+        self.pypi_client = pypi_client
+
+    def crawl(
+        self: Self,
+        roots: Iterable[str],
+        *,
+        max_depth: int | None = None,
+        max_workers: int = 10,
+    ) -> DependencyGraph:
+        """
+        Crawl the dependency graph of some packages, breadth first.
+
+        Parameters
+        ----------
+        roots
+            Requirements for the packages to start from, such as `"requests[socks]"`.
+        max_depth
+            How many levels of dependencies to crawl. The roots are at depth 0. Unlimited by default.
+        max_workers
+            The maximum number of requests in flight at once.
+
+        Returns
+        -------
+        DependencyGraph
+            The dependency graph.
+        """
+        graph, level = self._start(roots)
+        depth = 0
+        while level:
+            for package_name, _, result in self.pypi_client.get_many_json_metadata(
+                self._to_fetch(level),
+                max_workers=max_workers,
+                ordered=False,
+            ):
+                self._record(package_name, result)
+            level = self._expand(graph, level, depth, max_depth)
+            depth += 1
+        return graph
+
+
+class AsyncDependencyCrawler(_DependencyCrawlerBase):
+    """
+    A crawler of dependency graphs, expanding each level concurrently.
+
+    Requirements are parsed once per package and kept, so later crawls only fetch packages not seen before.
+    """
+
+    def __init__(self: Self, pypi_client: AsyncPyPIServices, environment: dict[str, str] | None = None) -> None:
+        super().__init__(environment)
+        self.pypi_client = pypi_client
+
+    async def crawl(
+        self: Self,
+        roots: Iterable[str],
+        *,
+        max_depth: int | None = None,
+        max_concurrency: int = 10,
+    ) -> DependencyGraph:
+        """
+        Crawl the dependency graph of some packages, breadth first.
+
+        Parameters
+        ----------
+        roots
+            Requirements for the packages to start from, such as `"requests[socks]"`.
+        max_depth
+            How many levels of dependencies to crawl. The roots are at depth 0. Unlimited by default.
+        max_concurrency
+            The maximum number of requests in flight at once.
+
+        Returns
+        -------
+        DependencyGraph
+            The dependency graph.
+        """
+        graph, level = self._start(roots)
+        depth = 0
+        while level:
+            async for package_name, _, result in self.pypi_client.get_many_json_metadata(
+                self._to_fetch(level),
+                max_concurrency=max_concurrency,
+            ):
+                self._record(package_name, result)
+            level = self._expand(graph, level, depth, max_depth)
+            depth += 1
+        return graph
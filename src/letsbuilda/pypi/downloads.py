@@ -0,0 +1,73 @@
+"""Verifying downloaded distribution files."""
+
+import hashlib
+from pathlib import Path
+from typing import Final, Self
+
+from .exceptions import DigestMismatchError
+from .models.models_json import URL
+
+DOWNLOAD_CHUNK_SIZE: Final[int] = 256 * 1024
+
+
+class StreamingDigests:
+    """The SHA-256 and BLAKE2b-256 digests of a file, computed incrementally as it is written."""
+
+    def __init__(self: Self) -> None:
+        self.size = 0
+        self._sha256 = hashlib.sha256()
+        self._blake2b = hashlib.blake2b(digest_size=32)
+
+    def update(self: Self, chunk: bytes) -> None:
+        """
+        Add the next chunk of the file.
+
+        Parameters
+        ----------
+        chunk
+            The chunk.
+        """
+        self.size += len(chunk)
+        self._sha256.update(chunk)
+        self._blake2b.update(chunk)
+
+    def update_from_file(self: Self, path: Path, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> None:
+        """
+        Add the contents of a partially downloaded file, to resume downloading it.
+
+        Parameters
+        ----------
+        path
+            The path of the file.
+        chunk_size
+            The number of bytes to read at once.
+        """
+        with path.open("rb") as file:
+            while chunk := file.read(chunk_size):
+                self.update(chunk)
+
+    def verify(self: Self, url: URL) -> None:
+        """
+        Check the digests against those published for a file.
+
+        Raises
+        ------
+        DigestMismatchError
+            If either digest does not match.
+
+        Parameters
+        ----------
+        url
+            The file's entry in the JSON API.
+        """
+        for algorithm, expected, actual in (
+            ("sha256", url.digests.sha256, self._sha256.hexdigest()),
+            ("blake2b_256", url.digests.blake2_b_256, self._blake2b.hexdigest()),
+        ):
+            if actual != expected.lower():
+                raise DigestMismatchError(url.filename, algorithm, expected, actual)
+
+
+def partial_download_path(path: Path) -> Path:
+    """Get the path a file is downloaded to until it is complete and verified."""
+    return path.with_name(f"{path.name}.part")
@@ -13,3 +13,17 @@ class PackageNotFoundError(Exception):
         super().__init__(
             f"'{self.package_title}' @ '{self.package_version}' not found on PyPI!",
         )
+
+
+class DigestMismatchError(Exception):
+    """Raised when a downloaded file does not match its published digest."""
+
+    def __init__(self: Self, filename: str, algorithm: str, expected: str, actual: str) -> None:
+        """Initialize the superclass with the appropriate information."""
+        self.filename = filename
+        self.algorithm = algorithm
+        self.expected = expected
+        self.actual = actual
+        super().__init__(
+            f"'{self.filename}' has {self.algorithm} digest '{self.actual}', expected '{self.expected}'!",
+        )
@@ -0,0 +1,328 @@
+"""Streaming exports of package metadata to NDJSON and Parquet."""
+
+import os
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable, Iterable
+from typing import IO, Any, Final, Generic, Self, TypeVar
+
+from .models import JSONPackageMetadata, RSSPackageMetadata, RSSPackageRecord
+
+EXPORT_CHUNK_SIZE: Final[int] = 1000
+
+ExportedModel = JSONPackageMetadata | RSSPackageMetadata | RSSPackageRecord
+
+# Info fields which PyPI always leaves empty, or no longer fills
+_SKIPPED_INFO_FIELDS: Final[set[str]] = {"bugtrack_url", "docs_url", "downloads"}
+
+BufferedT = TypeVar("BufferedT")
+
+
+class _ChunkedExporter(ABC, Generic[BufferedT]):  # noqa: UP046 - type parameter syntax needs Python 3.12
+    """An exporter which buffers models, in the form it writes them from, and writes them out a chunk at a time."""
+
+    def __init__(self: Self, chunk_size: int) -> None:
+        if chunk_size < 1:
+            msg = "chunk_size must be at least 1"
+            raise ValueError(msg)
+        self.chunk_size = chunk_size
+        self.exported = 0
+        self._chunk: list[BufferedT] = []
+
+    def __enter__(self: Self) -> Self:
+        """Use the exporter as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self: Self, *_: object) -> None:
+        """Close the exporter."""
+        self.close()
+
+    def write(self: Self, model: ExportedModel) -> None:
+        """
+        Export a model, writing out the chunk if it is full.
+
+        Parameters
+        ----------
+        model
+            The model.
+        """
+        self._chunk.append(self._buffer(model))
+        if len(self._chunk) >= self.chunk_size:
+            self.flush()
+
+    def write_all(self: Self, models: Iterable[ExportedModel]) -> int:
+        """
+        Export models as they are produced, such as by a batch fetch or a feed poll.
+
+        Parameters
+        ----------
+        models
+            The models.
+
+        Returns
+        -------
+        int
+            The number of models exported.
+        """
+        exported = self.exported
+        for model in models:
+            self.write(model)
+        return self.exported + len(self._chunk) - exported
+
+    async def awrite_all(self: Self, models: AsyncIterable[ExportedModel]) -> int:
+        """
+        Export models as they are produced by an asynchronous iterator.
+
+        Parameters
+        ----------
+        models
+            The models.
+
+        Returns
+        -------
+        int
+            The number of models exported.
+        """
+        exported = self.exported
+        async for model in models:
+            self.write(model)
+        return self.exported + len(self._chunk) - exported
+
+    def flush(self: Self) -> None:
+        """Write out the buffered models."""
+        if self._chunk:
+            self._write_chunk(self._chunk)
+            self.exported += len(self._chunk)
+            self._chunk = []
+
+    def close(self: Self) -> None:
+        """Write out the buffered models, and close the output."""
+        self.flush()
+
+    @abstractmethod
+    def _buffer(self: Self, model: ExportedModel) -> BufferedT:
+        """Convert a model to the form it is buffered in until its chunk is written out."""
+
+    @abstractmethod
+    def _write_chunk(self: Self, chunk: list[BufferedT]) -> None:
+        """Write out a chunk of buffered models."""
+
+
+class NDJSONExporter(_ChunkedExporter[bytes]):
+    """
+    An exporter of models to newline-delimited JSON, one model per line.
+
+    Models are serialized as they are exported, so only their lines are buffered, and written out
+    `chunk_size` at a time, so memory stays flat however many are exported.
+    """
+
+    def __init__(
+        self: Self,
+        output: str | os.PathLike[str] | IO[bytes],
+        *,
+        chunk_size: int = EXPORT_CHUNK_SIZE,
+    ) -> None:
+        super().__init__(chunk_size)
+        self._owns_output = isinstance(output, str | os.PathLike)
+        self._output: IO[bytes] = open(output, "wb") if isinstance(output, str | os.PathLike) else output  # noqa: SIM115, PTH123 - closed by `close`
+
+    def _buffer(self: Self, model: ExportedModel) -> bytes:
+        """Serialize a model as a line of JSON."""
+        return (model.to_model() if isinstance(model, RSSPackageRecord) else model).model_dump_json().encode() + b"\n"
+
+    def _write_chunk(self: Self, chunk: list[bytes]) -> None:
+        """Write out a chunk of lines."""
+        self._output.write(b"".join(chunk))
+
+    def close(self: Self) -> None:
+        """Write out the buffered models, and close the output if the exporter opened it."""
+        try:
+            super().close()
+        finally:
+            if self._owns_output:
+                self._output.close()
+            else:
+                self._output.flush()
+
+
+def _json_schema(pa: Any) -> Any:  # noqa: ANN401 - pyarrow is untyped
+    """Get the flattened schema of `JSONPackageMetadata`: a row per release file, with its package's info."""
+    strings = pa.list_(pa.string())
+    return pa.schema(
+        [
+            ("name", pa.string()),
+            ("version", pa.string()),
+            ("last_serial", pa.int64()),
+            ("author", pa.string()),
+            ("author_email", pa.string()),
+            ("classifiers", strings),
+            ("description", pa.string()),
+            ("description_content_type", pa.string()),
+            ("download_url", pa.string()),
+            ("home_page", pa.string()),
+            ("keywords", pa.string()),
+            ("license", pa.string()),
+            ("license_expression", pa.string()),
+            ("license_files", strings),
+            ("maintainer", pa.string()),
+            ("maintainer_email", pa.string()),
+            ("package_url", pa.string()),
+            ("platform", pa.string()),
+            ("project_url", pa.string()),
+            ("project_urls", pa.map_(pa.string(), pa.string())),
+            ("release_url", pa.string()),
+            ("requires_dist", strings),
+            ("requires_python", pa.string()),
+            ("summary", pa.string()),
+            ("yanked", pa.bool_()),
+            ("yanked_reason", pa.string()),
+            ("dynamic", strings),
+            ("provides_extra", strings),
+            ("vulnerability_ids", strings),
+            ("file_filename", pa.string()),
+            ("file_url", pa.string()),
+            ("file_packagetype", pa.string()),
+            ("file_python_version", pa.string()),
+            ("file_requires_python", pa.string()),
+            ("file_size", pa.int64()),
+            ("file_upload_time", pa.timestamp("us", tz="UTC")),
+            ("file_comment_text", pa.string()),
+            ("file_has_sig", pa.bool_()),
+            ("file_yanked", pa.bool_()),
+            ("file_blake2b_256", pa.string()),
+            ("file_md5", pa.string()),
+            ("file_sha256", pa.string()),
+        ],
+    )
+
+
+def _rss_schema(pa: Any) -> Any:  # noqa: ANN401 - pyarrow is untyped
+    """Get the schema of `RSSPackageMetadata`."""
+    return pa.schema(
+        [
+            ("title", pa.string()),
+            ("version", pa.string()),
+            ("package_link", pa.string()),
+            ("guid", pa.string()),
+            ("description", pa.string()),
+            ("author", pa.string()),
+            ("publication_date", pa.timestamp("us", tz="UTC")),
+        ],
+    )
+
+
+def _json_rows(metadata: JSONPackageMetadata) -> list[dict[str, Any]]:
+    """Flatten the metadata of a package into a row per release file, or a single row if it has none."""
+    package = {
+        "last_serial": metadata.last_serial,
+        **metadata.info.model_dump(exclude=_SKIPPED_INFO_FIELDS),
+        "vulnerability_ids": [vulnerability.id for vulnerability in metadata.vulnerabilities],
+    }
+    if package["project_urls"] is not None:
+        package["project_urls"] = list(package["project_urls"].items())
+    if not metadata.urls:
+        return [package]
+    return [
+        {
+            **package,
+            "file_filename": url.filename,
+            "file_url": url.url,
+            "file_packagetype": url.packagetype,
+            "file_python_version": url.python_version,
+            "file_requires_python": url.requires_python,
+            "file_size": url.size,
+            "file_upload_time": url.upload_time_iso_8601,
+            "file_comment_text": url.comment_text,
+            "file_has_sig": url.has_sig,
+            "file_yanked": url.yanked,
+            "file_blake2b_256": url.digests.blake2_b_256,
+            "file_md5": url.digests.md5,
+            "file_sha256": url.digests.sha256,
+        }
+        for url in metadata.urls
+    ]
+
+
+def _rss_row(model: RSSPackageMetadata | RSSPackageRecord) -> dict[str, Any]:
+    """Get the row of an RSS entry."""
+    return {
+        "title": model.title,
+        "version": model.version,
+        "package_link": model.package_link,
+        "guid": model.guid,
+        "description": model.description if isinstance(model, RSSPackageMetadata) else None,
+        "author": model.author,
+        "publication_date": model.publication_date,
+    }
+
+
+class ParquetExporter(_ChunkedExporter[ExportedModel]):
+    """
+    An exporter of models to a Parquet file, with a flattened schema.
+
+    `JSONPackageMetadata` is exported as a row per release file, with its package's `Info` fields alongside
+    the file's `URL` fields, which are prefixed with `file_`. Each chunk of `chunk_size` models is written
+    as a row group, so memory stays flat however many are exported. Needs `pyarrow`, with the `parquet` extra.
+    """
+
+    def __init__(
+        self: Self,
+        output: str | os.PathLike[str] | IO[bytes],
+        model: type[JSONPackageMetadata] | type[RSSPackageMetadata],
+        *,
+        chunk_size: int = EXPORT_CHUNK_SIZE,
+        compression: str = "zstd",
+    ) -> None:
+        super().__init__(chunk_size)
+        try:
+            import pyarrow as pa  # noqa: PLC0415 - optional dependency
+            import pyarrow.parquet as pq  # noqa: PLC0415 - optional dependency
+        except ImportError as error:
+            msg = "Parquet exports need pyarrow, which the `parquet` extra installs"
+            raise ImportError(msg) from error
+        self.model = model
+        self._pa = pa
+        self._schema = _json_schema(pa) if model is JSONPackageMetadata else _rss_schema(pa)
+        self._writer = pq.ParquetWriter(output, self._schema, compression=compression)
+
+    def write(self: Self, model: ExportedModel) -> None:
+        """
+        Export a model, writing out the chunk if it is full.
+
+        Raises
+        ------
+        TypeError
+            If the model does not match the file's schema.
+
+        Parameters
+        ----------
+        model
+            The model.
+        """
+        expected = (
+            (JSONPackageMetadata,) if self.model is JSONPackageMetadata else (RSSPackageMetadata, RSSPackageRecord)
+        )
+        if not isinstance(model, expected):
+            msg = f"Cannot export {type(model).__name__} to a {self.model.__name__} Parquet file"
+            raise TypeError(msg)
+        super().write(model)
+
+    def _buffer(self: Self, model: ExportedModel) -> ExportedModel:
+        """Buffer the model itself, as its rows, which repeat its package's fields for each file, are larger."""
+        return model
+
+    def _write_chunk(self: Self, chunk: list[ExportedModel]) -> None:
+        """Write out a chunk of models as a row group."""
+        rows: list[dict[str, Any]] = []
+        for model in chunk:
+            if isinstance(model, JSONPackageMetadata):
+                rows.extend(_json_rows(model))
+            else:
+                rows.append(_rss_row(model))
+        self._writer.write_table(self._pa.Table.from_pylist(rows, schema=self._schema))
+
+    def close(self: Self) -> None:
+        """Write out the buffered models, and finish the file."""
+        try:
+            super().close()
+        finally:
+            self._writer.close()
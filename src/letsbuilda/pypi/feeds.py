@@ -0,0 +1,193 @@
+"""Incremental polling of the RSS feeds."""
+
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, AsyncIterable, Iterable, Iterator
+from typing import Self
+from xml.etree.ElementTree import Element, XMLPullParser
+
+from httpx import Response
+from pydantic import ConfigDict, TypeAdapter
+
+from .models import RSSPackageMetadata
+
+_rss_items_adapter = TypeAdapter(list[RSSPackageMetadata], config=ConfigDict(defer_build=True))
+
+
+class FeedState:
+    """
+    What has already been seen of an RSS feed.
+
+    Remembers the validators of the last response, to make conditional requests,
+    and a bounded number of the most recent item keys (`guid`, or `link` when there is none).
+    """
+
+    def __init__(self: Self, max_seen: int = 1024) -> None:
+        self.max_seen = max_seen
+        self.etag: str | None = None
+        self.last_modified: str | None = None
+        self._seen: OrderedDict[str, None] = OrderedDict()
+
+    def conditional_headers(self: Self) -> dict[str, str]:
+        """Get the headers to make a conditional request for the feed."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def update_validators(self: Self, response: Response) -> None:
+        """Remember the validators of a successful response."""
+        self.etag = response.headers.get("ETag")
+        self.last_modified = response.headers.get("Last-Modified")
+
+    def has_seen(self: Self, key: str) -> bool:
+        """Check whether an item key has been seen."""
+        return key in self._seen
+
+    def mark_seen(self: Self, key: str) -> None:
+        """Remember an item key, forgetting the oldest one if there are too many."""
+        self._seen[key] = None
+        self._seen.move_to_end(key)
+        while len(self._seen) > self.max_seen:
+            self._seen.popitem(last=False)
+
+    def mark_all_seen(self: Self, keys: list[str]) -> None:
+        """Remember several item keys, newest first."""
+        for key in reversed(keys):
+            self.mark_seen(key)
+
+
+class RSSItemParser:
+    """
+    An incremental parser that turns the bytes of an RSS feed into item dicts, one item at a time.
+
+    Each item is yielded as soon as its closing tag has been fed, then discarded,
+    so memory use does not grow with the size of the feed.
+    """
+
+    def __init__(self: Self) -> None:
+        self._parser: XMLPullParser[Element] = XMLPullParser(events=("start", "end"))
+        self._channel: Element | None = None
+
+    def feed(self: Self, data: bytes) -> Iterator[dict[str, str | None]]:
+        """
+        Feed the next chunk of the feed to the parser.
+
+        Parameters
+        ----------
+        data
+            The next chunk of the feed.
+
+        Yields
+        ------
+        dict[str, str | None]
+            Each item completed by this chunk, mapping child tags to their text.
+        """
+        self._parser.feed(data)
+        for event_and_element in self._parser.read_events():
+            event, element = event_and_element[0], event_and_element[-1]
+            if not isinstance(element, Element):
+                continue
+            if event == "start":
+                if element.tag == "channel":
+                    self._channel = element
+                continue
+            if element.tag == "item":
+                yield {str(child.tag): child.text for child in element}
+                if self._channel is not None:
+                    self._channel.remove(element)
+
+
+def iter_rss_items(chunks: Iterable[bytes]) -> Iterator[dict[str, str | None]]:
+    """
+    Incrementally parse the items of an RSS feed.
+
+    Parameters
+    ----------
+    chunks
+        The body of the RSS feed, in chunks.
+
+    Yields
+    ------
+    dict[str, str | None]
+        Each item, mapping child tags to their text.
+    """
+    parser = RSSItemParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+
+
+async def aiter_rss_items(chunks: AsyncIterable[bytes]) -> AsyncGenerator[dict[str, str | None]]:
+    """
+    Incrementally parse the items of an RSS feed.
+
+    Parameters
+    ----------
+    chunks
+        The body of the RSS feed, in chunks.
+
+    Yields
+    ------
+    dict[str, str | None]
+        Each item, mapping child tags to their text.
+    """
+    parser = RSSItemParser()
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+
+
+def rss_item_key(item: dict[str, str | None]) -> str:
+    """Get the key identifying an RSS item: its `guid`, or its `link` when there is none."""
+    key = item.get("guid") or item.get("link")
+    if key is None:
+        msg = "RSS item has neither a guid nor a link"
+        raise ValueError(msg)
+    return key
+
+
+def parse_rss_items(items: list[dict[str, str | None]]) -> list[RSSPackageMetadata]:
+    """Validate the items of an RSS feed as a whole list, with a reused `TypeAdapter` rather than item by item."""
+    return _rss_items_adapter.validate_python(items)
+
+
+def parse_new_rss_items(
+    items: Iterable[dict[str, str | None]],
+    feed_state: FeedState,
+    response: Response,
+) -> list[RSSPackageMetadata]:
+    """
+    Parse the items of an RSS feed that have not been seen before.
+
+    Items are newest first, so parsing stops at the first item that has already been seen,
+    and nothing after it is consumed from `items`. The feed state is only updated once every new item
+    has been parsed, so that a failed poll is repeated in full rather than revalidated as unchanged.
+
+    Parameters
+    ----------
+    items
+        The items of the RSS feed.
+    feed_state
+        What has already been seen of the feed. Updated with the new items, and the response's validators.
+    response
+        The successful response the items are read from.
+
+    Returns
+    -------
+    list[RSSPackageMetadata]
+        The new items, oldest first.
+    """
+    new_keys = []
+    new_items = []
+    for item in items:
+        key = rss_item_key(item)
+        if feed_state.has_seen(key):
+            break
+        new_keys.append(key)
+        new_items.append(item)
+    new_packages = parse_rss_items(new_items)
+    feed_state.mark_all_seen(new_keys)
+    feed_state.update_validators(response)
+    new_packages.reverse()
+    return new_packages
@@ -0,0 +1,162 @@
+"""A persistent on-disk HTTP cache."""
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import zlib
+from pathlib import Path
+from typing import BinaryIO, Self
+
+from httpx import Response
+
+_ENTRY_SUFFIX = ".entry"
+
+
+class HTTPCache:
+    """
+    A size-bounded on-disk cache of response bodies, revalidated with ETag and Last-Modified.
+
+    Entries are keyed by URL and hold the zlib-compressed body along with the validators needed
+    to make a conditional request. When the cache grows past `max_size` bytes, the least recently
+    used entries are evicted. The same instance may be shared by the sync and async clients,
+    and by several threads.
+    """
+
+    def __init__(self: Self, directory: str | os.PathLike[str], max_size: int = 256 * 1024 * 1024) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._size = sum(path.stat().st_size for path in self.directory.glob(f"*{_ENTRY_SUFFIX}"))
+
+    @property
+    def size(self: Self) -> int:
+        """The total size of the cache entries, in bytes."""
+        return self._size
+
+    def _path_for(self: Self, url: str) -> Path:
+        """Get the path of the entry for a URL."""
+        return self.directory / f"{hashlib.sha256(url.encode()).hexdigest()}{_ENTRY_SUFFIX}"
+
+    @staticmethod
+    def _read_headers(entry_file: BinaryIO, url: str) -> dict[str, str] | None:
+        """Read the headers on the first line of an entry, if it is the entry for the URL rather than a collision."""
+        headers: dict[str, str] = json.loads(entry_file.readline())
+        if headers.pop("url", None) != url:
+            return None
+        return headers
+
+    def conditional_headers(self: Self, url: str) -> dict[str, str]:
+        """
+        Get the headers to make a conditional request for a URL.
+
+        Parameters
+        ----------
+        url
+            The URL to be requested.
+
+        Returns
+        -------
+        dict[str, str]
+            `If-None-Match` and/or `If-Modified-Since`, or nothing if the URL is not cached.
+        """
+        # Only the first line is read, as the body is not needed unless the response is not modified
+        try:
+            with self._path_for(url).open("rb") as entry_file:
+                headers = self._read_headers(entry_file, url)
+        except FileNotFoundError:
+            return {}
+        if headers is None:
+            return {}
+        conditional_headers = {}
+        if "etag" in headers:
+            conditional_headers["If-None-Match"] = headers["etag"]
+        if "last-modified" in headers:
+            conditional_headers["If-Modified-Since"] = headers["last-modified"]
+        return conditional_headers
+
+    def load(self: Self, url: str) -> Response | None:
+        """
+        Load the cached response for a URL.
+
+        Parameters
+        ----------
+        url
+            The URL that was requested.
+
+        Returns
+        -------
+        Response | None
+            A `200 OK` response rebuilt from the cache, or `None` if the URL is not cached.
+        """
+        path = self._path_for(url)
+        try:
+            with path.open("rb") as entry_file:
+                headers = self._read_headers(entry_file, url)
+                if headers is None:
+                    return None
+                compressed_body = entry_file.read()
+        except FileNotFoundError:
+            return None
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(path)
+        return Response(200, headers=headers, content=zlib.decompress(compressed_body))
+
+    def store(self: Self, url: str, response: Response) -> None:
+        """
+        Store a response for a URL, if it carries a validator.
+
+        Responses without an ETag or Last-Modified header could never be revalidated, so they are not stored.
+
+        Parameters
+        ----------
+        url
+            The URL that was requested.
+        response
+            The successful response, which must have been read.
+        """
+        headers = {name: response.headers[name] for name in ("etag", "last-modified") if name in response.headers}
+        if not headers:
+            return
+        if "content-type" in response.headers:
+            headers["content-type"] = response.headers["content-type"]
+        headers["url"] = url
+        entry = json.dumps(headers).encode() + b"\n" + zlib.compress(response.content)
+
+        path = self._path_for(url)
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory)
+        with os.fdopen(file_descriptor, "wb") as temporary_file:
+            temporary_file.write(entry)
+        with self._lock:
+            with contextlib.suppress(FileNotFoundError):
+                self._size -= path.stat().st_size
+            Path(temporary_path).replace(path)
+            self._size += len(entry)
+            if self._size > self.max_size:
+                self._evict()
+
+    def _evict(self: Self) -> None:
+        """Remove the least recently used entries until the cache fits in `max_size`."""
+        entries = []
+        for path in self.directory.glob(f"*{_ENTRY_SUFFIX}"):
+            try:
+                entries.append((path.stat(), path))
+            except FileNotFoundError:
+                continue
+        entries.sort(key=lambda entry: entry[0].st_mtime)
+        self._size = sum(stat.st_size for stat, _ in entries)
+        for stat, path in entries:
+            if self._size <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            self._size -= stat.st_size
+
+    def clear(self: Self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock:
+            for path in self.directory.glob(f"*{_ENTRY_SUFFIX}"):
+                path.unlink(missing_ok=True)
+            self._size = 0
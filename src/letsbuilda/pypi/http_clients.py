@@ -0,0 +1,49 @@
+"""Options for the HTTP clients built by `PyPIServices.create`."""
+
+from importlib.metadata import version
+from importlib.util import find_spec
+from typing import Any
+
+from httpx import Limits, Timeout
+
+DEFAULT_LIMITS = Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=60.0)
+DEFAULT_TIMEOUT = Timeout(30.0, connect=10.0, pool=60.0)
+
+
+def http2_available() -> bool:
+    """Check whether `h2` is installed, which `httpx` needs for HTTP/2, with the `http2` extra."""
+    return find_spec("h2") is not None
+
+
+def http_client_options(
+    *,
+    http2: bool | None,
+    limits: Limits | None,
+    timeout: Timeout | None,
+) -> dict[str, Any]:
+    """
+    Get the keyword arguments for an `httpx` client tuned for PyPI.
+
+    Responses are compressed, as `httpx` accepts gzip and deflate, and Brotli or Zstandard when installed.
+
+    Parameters
+    ----------
+    http2
+        Whether to use HTTP/2, multiplexing requests over fewer connections. By default, when `h2` is installed.
+    limits
+        The connection pool limits. `DEFAULT_LIMITS` by default.
+    timeout
+        The timeouts. `DEFAULT_TIMEOUT` by default, allowing requests to queue for the pool under high concurrency.
+
+    Returns
+    -------
+    dict[str, Any]
+        The keyword arguments.
+    """
+    return {
+        "http2": http2_available() if http2 is None else http2,
+        "limits": DEFAULT_LIMITS if limits is None else limits,
+        "timeout": DEFAULT_TIMEOUT if timeout is None else timeout,
+        "headers": {"User-Agent": f"letsbuilda-pypi/{version('letsbuilda-pypi')}"},
+        "follow_redirects": True,
+    }
@@ -0,0 +1,318 @@
+"""Instrumentation of requests and parsing."""
+
+import heapq
+import math
+import threading
+import time
+from collections import Counter
+from collections.abc import AsyncGenerator, AsyncIterable, Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Literal, Self, TypeVar
+
+from httpx import Response
+
+T = TypeVar("T")
+
+ParsePhase = Literal["decode", "validate", "decode_and_validate"]
+
+
+@dataclass(frozen=True)
+class RequestStarted:
+    """A request is about to be sent. Retried requests start again for each attempt."""
+
+    method: str
+    url: str
+
+
+@dataclass(frozen=True)
+class RequestFinished:
+    """
+    A request has finished.
+
+    `network_time` is the number of seconds spent waiting for the response, including its body.
+    For streamed responses, which are parsed as they arrive, time spent parsing is excluded.
+    `status_code` is `None` if the request failed without a response.
+    """
+
+    method: str
+    url: str
+    status_code: int | None
+    response_bytes: int
+    network_time: float
+
+
+@dataclass(frozen=True)
+class ParseFinished:
+    """
+    A response has been parsed into models.
+
+    JSON is decoded and validated in a single pass by pydantic, reported as the `"decode_and_validate"` phase.
+    Streamed XML is reported as separate `"decode"` and `"validate"` phases.
+    """
+
+    url: str
+    model: str
+    phase: ParsePhase
+    input_bytes: int
+    elapsed: float
+
+
+InstrumentationEvent = RequestStarted | RequestFinished | ParseFinished
+Instrument = Callable[[InstrumentationEvent], None]
+
+
+def emit(instruments: Sequence[Instrument], event: InstrumentationEvent) -> None:
+    """Send an event to every instrument."""
+    for instrument in instruments:
+        instrument(event)
+
+
+def timed_parse(  # noqa: UP047 - type parameter syntax needs Python 3.12
+    instruments: Sequence[Instrument],
+    url: str,
+    model: str,
+    input_bytes: int,
+    parse: Callable[[], T],
+) -> T:
+    """Call a function decoding and validating a whole response, reporting how long it took to the instruments."""
+    if not instruments:
+        return parse()
+    start = time.perf_counter()
+    result = parse()
+    emit(instruments, ParseFinished(url, model, "decode_and_validate", input_bytes, time.perf_counter() - start))
+    return result
+
+
+class StreamTimer:
+    """Split the time spent consuming a streamed response between the network, decoding and validation."""
+
+    def __init__(self: Self) -> None:
+        self.network_time = 0.0
+        self.decode_time = 0.0
+        self.validate_time = 0.0
+
+    def iter_chunks(self: Self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Wrap the response's chunks, timing how long each takes to arrive."""
+        iterator = iter(chunks)
+        while True:
+            start = time.perf_counter()
+            chunk = next(iterator, None)
+            self.network_time += time.perf_counter() - start
+            if chunk is None:
+                return
+            yield chunk
+
+    def iter_items(self: Self, items: Iterable[T]) -> Iterator[T]:
+        """Wrap the items decoded from the chunks, timing how long each takes to decode, less network time."""
+        iterator = iter(items)
+        while True:
+            start = time.perf_counter()
+            network_time = self.network_time
+            item = next(iterator, None)
+            self.decode_time += time.perf_counter() - start - (self.network_time - network_time)
+            if item is None:
+                return
+            yield item
+
+    async def aiter_chunks(self: Self, chunks: AsyncIterable[bytes]) -> AsyncGenerator[bytes]:
+        """Wrap the response's chunks, timing how long each takes to arrive."""
+        iterator = aiter(chunks)
+        try:
+            while True:
+                start = time.perf_counter()
+                chunk = await anext(iterator, None)
+                self.network_time += time.perf_counter() - start
+                if chunk is None:
+                    return
+                yield chunk
+        finally:
+            await _aclose(iterator)
+
+    async def aiter_items(self: Self, items: AsyncIterable[T]) -> AsyncGenerator[T]:
+        """Wrap the items decoded from the chunks, timing how long each takes to decode, less network time."""
+        iterator = aiter(items)
+        try:
+            while True:
+                start = time.perf_counter()
+                network_time = self.network_time
+                item = await anext(iterator, None)
+                self.decode_time += time.perf_counter() - start - (self.network_time - network_time)
+                if item is None:
+                    return
+                yield item
+        finally:
+            await _aclose(iterator)
+
+    def time_validation(self: Self, validate: Callable[[], T]) -> T:
+        """Call a validating function, timing it less any network and decoding time spent within it."""
+        start = time.perf_counter()
+        network_and_decode_time = self.network_time + self.decode_time
+        try:
+            return validate()
+        finally:
+            elapsed = time.perf_counter() - start
+            self.validate_time += elapsed - (self.network_time + self.decode_time - network_and_decode_time)
+
+    def report(
+        self: Self,
+        instruments: Sequence[Instrument],
+        url: str,
+        model: str,
+        response: Response | None,
+    ) -> None:
+        """Report the streamed request, and the parsing of its response if any, to the instruments."""
+        response_bytes = 0 if response is None else response.num_bytes_downloaded
+        status_code = None if response is None else response.status_code
+        emit(instruments, RequestFinished("GET", url, status_code, response_bytes, self.network_time))
+        if self.decode_time:
+            emit(instruments, ParseFinished(url, model, "decode", response_bytes, self.decode_time))
+        if self.validate_time:
+            emit(instruments, ParseFinished(url, model, "validate", response_bytes, self.validate_time))
+
+
+async def _aclose(iterator: object) -> None:
+    """Close an async generator, if the iterator is one."""
+    aclose = getattr(iterator, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+class Histogram:
+    """
+    A histogram with logarithmic buckets.
+
+    Each bucket spans a factor of `2 ** (1 / buckets_per_doubling)`, so quantiles are accurate
+    to within that relative error, whatever the range of the values, in constant memory per bucket.
+    """
+
+    def __init__(self: Self, buckets_per_doubling: int = 8) -> None:
+        self.buckets_per_doubling = buckets_per_doubling
+        self._counts: Counter[int | None] = Counter()
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def __repr__(self: Self) -> str:
+        """Summarize the histogram."""
+        if not self.count:
+            return "Histogram(count=0)"
+        return (
+            f"Histogram(count={self.count}, mean={self.mean:.6g}, p50={self.quantile(0.5):.6g}, "
+            f"p99={self.quantile(0.99):.6g}, max={self.max:.6g})"
+        )
+
+    @property
+    def mean(self: Self) -> float:
+        """The mean of the recorded values."""
+        return self.total / self.count if self.count else math.nan
+
+    def _bucket_bounds(self: Self, bucket: int | None) -> tuple[float, float]:
+        """Get the lower and upper bounds of a bucket. Zero and negative values share the `None` bucket."""
+        if bucket is None:
+            return 0.0, 0.0
+        return 2 ** (bucket / self.buckets_per_doubling), 2 ** ((bucket + 1) / self.buckets_per_doubling)
+
+    def record(self: Self, value: float) -> None:
+        """
+        Record a value.
+
+        Parameters
+        ----------
+        value
+            The value, such as a duration in seconds or a size in bytes.
+        """
+        bucket = math.floor(math.log2(value) * self.buckets_per_doubling) if value > 0 else None
+        self._counts[bucket] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def buckets(self: Self) -> list[tuple[float, float, int]]:
+        """
+        Get the non-empty buckets.
+
+        Returns
+        -------
+        list[tuple[float, float, int]]
+            The lower bound, upper bound and count of each bucket, in ascending order.
+        """
+        ordered = sorted(self._counts.items(), key=lambda bucket: -math.inf if bucket[0] is None else bucket[0])
+        return [(*self._bucket_bounds(bucket), count) for bucket, count in ordered]
+
+    def quantile(self: Self, q: float) -> float:
+        """
+        Estimate a quantile of the recorded values.
+
+        Parameters
+        ----------
+        q
+            The quantile, between 0 and 1, such as 0.99 for the 99th percentile.
+
+        Returns
+        -------
+        float
+            The geometric midpoint of the bucket containing the quantile, clamped to the recorded range.
+        """
+        if not self.count:
+            return math.nan
+        rank = q * self.count
+        seen = 0
+        for lower_bound, upper_bound, count in self.buckets():
+            seen += count
+            if seen >= rank:
+                return max(self.min, min(math.sqrt(lower_bound * upper_bound), self.max))
+        return self.max
+
+
+class MetricsAggregator:
+    """
+    An instrument aggregating events into histograms, and keeping the slowest requests and parses.
+
+    Pass it to a client's `instruments` to find tail latency and slow packages. It is thread safe.
+    """
+
+    def __init__(self: Self, max_slowest: int = 20) -> None:
+        self.max_slowest = max_slowest
+        self.network_time = Histogram()
+        self.response_bytes = Histogram()
+        self.parse_time: dict[tuple[str, ParsePhase], Histogram] = {}
+        self.status_codes: Counter[int | None] = Counter()
+        self._slowest_requests: list[tuple[float, int, RequestFinished]] = []
+        self._slowest_parses: list[tuple[float, int, ParseFinished]] = []
+        self._sequence = 0
+        self._lock = threading.Lock()
+
+    def __call__(self: Self, event: InstrumentationEvent) -> None:
+        """Record an event."""
+        with self._lock:
+            self._sequence += 1
+            match event:
+                case RequestFinished():
+                    self.network_time.record(event.network_time)
+                    self.response_bytes.record(event.response_bytes)
+                    self.status_codes[event.status_code] += 1
+                    self._keep_slowest(self._slowest_requests, (event.network_time, self._sequence, event))
+                case ParseFinished():
+                    self.parse_time.setdefault((event.model, event.phase), Histogram()).record(event.elapsed)
+                    self._keep_slowest(self._slowest_parses, (event.elapsed, self._sequence, event))
+                case RequestStarted():
+                    pass
+
+    def _keep_slowest(self: Self, heap: list[tuple[float, int, T]], entry: tuple[float, int, T]) -> None:
+        """Add an entry to a bounded min-heap, so it keeps the slowest entries."""
+        if len(heap) < self.max_slowest:
+            heapq.heappush(heap, entry)
+        elif entry[0] > heap[0][0]:
+            heapq.heapreplace(heap, entry)
+
+    def slowest_requests(self: Self) -> list[RequestFinished]:
+        """Get the slowest requests by network time, slowest first."""
+        with self._lock:
+            return [event for _, _, event in sorted(self._slowest_requests, reverse=True)]
+
+    def slowest_parses(self: Self) -> list[ParseFinished]:
+        """Get the slowest parses, slowest first."""
+        with self._lock:
+            return [event for _, _, event in sorted(self._slowest_parses, reverse=True)]
@@ -0,0 +1,155 @@
+"""An in-memory cache of parsed package metadata."""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Self
+
+from .models import JSONPackageMetadata
+from .names import normalize_package_title
+
+
+@dataclass(frozen=True)
+class CacheStatistics:
+    """A snapshot of a cache's counters."""
+
+    hits: int
+    misses: int
+    evictions: int
+    revalidations: int
+
+
+class MetadataCache:
+    """
+    An LRU cache of `JSONPackageMetadata`, with a time-to-live, keyed by package title and version.
+
+    Expired entries are kept until evicted, so that a refetch which reports the same `last_serial`
+    can reuse the already parsed model instead of validating the response again.
+    """
+
+    def __init__(self: Self, max_size: int = 1024, ttl: float = 300.0) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple[str, str | None], tuple[float, JSONPackageMetadata]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._revalidations = 0
+
+    def __len__(self: Self) -> int:
+        """Get the number of cached entries, including expired ones."""
+        return len(self._entries)
+
+    @property
+    def statistics(self: Self) -> CacheStatistics:
+        """A snapshot of the hit, miss, eviction and revalidation counters."""
+        return CacheStatistics(self._hits, self._misses, self._evictions, self._revalidations)
+
+    def get(self: Self, package_title: str, package_version: str | None) -> JSONPackageMetadata | None:
+        """
+        Get the cached metadata for a package, if it has not expired.
+
+        Parameters
+        ----------
+        package_title
+            The title of the package.
+        package_version
+            The version of the package.
+
+        Returns
+        -------
+        JSONPackageMetadata | None
+            The cached metadata, or `None` on a miss.
+        """
+        key = (normalize_package_title(package_title), package_version)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def revalidate(
+        self: Self,
+        package_title: str,
+        package_version: str | None,
+        last_serial: int,
+    ) -> JSONPackageMetadata | None:
+        """
+        Renew a cached entry, even an expired one, if it is still at `last_serial`.
+
+        Parameters
+        ----------
+        package_title
+            The title of the package.
+        package_version
+            The version of the package.
+        last_serial
+            The package's current serial, for example from the `X-PyPI-Last-Serial` header.
+
+        Returns
+        -------
+        JSONPackageMetadata | None
+            The cached metadata if it is current, otherwise `None`.
+        """
+        key = (normalize_package_title(package_title), package_version)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1].last_serial != last_serial:
+                return None
+            self._entries[key] = (time.monotonic(), entry[1])
+            self._entries.move_to_end(key)
+            self._revalidations += 1
+            return entry[1]
+
+    def put(self: Self, package_title: str, package_version: str | None, metadata: JSONPackageMetadata) -> None:
+        """
+        Cache the metadata for a package.
+
+        Metadata older than what is already cached, as can be served by a lagging mirror, is ignored.
+
+        Parameters
+        ----------
+        package_title
+            The title of the package.
+        package_version
+            The version of the package.
+        metadata
+            The metadata to cache.
+        """
+        key = (normalize_package_title(package_title), package_version)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1].last_serial > metadata.last_serial:
+                return
+            self._entries[key] = (time.monotonic(), metadata)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self: Self, package_title: str, last_serial: int | None = None) -> None:
+        """
+        Remove the cached metadata for every version of a package.
+
+        Parameters
+        ----------
+        package_title
+            The title of the package.
+        last_serial
+            If given, only entries older than this serial are removed.
+        """
+        normalized_title = normalize_package_title(package_title)
+        with self._lock:
+            for key, (_, metadata) in list(self._entries.items()):
+                if key[0] == normalized_title and (last_serial is None or metadata.last_serial < last_serial):
+                    del self._entries[key]
+
+    def clear(self: Self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock:
+            self._entries.clear()
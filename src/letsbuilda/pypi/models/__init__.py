@@ -1,11 +1,54 @@
 """Models to hold the data."""
 
-from .models_json import JSONPackageMetadata
-from .models_package import Package
-from .models_rss import RSSPackageMetadata
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .models_changelog import ChangelogEvent
+    from .models_interning import ModelOptions
+    from .models_json import JSONPackageMetadata
+    from .models_package import Package
+    from .models_projection import project_model
+    from .models_rss import RSSPackageMetadata, RSSPackageRecord
+    from .models_simple import SimpleFile, SimpleProject
+
+# The module each public name is imported from when it is first used
+_LAZY_IMPORTS = {
+    "ChangelogEvent": ".models_changelog",
+    "JSONPackageMetadata": ".models_json",
+    "ModelOptions": ".models_interning",
+    "Package": ".models_package",
+    "RSSPackageMetadata": ".models_rss",
+    "RSSPackageRecord": ".models_rss",
+    "SimpleFile": ".models_simple",
+    "SimpleProject": ".models_simple",
+    "project_model": ".models_projection",
+}
 
 __all__ = [
+    "ChangelogEvent",
     "JSONPackageMetadata",
+    "ModelOptions",
     "Package",
     "RSSPackageMetadata",
+    "RSSPackageRecord",
+    "SimpleFile",
+    "SimpleProject",
+    "project_model",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import a model from its module when it is first used."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the package's attributes, including the models not imported yet."""
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,17 @@
+"""Models for changelog responses."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ChangelogEvent(BaseModel):
+    """An event in PyPI's changelog."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    package_title: str
+    package_version: str | None
+    timestamp: datetime
+    action: str
+    serial: int
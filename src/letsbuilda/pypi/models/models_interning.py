@@ -0,0 +1,61 @@
+"""Options trading detail for memory when validating many models, passed as pydantic's validation context."""
+
+import sys
+from collections.abc import Iterable
+from typing import TypedDict
+
+from pydantic import BaseModel, ValidationInfo
+
+
+class ModelOptions(TypedDict, total=False):
+    """
+    Options for validating `JSONPackageMetadata`, passed as the `context` of pydantic's validation methods.
+
+    `intern_strings` interns the strings which repeat across packages, such as classifiers, licenses
+    and Python versions, so that memory grows with the number of distinct values rather than of packages.
+    pydantic already shares short strings decoded from JSON through a bounded cache, so this matters most
+    for long values, such as license texts and classifiers, and for models validated from Python objects.
+    `drop_description` replaces `Info.description`, often the largest field, with an empty string.
+    Clients given options bypass their metadata cache and store, which other clients may share.
+
+    For example, `JSONPackageMetadata.model_validate_json(content, context={"intern_strings": True})`.
+    """
+
+    intern_strings: bool
+    drop_description: bool
+
+
+def intern_fields(model: BaseModel, field_names: Iterable[str], info: ValidationInfo) -> None:
+    """
+    Intern the strings of some fields of a validated model, if the `intern_strings` option is set.
+
+    This runs once per model, rather than once per field, so that validating without the option stays as fast.
+
+    Parameters
+    ----------
+    model
+        The validated model.
+    field_names
+        The fields to intern, each holding a string, a list of strings, or `None`.
+    info
+        The validation info, holding the options as its context.
+    """
+    if not info.context or not info.context.get("intern_strings"):
+        return
+    fields = model.__dict__
+    for field_name in field_names:
+        value = fields[field_name]
+        if isinstance(value, str):
+            fields[field_name] = sys.intern(value)
+        elif isinstance(value, list):
+            fields[field_name] = [sys.intern(item) for item in value]
+
+
+def drop_description(model: BaseModel, info: ValidationInfo) -> None:
+    """
+    Replace the description of a validated model with an empty string, if the `drop_description` option is set.
+
+    The description is still decoded, but not kept, so memory is only needed for one at a time.
+    """
+    if info.context and info.context.get("drop_description"):
+        model.__dict__["description"] = ""
@@ -1,14 +1,39 @@
 """Models for JSON responses."""
 
 from datetime import datetime
-from typing import Literal
-
-from pydantic import BaseModel, Field
+from typing import Final, Literal, Self
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, model_validator
+
+from .models_interning import drop_description, intern_fields
+
+# The fields whose values repeat across packages, which the `intern_strings` option interns
+_URL_INTERNED_FIELDS: Final[tuple[str, ...]] = ("comment_text", "packagetype", "python_version", "requires_python")
+_INFO_INTERNED_FIELDS: Final[tuple[str, ...]] = (
+    "author",
+    "author_email",
+    "classifiers",
+    "description_content_type",
+    "keywords",
+    "license",
+    "license_expression",
+    "license_files",
+    "maintainer",
+    "maintainer_email",
+    "platform",
+    "requires_dist",
+    "requires_python",
+    "version",
+    "yanked_reason",
+    "provides_extra",
+)
 
 
 class Vulnerability(BaseModel):
     """Security vulnerability."""
 
+    model_config = ConfigDict(defer_build=True)
+
     id: str
     aliases: list[str]
     link: str
@@ -22,6 +47,8 @@ class Vulnerability(BaseModel):
 class Downloads(BaseModel):
     """Release download counts."""
 
+    model_config = ConfigDict(defer_build=True)
+
     last_day: int
     last_month: int
     last_week: int
@@ -30,6 +57,8 @@ class Downloads(BaseModel):
 class Digests(BaseModel):
     """URL file digests."""
 
+    model_config = ConfigDict(defer_build=True)
+
     blake2_b_256: str = Field(validation_alias="blake2b_256")
     md5: str
     sha256: str
@@ -38,6 +67,8 @@ class Digests(BaseModel):
 class URL(BaseModel):
     """Package release URL."""
 
+    model_config = ConfigDict(defer_build=True)
+
     comment_text: str
     digests: Digests
     downloads: int
@@ -54,10 +85,18 @@ class URL(BaseModel):
     yanked: bool
     yanked_reason: None
 
+    @model_validator(mode="after")
+    def _intern_strings(self: Self, info: ValidationInfo) -> Self:
+        """Intern repeated strings, if the `intern_strings` option is set."""
+        intern_fields(self, _URL_INTERNED_FIELDS, info)
+        return self
+
 
 class Info(BaseModel):
     """Package metadata internal info block."""
 
+    model_config = ConfigDict(defer_build=True)
+
     author: str
     author_email: str
     bugtrack_url: None
@@ -80,7 +119,7 @@ class Info(BaseModel):
     project_url: str
     project_urls: dict[str, str]
     release_url: str
-    requires_dist: list[str]
+    requires_dist: list[str] | None = None
     requires_python: str
     summary: str
     version: str
@@ -118,10 +157,19 @@ class Info(BaseModel):
     ) = Field(None)
     provides_extra: list[str] | None = Field(None)
 
+    @model_validator(mode="after")
+    def _apply_options(self: Self, info: ValidationInfo) -> Self:
+        """Intern repeated strings and drop the description, if the options are set."""
+        intern_fields(self, _INFO_INTERNED_FIELDS, info)
+        drop_description(self, info)
+        return self
+
 
 class JSONPackageMetadata(BaseModel):
     """Package metadata."""
 
+    model_config = ConfigDict(defer_build=True)
+
     info: Info
     last_serial: int
     urls: list[URL]
@@ -1,11 +1,13 @@
 """Models for package metadata."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class Distribution(BaseModel):
     """Metadata for a distribution."""
 
+    model_config = ConfigDict(defer_build=True)
+
     filename: str
     url: str
 
@@ -13,12 +15,67 @@ class Distribution(BaseModel):
 class Release(BaseModel):
     """Metadata for a release."""
 
+    model_config = ConfigDict(defer_build=True)
+
     version: str
     distributions: list[Distribution]
 
 
+class _PackageInfo(BaseModel):
+    """The fields of the JSON API info block used to build a `Package`."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    name: str
+    version: str
+
+
+class _PackageResponse(BaseModel):
+    """The parts of a JSON API response used to build a `Package`."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    info: _PackageInfo
+    releases: dict[str, list[Distribution]] | None = Field(None)
+    urls: list[Distribution] = Field(default_factory=list)
+
+
+# The distributions are already validated, so releases reuse them rather than validating them again
+_releases_adapter = TypeAdapter(list[Release], config=ConfigDict(defer_build=True))
+
+
 class Package(BaseModel):
     """Metadata for a package."""
 
+    model_config = ConfigDict(defer_build=True)
+
     title: str
     releases: list[Release]
+
+    @classmethod
+    def from_json_api(cls, content: bytes | str) -> "Package":
+        """
+        Build a package from a JSON API response in a single pass.
+
+        Only the fields needed are validated and kept from the response. Releases are in the order of its
+        `releases` map, which PyPI sorts by version. Responses without a `releases` map, such as those
+        for a single version, contain that one release.
+
+        Parameters
+        ----------
+        content
+            The body of the JSON API response.
+
+        Returns
+        -------
+        Package
+            The package.
+        """
+        response = _PackageResponse.model_validate_json(content)
+        distributions = response.releases
+        if distributions is None:
+            distributions = {response.info.version: response.urls}
+        releases = _releases_adapter.validate_python(
+            [{"version": version, "distributions": files} for version, files in distributions.items()],
+        )
+        return cls.model_construct(title=response.info.name, releases=releases)
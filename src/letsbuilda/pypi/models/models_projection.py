@@ -0,0 +1,74 @@
+"""Partial models that only validate and keep selected fields."""
+
+from collections.abc import Iterable
+from copy import copy
+from functools import cache
+from typing import Any, get_args, get_origin
+
+from pydantic import BaseModel, create_model
+
+
+def _as_model(annotation: Any) -> type[BaseModel] | None:  # noqa: ANN401 - any annotation may be inspected
+    """Get the model an annotation refers to, if it is one."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    return None
+
+
+@cache
+def _project_model(model: type[BaseModel], fields: frozenset[str]) -> type[BaseModel]:
+    """Build a projection of a model, caching it for each distinct selection."""
+    selected: dict[str, set[str]] = {}
+    for path in fields:
+        name, _, rest = path.partition(".")
+        if name not in model.model_fields:
+            msg = f"{model.__name__} has no field {name!r}"
+            raise ValueError(msg)
+        nested_paths = selected.setdefault(name, set())
+        # An empty path selects the whole field
+        nested_paths.add(rest)
+
+    definitions: dict[str, Any] = {}
+    for name, field in model.model_fields.items():
+        if name not in selected:
+            continue
+        nested_paths = selected[name]
+        annotation: Any = field.annotation
+        if "" not in nested_paths:
+            if (nested_model := _as_model(annotation)) is not None:
+                annotation = _project_model(nested_model, frozenset(nested_paths))
+            elif get_origin(annotation) is list and (nested_model := _as_model(get_args(annotation)[0])) is not None:
+                annotation = list[_project_model(nested_model, frozenset(nested_paths))]  # type: ignore[misc]
+            else:
+                msg = f"{model.__name__}.{name} has no fields to select"
+                raise ValueError(msg)
+        definitions[name] = (annotation, copy(field))
+    return create_model(f"{model.__name__}Projection", **definitions)
+
+
+def project_model(model: type[BaseModel], fields: Iterable[str]) -> type[BaseModel]:
+    """
+    Build a partial model that only validates and keeps the selected fields.
+
+    Everything else in the input is skipped, so unwanted fields, such as a long `Info.description`,
+    cost neither validation time nor memory. Projections are cached, so repeated calls are cheap.
+
+    Parameters
+    ----------
+    model
+        The model to project.
+    fields
+        Dotted paths of the fields to keep, such as `"info.name"` or `"urls.digests"`.
+        Selecting a field inside a list of models, like `"urls.digests"`, selects it in every item.
+
+    Returns
+    -------
+    type[BaseModel]
+        The partial model.
+
+    Raises
+    ------
+    ValueError
+        If a path does not refer to a field.
+    """
+    return _project_model(model, frozenset(fields))
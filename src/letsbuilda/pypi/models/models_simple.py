@@ -0,0 +1,55 @@
+"""Models for Simple Repository API responses."""
+
+from datetime import datetime
+from typing import Self
+
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field
+
+from .models_package import Distribution
+
+
+class SimpleFile(Distribution):
+    """A file listed by the Simple Repository API (PEP 691)."""
+
+    hashes: dict[str, str]
+    requires_python: str | None = Field(None, alias="requires-python")
+    yanked: bool | str = Field(default=False)
+    dist_info_metadata: bool | dict[str, str] = Field(
+        default=False,
+        validation_alias=AliasChoices("core-metadata", "data-dist-info-metadata"),
+    )
+    gpg_sig: bool | None = Field(None, alias="gpg-sig")
+    size: int | None = Field(None)
+    upload_time: datetime | None = Field(None, alias="upload-time")
+
+    @property
+    def is_yanked(self: Self) -> bool:
+        """Whether the file has been yanked."""
+        return self.yanked is not False
+
+    @property
+    def metadata_url(self: Self) -> str | None:
+        """The URL of the file's core metadata, as described in PEP 658, if it is available."""
+        if self.dist_info_metadata is False:
+            return None
+        return f"{self.url}.metadata"
+
+
+class SimpleProjectMeta(BaseModel):
+    """Metadata about a Simple Repository API response."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    api_version: str = Field(alias="api-version")
+    last_serial: int | None = Field(None, alias="_last-serial")
+
+
+class SimpleProject(BaseModel):
+    """A project as listed by the Simple Repository API (PEP 691)."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    meta: SimpleProjectMeta
+    name: str
+    files: list[SimpleFile]
+    versions: list[str] | None = Field(None)
@@ -0,0 +1,20 @@
+"""Package name handling."""
+
+import re
+
+
+def normalize_package_title(package_title: str) -> str:
+    """
+    Normalize a package title as described in PEP 503.
+
+    Parameters
+    ----------
+    package_title
+        The title of the package.
+
+    Returns
+    -------
+    str
+        The lowercased title, with runs of `-`, `_` and `.` replaced by a single `-`.
+    """
+    return re.sub(r"[-_.]+", "-", package_title).lower()
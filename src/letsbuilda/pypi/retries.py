@@ -0,0 +1,105 @@
+"""Retrying failed requests."""
+
+import random
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from typing import Self
+
+from httpx import Response
+
+THROTTLING_STATUSES = frozenset({HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE})
+
+
+def parse_retry_after(value: str) -> float | None:
+    """
+    Parse a `Retry-After` header.
+
+    Parameters
+    ----------
+    value
+        The header, either a number of seconds or an HTTP date.
+
+    Returns
+    -------
+    float | None
+        The number of seconds to wait, or `None` if the header is malformed.
+    """
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    When and how long to wait before retrying a request.
+
+    Throttled and failed responses, and transport errors, are retried with jittered exponential backoff:
+    each wait is random, up to `backoff_base * 2 ** (attempt - 1)` seconds, capped at `backoff_max`.
+    A `Retry-After` header takes precedence, though it is also capped at `backoff_max`.
+    """
+
+    max_attempts: int = 5
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    retry_statuses: frozenset[int] = frozenset(
+        {
+            HTTPStatus.TOO_MANY_REQUESTS,
+            HTTPStatus.INTERNAL_SERVER_ERROR,
+            HTTPStatus.BAD_GATEWAY,
+            HTTPStatus.SERVICE_UNAVAILABLE,
+            HTTPStatus.GATEWAY_TIMEOUT,
+        },
+    )
+
+    def should_retry(self: Self, attempt: int, response: Response | None) -> bool:
+        """
+        Check whether to retry after an attempt.
+
+        Parameters
+        ----------
+        attempt
+            The number of attempts made so far.
+        response
+            The response to the last attempt, or `None` if it raised a transport error.
+
+        Returns
+        -------
+        bool
+            Whether to make another attempt.
+        """
+        if attempt >= self.max_attempts:
+            return False
+        return response is None or response.status_code in self.retry_statuses
+
+    def delay(self: Self, attempt: int, response: Response | None) -> float:
+        """
+        Get the number of seconds to wait before the next attempt.
+
+        Parameters
+        ----------
+        attempt
+            The number of attempts made so far.
+        response
+            The response to the last attempt, or `None` if it raised a transport error.
+
+        Returns
+        -------
+        float
+            The number of seconds to wait.
+        """
+        if response is not None and "Retry-After" in response.headers:
+            retry_after = parse_retry_after(response.headers["Retry-After"])
+            if retry_after is not None:
+                return min(retry_after, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))  # noqa: S311 - not cryptographic
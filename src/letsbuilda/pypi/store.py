@@ -0,0 +1,426 @@
+"""A local SQLite store of package metadata."""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import Any, Self
+
+from pydantic import ConfigDict, TypeAdapter
+
+from .models import JSONPackageMetadata
+from .models.models_json import URL, Info, Vulnerability
+from .names import normalize_package_title
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS packages (
+    name TEXT PRIMARY KEY,
+    last_serial INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    version TEXT NOT NULL,
+    author TEXT NOT NULL,
+    author_email TEXT NOT NULL,
+    info TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS packages_author ON packages (author);
+CREATE INDEX IF NOT EXISTS packages_author_email ON packages (author_email);
+
+CREATE TABLE IF NOT EXISTS urls (
+    package_name TEXT NOT NULL REFERENCES packages (name) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    filename TEXT NOT NULL,
+    url TEXT NOT NULL,
+    packagetype TEXT NOT NULL,
+    python_version TEXT NOT NULL,
+    requires_python TEXT,
+    size INTEGER NOT NULL,
+    upload_time TEXT NOT NULL,
+    upload_time_iso_8601 TEXT NOT NULL,
+    comment_text TEXT NOT NULL,
+    downloads INTEGER NOT NULL,
+    has_sig INTEGER NOT NULL,
+    md5_digest TEXT NOT NULL,
+    yanked INTEGER NOT NULL,
+    yanked_reason TEXT,
+    blake2b_256 TEXT NOT NULL,
+    md5 TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    PRIMARY KEY (package_name, position)
+);
+CREATE INDEX IF NOT EXISTS urls_filename ON urls (filename);
+CREATE INDEX IF NOT EXISTS urls_sha256 ON urls (sha256);
+
+CREATE TABLE IF NOT EXISTS vulnerabilities (
+    package_name TEXT NOT NULL REFERENCES packages (name) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    id TEXT NOT NULL,
+    aliases TEXT NOT NULL,
+    link TEXT NOT NULL,
+    source TEXT NOT NULL,
+    withdrawn TEXT,
+    summary TEXT NOT NULL,
+    details TEXT NOT NULL,
+    fixed_in TEXT NOT NULL,
+    PRIMARY KEY (package_name, position)
+);
+CREATE INDEX IF NOT EXISTS vulnerabilities_id ON vulnerabilities (id);
+"""
+
+_URL_COLUMNS = (
+    "filename",
+    "url",
+    "packagetype",
+    "python_version",
+    "requires_python",
+    "size",
+    "upload_time",
+    "upload_time_iso_8601",
+    "comment_text",
+    "downloads",
+    "has_sig",
+    "md5_digest",
+    "yanked",
+    "yanked_reason",
+)
+_DIGEST_COLUMNS = ("blake2b_256", "md5", "sha256")
+_VULNERABILITY_COLUMNS = ("id", "aliases", "link", "source", "withdrawn", "summary", "details", "fixed_in")
+
+# SQLite limits the number of parameters in a statement
+_BATCH_SIZE = 500
+
+_urls_adapter = TypeAdapter(list[URL], config=ConfigDict(defer_build=True))
+_vulnerabilities_adapter = TypeAdapter(list[Vulnerability], config=ConfigDict(defer_build=True))
+
+
+def _url_row(package_name: str, position: int, url: URL) -> tuple[Any, ...]:
+    """Flatten a `URL` and its `Digests` into a row."""
+    data = url.model_dump(mode="json")
+    digests = data.pop("digests")
+    return (
+        package_name,
+        position,
+        *(data[column] for column in _URL_COLUMNS),
+        digests["blake2_b_256"],
+        digests["md5"],
+        digests["sha256"],
+    )
+
+
+def _urls_from_rows(rows: list[sqlite3.Row]) -> list[URL]:
+    """Rebuild the `URL`s of some rows."""
+    data = []
+    for row in rows:
+        url = {column: row[column] for column in _URL_COLUMNS}
+        url["digests"] = {column: row[column] for column in _DIGEST_COLUMNS}
+        data.append(url)
+    return _urls_adapter.validate_python(data)
+
+
+def _vulnerability_row(package_name: str, position: int, vulnerability: Vulnerability) -> tuple[Any, ...]:
+    """Flatten a `Vulnerability` into a row."""
+    data = vulnerability.model_dump(mode="json")
+    data["aliases"] = json.dumps(data["aliases"])
+    data["fixed_in"] = json.dumps(data["fixed_in"])
+    return (package_name, position, *(data[column] for column in _VULNERABILITY_COLUMNS))
+
+
+def _vulnerabilities_from_rows(rows: list[sqlite3.Row]) -> list[Vulnerability]:
+    """Rebuild the `Vulnerability`s of some rows."""
+    data = []
+    for row in rows:
+        vulnerability = {column: row[column] for column in _VULNERABILITY_COLUMNS}
+        vulnerability["aliases"] = json.loads(vulnerability["aliases"])
+        vulnerability["fixed_in"] = json.loads(vulnerability["fixed_in"])
+        data.append(vulnerability)
+    return _vulnerabilities_adapter.validate_python(data)
+
+
+class MetadataStore:
+    """
+    A local copy of `JSONPackageMetadata`, persisted in indexed SQLite tables.
+
+    Packages are keyed by their normalized title, and only the latest metadata of each is kept.
+    Writes skip packages whose `last_serial` has not changed. The same instance may be shared by several threads.
+
+    When passed to a client, the store is read before going to the network. Lookups of the latest version
+    are only served from it for `max_age` seconds after the package was last fetched, as nothing else tells
+    the store that a new version was released. `None` serves them until the package is replaced, for stores
+    kept up to date with `sync_changed_packages`. Lookups of the stored version are served however old it is.
+    Its methods block on disk I/O, so the async client calls them in a worker thread.
+    """
+
+    def __init__(self: Self, path: str | os.PathLike[str] = ":memory:", max_age: float | None = 300.0) -> None:
+        self.max_age = max_age
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA foreign_keys = ON")
+            self._connection.executescript(_SCHEMA)
+
+    def __enter__(self: Self) -> Self:
+        """Use the store as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self: Self, *_: object) -> None:
+        """Close the store."""
+        self.close()
+
+    def close(self: Self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def upsert(self: Self, metadata: JSONPackageMetadata) -> bool:
+        """
+        Store the metadata of a package, unless it is already stored at the same or a later serial.
+
+        Parameters
+        ----------
+        metadata
+            The metadata to store.
+
+        Returns
+        -------
+        bool
+            Whether the metadata was written.
+        """
+        return self.upsert_many([metadata]) == 1
+
+    def upsert_many(self: Self, metadata: Iterable[JSONPackageMetadata]) -> int:
+        """
+        Store the metadata of many packages in bulk, skipping those already stored at the same or a later serial.
+
+        Parameters
+        ----------
+        metadata
+            The metadata to store.
+
+        Returns
+        -------
+        int
+            The number of packages written.
+        """
+        written = 0
+        packages = iter(metadata)
+        while batch := list(islice(packages, _BATCH_SIZE)):
+            latest: dict[str, JSONPackageMetadata] = {}
+            for package in batch:
+                name = normalize_package_title(package.info.name)
+                if name not in latest or latest[name].last_serial < package.last_serial:
+                    latest[name] = package
+            with self._lock, self._connection:
+                placeholders = ", ".join("?" * len(latest))
+                stored_serials = dict(
+                    self._connection.execute(
+                        f"SELECT name, last_serial FROM packages WHERE name IN ({placeholders})",  # noqa: S608 - only placeholders are interpolated
+                        list(latest),
+                    ).fetchall(),
+                )
+                changed = {
+                    name: package
+                    for name, package in latest.items()
+                    if stored_serials.get(name, -1) < package.last_serial
+                }
+                stored_at = time.time()
+                # Unchanged packages were just confirmed to be up to date, so are as fresh as those written
+                self._connection.executemany(
+                    "UPDATE packages SET stored_at = ? WHERE name = ?",
+                    [
+                        (stored_at, name)
+                        for name, package in latest.items()
+                        if stored_serials.get(name) == package.last_serial
+                    ],
+                )
+                if not changed:
+                    continue
+                self._connection.executemany(
+                    "INSERT INTO packages (name, last_serial, stored_at, version, author, author_email, info) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (name) DO UPDATE SET last_serial = excluded.last_serial, "
+                    "stored_at = excluded.stored_at, version = excluded.version, "
+                    "author = excluded.author, author_email = excluded.author_email, info = excluded.info",
+                    [
+                        (
+                            name,
+                            package.last_serial,
+                            stored_at,
+                            package.info.version,
+                            package.info.author,
+                            package.info.author_email,
+                            package.info.model_dump_json(),
+                        )
+                        for name, package in changed.items()
+                    ],
+                )
+                self._connection.executemany("DELETE FROM urls WHERE package_name = ?", [(name,) for name in changed])
+                self._connection.executemany(
+                    "DELETE FROM vulnerabilities WHERE package_name = ?",
+                    [(name,) for name in changed],
+                )
+                self._connection.executemany(
+                    f"INSERT INTO urls VALUES ({', '.join('?' * (2 + len(_URL_COLUMNS) + len(_DIGEST_COLUMNS)))})",  # noqa: S608 - only placeholders are interpolated
+                    [
+                        _url_row(name, position, url)
+                        for name, package in changed.items()
+                        for position, url in enumerate(package.urls)
+                    ],
+                )
+                self._connection.executemany(
+                    f"INSERT INTO vulnerabilities VALUES ({', '.join('?' * (2 + len(_VULNERABILITY_COLUMNS)))})",  # noqa: S608 - only placeholders are interpolated
+                    [
+                        _vulnerability_row(name, position, vulnerability)
+                        for name, package in changed.items()
+                        for position, vulnerability in enumerate(package.vulnerabilities)
+                    ],
+                )
+            written += len(changed)
+        return written
+
+    def invalidate(self: Self, package_title: str, last_serial: int | None = None) -> None:
+        """
+        Remove the stored metadata of a package.
+
+        Parameters
+        ----------
+        package_title
+            The title of the package.
+        last_serial
+            If given, the metadata is only removed if it is older than this serial.
+        """
+        self.invalidate_many([(package_title, last_serial)])
+
+    def invalidate_many(self: Self, packages: Iterable[tuple[str, int | None]]) -> None:
+        """
+        Remove the stored metadata of many packages in a single transaction.
+
+        Parameters
+        ----------
+        packages
+            The title of each package, and the serial its metadata must be older than to be removed, or `None`.
+        """
+        removed = [(normalize_package_title(package_title), last_serial) for package_title, last_serial in packages]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM packages WHERE name = ?1 AND (?2 IS NULL OR last_serial < ?2)",
+                removed,
+            )
+
+    def get_last_serial(self: Self, package_title: str) -> int | None:
+        """Get the serial of the stored metadata of a package, if there is any."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT last_serial FROM packages WHERE name = ?",
+                (normalize_package_title(package_title),),
+            ).fetchone()
+        return None if row is None else int(row["last_serial"])
+
+    def get(self: Self, package_title: str, *, max_age: float | None = None) -> JSONPackageMetadata | None:
+        """
+        Get the stored metadata of a package.
+
+        Parameters
+        ----------
+        package_title
+            The title of the package.
+        max_age
+            If given, the metadata is only returned if it was stored or confirmed at most this many seconds ago.
+
+        Returns
+        -------
+        JSONPackageMetadata | None
+            The metadata, or `None` if the package is not stored, or too old.
+        """
+        name = normalize_package_title(package_title)
+        with self._lock:
+            package_row = self._connection.execute(
+                "SELECT last_serial, stored_at, info FROM packages WHERE name = ?",
+                (name,),
+            ).fetchone()
+            if package_row is None or (max_age is not None and time.time() - package_row["stored_at"] > max_age):
+                return None
+            url_rows = self._connection.execute(
+                "SELECT * FROM urls WHERE package_name = ? ORDER BY position",
+                (name,),
+            ).fetchall()
+            vulnerability_rows = self._connection.execute(
+                "SELECT * FROM vulnerabilities WHERE package_name = ? ORDER BY position",
+                (name,),
+            ).fetchall()
+        return JSONPackageMetadata(
+            info=Info.model_validate_json(package_row["info"]),
+            last_serial=package_row["last_serial"],
+            urls=_urls_from_rows(url_rows),
+            vulnerabilities=_vulnerabilities_from_rows(vulnerability_rows),
+        )
+
+    def _find_urls(self: Self, column: str, value: str) -> list[tuple[str, URL]]:
+        """Find the files whose indexed column has a value."""
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT * FROM urls WHERE {column} = ? ORDER BY package_name, position",  # noqa: S608 - column is never user input
+                (value,),
+            ).fetchall()
+        return list(zip((row["package_name"] for row in rows), _urls_from_rows(rows), strict=True))
+
+    def find_by_sha256(self: Self, sha256: str) -> list[tuple[str, URL]]:
+        """
+        Find the files with a SHA-256 digest.
+
+        Parameters
+        ----------
+        sha256
+            The hex digest.
+
+        Returns
+        -------
+        list[tuple[str, URL]]
+            The normalized title of the package and the file, for each match.
+        """
+        return self._find_urls("sha256", sha256.lower())
+
+    def find_by_filename(self: Self, filename: str) -> list[tuple[str, URL]]:
+        """
+        Find the files with a filename.
+
+        Parameters
+        ----------
+        filename
+            The filename.
+
+        Returns
+        -------
+        list[tuple[str, URL]]
+            The normalized title of the package and the file, for each match.
+        """
+        return self._find_urls("filename", filename)
+
+    def find_by_author(self: Self, author: str) -> list[Info]:
+        """
+        Find the packages by an author, matching either the author's name or email.
+
+        Parameters
+        ----------
+        author
+            The author's name or email, as it appears in the metadata.
+
+        Returns
+        -------
+        list[Info]
+            The info block of each matching package.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT info FROM packages WHERE author = ? UNION SELECT info FROM packages WHERE author_email = ?",
+                (author, author),
+            ).fetchall()
+        return [Info.model_validate_json(row["info"]) for row in rows]
+
+    def __iter__(self: Self) -> Iterator[str]:
+        """Iterate over the normalized titles of the stored packages."""
+        with self._lock:
+            names = [row["name"] for row in self._connection.execute("SELECT name FROM packages ORDER BY name")]
+        return iter(names)
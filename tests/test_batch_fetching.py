@@ -0,0 +1,45 @@
+"""Test fetching metadata for many packages at once."""
+
+import asyncio
+
+import httpx
+from sample_data import JSON_API_DATA
+
+from letsbuilda.pypi import JSONPackageMetadata, PackageNotFoundError, PyPIServices
+from letsbuilda.pypi.async_client import PyPIServices as AsyncPyPIServices
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    """Serve the sample metadata for every package except `missing`."""
+    if request.url.path.startswith("/pypi/missing/"):
+        return httpx.Response(404)
+    return httpx.Response(200, json=JSON_API_DATA)
+
+
+def test_async_batch_reports_missing_packages_without_cancelling() -> None:
+    """Confirm a missing package is reported per item and the rest of the batch completes."""
+
+    async def collect() -> list[tuple[str, str | None, JSONPackageMetadata | PackageNotFoundError]]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as http_client:
+            pypi_client = AsyncPyPIServices(http_client)
+            packages = [("letsbuilda-pypi", None), ("missing", None), ("letsbuilda-pypi", "4.0.0")]
+            return [result async for result in pypi_client.get_many_json_metadata(packages, max_concurrency=2)]
+
+    results = asyncio.run(collect())
+
+    assert len(results) == 3  # noqa: PLR2004 - one result per input
+    by_title = {(title, version): result for title, version, result in results}
+    assert isinstance(by_title["missing", None], PackageNotFoundError)
+    assert isinstance(by_title["letsbuilda-pypi", "4.0.0"], JSONPackageMetadata)
+
+
+def test_sync_batch_preserves_input_order() -> None:
+    """Confirm ordered sync batches yield results in input order."""
+    with httpx.Client(transport=httpx.MockTransport(_handler)) as http_client:
+        pypi_client = PyPIServices(http_client)
+        packages = [("letsbuilda-pypi", None), ("missing", None), ("letsbuilda-pypi", "4.0.0")]
+        results = list(pypi_client.get_many_json_metadata(packages, max_workers=2))
+
+    assert [(title, version) for title, version, _ in results] == packages
+    assert isinstance(results[0][2], JSONPackageMetadata)
+    assert isinstance(results[1][2], PackageNotFoundError)
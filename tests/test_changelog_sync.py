@@ -0,0 +1,69 @@
+"""Test syncing changed packages from PyPI's changelog."""
+
+import asyncio
+import xmlrpc.client
+from pathlib import Path
+
+import httpx
+from sample_data import JSON_API_DATA
+
+from letsbuilda.pypi import JSONPackageMetadata, PackageNotFoundError, PyPIServices, SerialCheckpoint
+from letsbuilda.pypi.async_client import PyPIServices as AsyncPyPIServices
+
+CHANGELOG = [
+    ("letsbuilda-pypi", "4.0.0", 1682476803, "new release", 101),
+    ("removed-package", None, 1682476804, "remove project", 102),
+    ("letsbuilda-pypi", "4.0.0", 1682476805, "add py3 file letsbuilda_pypi-4.0.0-py3-none-any.whl", 103),
+]
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    """Stand in for PyPI's XML-RPC and JSON APIs."""
+    if request.method == "POST":
+        params, method_name = xmlrpc.client.loads(request.content)
+        if method_name == "changelog_last_serial":
+            result: object = CHANGELOG[-1][-1]
+        else:
+            (serial,) = params
+            result = [list(event) for event in CHANGELOG if event[-1] > serial]
+        content = xmlrpc.client.dumps((result,), methodresponse=True, allow_none=True)
+        return httpx.Response(200, content=content.encode())
+    if request.url.path == "/pypi/letsbuilda-pypi/json":
+        return httpx.Response(200, json=JSON_API_DATA)
+    return httpx.Response(404)
+
+
+def test_new_checkpoint_starts_at_latest_serial(tmp_path: Path) -> None:
+    """Confirm the first sync only records where to start from."""
+    checkpoint = SerialCheckpoint(tmp_path / "serial")
+    with httpx.Client(transport=httpx.MockTransport(_handler)) as http_client:
+        assert list(PyPIServices(http_client).sync_changed_packages(checkpoint)) == []
+
+    assert checkpoint.load() == 103  # noqa: PLR2004 - the latest serial
+
+
+def test_changed_packages_are_fetched_once(tmp_path: Path) -> None:
+    """Confirm each changed package is fetched once and the checkpoint advances."""
+    checkpoint = SerialCheckpoint(tmp_path / "serial")
+    checkpoint.save(100)
+    with httpx.Client(transport=httpx.MockTransport(_handler)) as http_client:
+        results = dict(PyPIServices(http_client).sync_changed_packages(checkpoint))
+
+    assert list(results) == ["removed-package", "letsbuilda-pypi"]
+    assert isinstance(results["removed-package"], PackageNotFoundError)
+    assert isinstance(results["letsbuilda-pypi"], JSONPackageMetadata)
+    assert checkpoint.load() == 103  # noqa: PLR2004 - the latest serial
+
+
+def test_async_sync_resumes_from_checkpoint(tmp_path: Path) -> None:
+    """Confirm only events after the checkpoint are processed."""
+    checkpoint = SerialCheckpoint(tmp_path / "serial")
+    checkpoint.save(102)
+
+    async def collect() -> list[str]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as http_client:
+            pypi_client = AsyncPyPIServices(http_client)
+            return [package_title async for package_title, _ in pypi_client.sync_changed_packages(checkpoint)]
+
+    assert asyncio.run(collect()) == ["letsbuilda-pypi"]
+    assert checkpoint.load() == 103  # noqa: PLR2004 - the latest serial
@@ -0,0 +1,40 @@
+"""Test creating clients with tuned HTTP clients."""
+
+import asyncio
+
+import httpx
+
+from letsbuilda.pypi import MetadataCache, PyPIServices
+from letsbuilda.pypi.async_client import PyPIServices as AsyncPyPIServices
+from letsbuilda.pypi.http_clients import DEFAULT_LIMITS
+
+
+def test_created_clients_are_closed_on_exit() -> None:
+    """Confirm created clients own their HTTP client, and pass other options through."""
+    metadata_cache = MetadataCache()
+    with PyPIServices.create(metadata_cache=metadata_cache) as pypi_client:
+        http_client = pypi_client.http_client
+        assert pypi_client.metadata_cache is metadata_cache
+        assert http_client.headers["User-Agent"].startswith("letsbuilda-pypi/")
+        assert http_client.timeout.connect == 10.0  # noqa: PLR2004
+        assert not http_client.is_closed
+    assert http_client.is_closed
+
+
+def test_created_async_clients_are_closed_on_exit() -> None:
+    """Confirm created async clients own their HTTP client."""
+
+    async def create() -> httpx.AsyncClient:
+        async with AsyncPyPIServices.create(http2=False, limits=DEFAULT_LIMITS) as pypi_client:
+            assert not pypi_client.http_client.is_closed
+            return pypi_client.http_client
+
+    assert asyncio.run(create()).is_closed
+
+
+def test_passed_in_clients_are_left_open() -> None:
+    """Confirm HTTP clients passed in by the caller are not closed with the client."""
+    with httpx.Client() as http_client:
+        with PyPIServices(http_client):
+            pass
+        assert not http_client.is_closed
@@ -0,0 +1,128 @@
+"""Test crawling dependency graphs."""
+
+import asyncio
+import copy
+
+import httpx
+import pytest
+from sample_data import JSON_API_DATA
+
+from letsbuilda.pypi import AsyncDependencyCrawler, DependencyCrawler, DependencyGraph, PyPIServices
+from letsbuilda.pypi.async_client import PyPIServices as AsyncPyPIServices
+
+ENVIRONMENT = {
+    "implementation_name": "cpython",
+    "implementation_version": "3.12.0",
+    "os_name": "posix",
+    "platform_machine": "x86_64",
+    "platform_python_implementation": "CPython",
+    "platform_release": "",
+    "platform_system": "Linux",
+    "platform_version": "",
+    "python_full_version": "3.12.0",
+    "python_version": "3.12",
+    "sys_platform": "linux",
+}
+
+REQUIRES_DIST: dict[str, list[str] | None] = {
+    "app": ["Web-Framework>=2", "tomli; python_version < '3.11'", "colorama; sys_platform == 'win32'", "!!invalid"],
+    "web-framework": ["routing", "json-tools[fast]", "server; extra == 'serve'"],
+    "routing": ["json-tools"],
+    "json-tools": ["speedups; extra == 'fast'", "app"],
+    "speedups": None,
+    "server": ["routing"],
+    "tomli": None,
+    "colorama": None,
+}
+
+
+def _handler(requests: list[str]) -> httpx.MockTransport:
+    """Build a transport serving the JSON API for the packages in `REQUIRES_DIST`, counting requests."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        package_name = request.url.path.split("/")[2]
+        requests.append(package_name)
+        if package_name not in REQUIRES_DIST:
+            return httpx.Response(404)
+        data = copy.deepcopy(JSON_API_DATA)
+        data["info"] |= {"name": package_name, "version": "1.0", "requires_dist": REQUIRES_DIST[package_name]}
+        return httpx.Response(200, json=data)
+
+    return httpx.MockTransport(handler)
+
+
+def test_graphs_follow_markers_and_extras() -> None:
+    """Confirm markers are evaluated, extras are followed, cycles end, and nodes are deduplicated."""
+    requests: list[str] = []
+    with httpx.Client(transport=_handler(requests)) as http_client:
+        graph = DependencyCrawler(PyPIServices(http_client), ENVIRONMENT).crawl(["app", "missing"])
+
+    assert set(graph.edges()) == {
+        ("app", "web-framework"),
+        ("web-framework", "routing"),
+        ("web-framework", "json-tools"),
+        ("routing", "json-tools"),
+        ("json-tools", "speedups"),
+        ("json-tools", "app"),
+    }
+    assert graph.depths == {"app": 0, "missing": 0, "web-framework": 1, "routing": 2, "json-tools": 2, "speedups": 3}
+    assert graph.extras["json-tools"] == {"fast"}
+    assert graph.not_found == {"missing"}
+    assert sorted(requests) == sorted(graph.depths)
+
+
+def test_new_extras_expand_known_packages() -> None:
+    """Confirm a package required again with more extras is expanded again, without being fetched again."""
+    requests: list[str] = []
+    with httpx.Client(transport=_handler(requests)) as http_client:
+        graph = DependencyCrawler(PyPIServices(http_client), ENVIRONMENT).crawl(["web-framework", "app"])
+
+    assert graph.extras["web-framework"] == frozenset()
+    assert ("web-framework", "server") not in set(graph.edges())
+    assert requests.count("web-framework") == 1
+
+    with httpx.Client(transport=_handler([])) as http_client:
+        graph = DependencyCrawler(PyPIServices(http_client), ENVIRONMENT).crawl(["routing", "web-framework[serve]"])
+
+    assert ("web-framework", "server") in set(graph.edges())
+    assert graph.depths["server"] == 1
+
+
+def test_depth_limits_and_metadata_reuse() -> None:
+    """Confirm crawls stop at `max_depth`, and a crawler reuses the metadata it has fetched."""
+    requests: list[str] = []
+
+    async def crawl() -> tuple[int, int]:
+        async with httpx.AsyncClient(transport=_handler(requests)) as http_client:
+            crawler = AsyncDependencyCrawler(AsyncPyPIServices(http_client), ENVIRONMENT)
+            shallow = await crawler.crawl(["app"], max_depth=1, max_concurrency=2)
+            deep = await crawler.crawl(["app"])
+            return len(shallow), len(deep)
+
+    shallow_size, deep_size = asyncio.run(crawl())
+
+    assert shallow_size == 2  # noqa: PLR2004
+    assert deep_size == 5  # noqa: PLR2004
+    assert sorted(requests) == ["app", "json-tools", "routing", "speedups", "web-framework"]
+
+
+def test_packages_in_the_same_level_are_expanded_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Confirm a package required by another in its own level is not expanded again in the next."""
+    levels: list[list[str]] = []
+    expand = DependencyCrawler._expand  # noqa: SLF001 - counting expansions
+
+    def counting_expand(
+        self: DependencyCrawler,
+        graph: DependencyGraph,
+        level: dict[str, frozenset[str]],
+        depth: int,
+        max_depth: int | None,
+    ) -> dict[str, frozenset[str]]:
+        levels.append(list(level))
+        return expand(self, graph, level, depth, max_depth)
+
+    monkeypatch.setattr(DependencyCrawler, "_expand", counting_expand)
+    with httpx.Client(transport=_handler([])) as http_client:
+        DependencyCrawler(PyPIServices(http_client), ENVIRONMENT).crawl(["app", "web-framework"])
+
+    assert levels == [["app", "web-framework"], ["routing", "json-tools"], ["speedups"]]
@@ -0,0 +1,153 @@
+"""Test downloading and verifying distribution files."""
+
+import asyncio
+import hashlib
+import io
+import time
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+
+import httpx
+import pytest
+from sample_data import JSON_API_DATA
+
+from letsbuilda.pypi import (
+    AsyncBandwidthLimiter,
+    BandwidthLimiter,
+    DigestMismatchError,
+    JSONPackageMetadata,
+    PyPIServices,
+    RetryPolicy,
+)
+from letsbuilda.pypi.async_client import PyPIServices as AsyncPyPIServices
+from letsbuilda.pypi.models.models_json import URL
+
+FILE_CONTENT = bytes(range(256)) * 1000
+
+
+def _url_entry(content: bytes = FILE_CONTENT, filename: str = "example-1.0-py3-none-any.whl") -> URL:
+    """Build a JSON API file entry describing some content."""
+    url = JSONPackageMetadata.model_validate(JSON_API_DATA).urls[0]
+    return url.model_copy(
+        update={
+            "filename": filename,
+            "url": f"https://files.pythonhosted.org/packages/{filename}",
+            "size": len(content),
+            "digests": url.digests.model_copy(
+                update={
+                    "sha256": hashlib.sha256(content).hexdigest(),
+                    "blake2_b_256": hashlib.blake2b(content, digest_size=32).hexdigest(),
+                },
+            ),
+        },
+    )
+
+
+def _range_handler(requests: list[httpx.Request], *, honour_range: bool = True) -> httpx.MockTransport:
+    """Build a transport serving the file content, honouring range requests unless told not to."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if honour_range and "Range" in request.headers:
+            start = int(request.headers["Range"].removeprefix("bytes=").removesuffix("-"))
+            return httpx.Response(206, content=FILE_CONTENT[start:])
+        return httpx.Response(200, content=FILE_CONTENT)
+
+    return httpx.MockTransport(handler)
+
+
+def test_interrupted_downloads_are_resumed(tmp_path: Path) -> None:
+    """Confirm a `.part` file is resumed with a range request, then verified and renamed."""
+    (tmp_path / "example-1.0-py3-none-any.whl.part").write_bytes(FILE_CONTENT[:1000])
+    requests: list[httpx.Request] = []
+    with httpx.Client(transport=_range_handler(requests)) as http_client:
+        path = PyPIServices(http_client).download_file(_url_entry(), tmp_path)
+
+    assert path == tmp_path / "example-1.0-py3-none-any.whl"
+    assert path.read_bytes() == FILE_CONTENT
+    assert [request.headers.get("Range") for request in requests] == ["bytes=1000-"]
+    assert not (tmp_path / "example-1.0-py3-none-any.whl.part").exists()
+
+
+def test_ignored_ranges_skip_what_was_already_written(tmp_path: Path) -> None:
+    """Confirm a server ignoring the range still produces the right file."""
+    (tmp_path / "example-1.0-py3-none-any.whl.part").write_bytes(FILE_CONTENT[:1000])
+    with httpx.Client(transport=_range_handler([], honour_range=False)) as http_client:
+        path = PyPIServices(http_client).download_file(_url_entry(), tmp_path, chunk_size=300)
+
+    assert path.read_bytes() == FILE_CONTENT
+
+
+def test_dropped_transfers_are_retried_from_where_they_stopped() -> None:
+    """Confirm a transfer failing partway is retried with a range request, and streamed to the sink."""
+    requests: list[httpx.Request] = []
+
+    def failing_stream() -> Iterator[bytes]:
+        yield FILE_CONTENT[:5000]
+        msg = "connection reset"
+        raise httpx.ReadError(msg)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if len(requests) == 1:
+            return httpx.Response(200, content=failing_stream())
+        return httpx.Response(206, content=FILE_CONTENT[5000:])
+
+    sink = io.BytesIO()
+    with httpx.Client(transport=httpx.MockTransport(handler)) as http_client:
+        pypi_client = PyPIServices(http_client, retry_policy=RetryPolicy(backoff_base=0))
+        pypi_client.download(_url_entry(), sink.write, chunk_size=1000)
+
+    assert sink.getvalue() == FILE_CONTENT
+    assert requests[1].headers["Range"] == "bytes=5000-"
+
+
+def test_mismatched_downloads_are_reported(tmp_path: Path) -> None:
+    """Confirm files not matching their digests are reported and deleted."""
+    corrupt_entry = _url_entry(content=b"something else", filename="corrupt-1.0.tar.gz")
+    requests: list[httpx.Request] = []
+
+    async def download() -> list[tuple[URL, Path | DigestMismatchError]]:
+        async with httpx.AsyncClient(transport=_range_handler(requests)) as http_client:
+            pypi_client = AsyncPyPIServices(http_client)
+            return [
+                result
+                async for result in pypi_client.download_files(
+                    [_url_entry(), corrupt_entry],
+                    tmp_path,
+                    bandwidth_limiter=AsyncBandwidthLimiter(100_000_000),
+                )
+            ]
+
+    results = {url.filename: result for url, result in asyncio.run(download())}
+
+    assert results["example-1.0-py3-none-any.whl"] == tmp_path / "example-1.0-py3-none-any.whl"
+    error = results["corrupt-1.0.tar.gz"]
+    assert isinstance(error, DigestMismatchError)
+    assert error.algorithm == "sha256"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["example-1.0-py3-none-any.whl"]
+
+
+def test_mismatched_sink_downloads_raise() -> None:
+    """Confirm streaming a file that does not match its digests raises."""
+
+    async def stream() -> AsyncIterator[bytes]:
+        yield FILE_CONTENT
+
+    async def download() -> None:
+        transport = httpx.MockTransport(lambda _: httpx.Response(200, content=stream()))
+        async with httpx.AsyncClient(transport=transport) as http_client:
+            await AsyncPyPIServices(http_client).download(_url_entry(content=b""), io.BytesIO().write)
+
+    with pytest.raises(DigestMismatchError):
+        asyncio.run(download())
+
+
+def test_bandwidth_is_capped() -> None:
+    """Confirm the bandwidth limiter waits once its burst is used up."""
+    limiter = BandwidthLimiter(1_000_000, burst=10_000)
+    start = time.monotonic()
+    limiter.consume(10_000)
+    limiter.consume(50_000)
+
+    assert time.monotonic() - start >= 0.04  # noqa: PLR2004 - 50 kB at 1 MB/s
@@ -0,0 +1,100 @@
+"""Test streaming exports of package metadata."""
+
+import asyncio
+import io
+import json
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+from sample_data import JSON_API_DATA, NEW_PACKAGE_DATA, UPDATED_PACKAGE_DATA
+
+from letsbuilda.pypi import (
+    JSONPackageMetadata,
+    NDJSONExporter,
+    ParquetExporter,
+    RSSPackageMetadata,
+    RSSPackageRecord,
+)
+
+METADATA = JSONPackageMetadata.model_validate(JSON_API_DATA)
+
+
+class _CountingBuffer(io.BytesIO):
+    """A buffer counting how many times it is written to."""
+
+    writes = 0
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        self.writes += 1
+        return super().write(data)
+
+
+def test_ndjson_is_written_in_chunks() -> None:
+    """Confirm models are written a chunk at a time, one per line."""
+    output = _CountingBuffer()
+    with NDJSONExporter(output, chunk_size=4) as exporter:
+        assert exporter.write_all(METADATA for _ in range(10)) == 10  # noqa: PLR2004
+        assert output.writes == 2  # noqa: PLR2004
+    lines = output.getvalue().splitlines()
+
+    assert output.writes == 3  # noqa: PLR2004
+    assert len(lines) == 10  # noqa: PLR2004
+    assert json.loads(lines[-1]) == METADATA.model_dump(mode="json")
+
+
+def test_ndjson_serializes_models_as_they_are_exported() -> None:
+    """Confirm models are serialized when written, rather than held until their chunk is written out."""
+    output = io.BytesIO()
+    metadata = METADATA.model_copy(deep=True)
+    with NDJSONExporter(output) as exporter:
+        exporter.write(metadata)
+        metadata.info.name = "changed-after-export"
+
+    assert json.loads(output.getvalue())["info"]["name"] == "letsbuilda-pypi"
+
+
+def test_ndjson_exports_async_feeds(tmp_path: Path) -> None:
+    """Confirm models and compact records from an asynchronous iterator are exported to a path."""
+
+    async def feed() -> AsyncIterator[RSSPackageMetadata | RSSPackageRecord]:
+        yield RSSPackageMetadata.model_validate(NEW_PACKAGE_DATA)
+        yield RSSPackageRecord.from_rss_item(UPDATED_PACKAGE_DATA)
+
+    async def export() -> int:
+        with NDJSONExporter(tmp_path / "feed.ndjson") as exporter:
+            return await exporter.awrite_all(feed())
+
+    assert asyncio.run(export()) == 2  # noqa: PLR2004
+    versions = [json.loads(line)["version"] for line in (tmp_path / "feed.ndjson").read_text().splitlines()]
+    assert versions == [None, "1.0.0"]
+
+
+def test_parquet_flattens_info_and_urls(tmp_path: Path) -> None:
+    """Confirm JSON metadata is exported as a row group per chunk, with a row per release file."""
+    parquet = pytest.importorskip("pyarrow.parquet")
+    packages = [METADATA, METADATA.model_copy(update={"urls": []})] * 3
+    with ParquetExporter(tmp_path / "packages.parquet", JSONPackageMetadata, chunk_size=2) as exporter:
+        exporter.write_all(packages)
+
+    table = parquet.read_table(tmp_path / "packages.parquet")
+    file_count = len(METADATA.urls)
+    assert parquet.ParquetFile(tmp_path / "packages.parquet").num_row_groups == 3  # noqa: PLR2004
+    assert table.num_rows == 3 * (file_count + 1)
+    assert table.column("name").to_pylist()[0] == "letsbuilda-pypi"
+    assert table.column("file_sha256").to_pylist()[: file_count + 1] == [
+        *(url.digests.sha256 for url in METADATA.urls),
+        None,
+    ]
+    assert dict(table.column("project_urls").to_pylist()[0]) == METADATA.info.project_urls
+
+
+def test_parquet_rejects_other_models(tmp_path: Path) -> None:
+    """Confirm models not matching the file's schema are rejected, and RSS records are accepted."""
+    parquet = pytest.importorskip("pyarrow.parquet")
+    with ParquetExporter(tmp_path / "feed.parquet", RSSPackageMetadata) as exporter:
+        exporter.write(RSSPackageRecord.from_rss_item(UPDATED_PACKAGE_DATA))
+        with pytest.raises(TypeError):
+            exporter.write(METADATA)
+
+    assert parquet.read_table(tmp_path / "feed.parquet").column("author").to_pylist() == ["test-author@example.com"]
@@ -0,0 +1,120 @@
+"""Test incrementally polling the RSS feeds."""
+
+import asyncio
+from collections.abc import Callable, Iterator
+
+import httpx
+import pytest
+from pydantic import ValidationError
+from sample_data import build_feed
+
+from letsbuilda.pypi import FeedState, PyPIServices
+from letsbuilda.pypi.async_client import PyPIServices as AsyncPyPIServices
+
+
+def test_only_new_entries_are_returned() -> None:
+    """Confirm entries already seen are skipped, and unchanged feeds are revalidated."""
+    feeds = iter([build_feed("b", "a"), build_feed("d", "c", "b", "a"), None])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        feed = next(feeds)
+        if feed is None:
+            assert request.headers["If-None-Match"] == '"2"'
+            return httpx.Response(304)
+        return httpx.Response(200, text=feed, headers={"ETag": '"2"'})
+
+    feed_state = FeedState()
+    with httpx.Client(transport=httpx.MockTransport(handler)) as http_client:
+        pypi_client = PyPIServices(http_client)
+        first_poll = pypi_client.get_new_rss_entries(pypi_client.NEWEST_PACKAGES_FEED_URL, feed_state)
+        second_poll = pypi_client.get_new_rss_entries(pypi_client.NEWEST_PACKAGES_FEED_URL, feed_state)
+        third_poll = pypi_client.get_new_rss_entries(pypi_client.NEWEST_PACKAGES_FEED_URL, feed_state)
+
+    assert [package.title for package in first_poll] == ["a", "b"]
+    assert [package.title for package in second_poll] == ["c", "d"]
+    assert third_poll == []
+
+
+def _failing_then_changed_handler(first: httpx.Response) -> Callable[[httpx.Request], httpx.Response]:
+    """Serve a poll that fails, then the feed, answering requests revalidated against their shared ETag as unchanged."""
+    responses = iter([first, httpx.Response(200, text=build_feed("b", "a"), headers={"ETag": '"1"'})])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-None-Match") == '"1"':
+            return httpx.Response(304)
+        return next(responses)
+
+    return handler
+
+
+def test_failed_polls_are_repeated() -> None:
+    """Confirm a poll failing partway through is not remembered, so its entries are returned by the next poll."""
+    feed = build_feed("b", "a").encode()
+
+    def failing_stream() -> Iterator[bytes]:
+        yield feed[: len(feed) // 2]
+        msg = "connection reset"
+        raise httpx.ReadError(msg)
+
+    handler = _failing_then_changed_handler(httpx.Response(200, content=failing_stream(), headers={"ETag": '"1"'}))
+    feed_state = FeedState()
+    with httpx.Client(transport=httpx.MockTransport(handler)) as http_client:
+        pypi_client = PyPIServices(http_client)
+        with pytest.raises(httpx.ReadError):
+            pypi_client.get_new_rss_entries(pypi_client.NEWEST_PACKAGES_FEED_URL, feed_state)
+        second_poll = pypi_client.get_new_rss_entries(pypi_client.NEWEST_PACKAGES_FEED_URL, feed_state)
+
+    assert [package.title for package in second_poll] == ["a", "b"]
+
+    invalid_feed = build_feed("b", "a").replace("<pubDate>", "<pubDate>not a date", 1)
+    handler = _failing_then_changed_handler(httpx.Response(200, text=invalid_feed, headers={"ETag": '"1"'}))
+
+    async def poll_twice() -> list[str]:
+        feed_state = FeedState()
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+            pypi_client = AsyncPyPIServices(http_client)
+            with pytest.raises(ValidationError):
+                await pypi_client.get_new_rss_entries(pypi_client.NEWEST_PACKAGES_FEED_URL, feed_state)
+            second_poll = await pypi_client.get_new_rss_entries(pypi_client.NEWEST_PACKAGES_FEED_URL, feed_state)
+        return [package.title for package in second_poll]
+
+    assert asyncio.run(poll_twice()) == ["a", "b"]
+
+
+def test_async_poller_yields_new_entries() -> None:
+    """Confirm the async poller yields each entry once."""
+    feeds = iter([build_feed("a"), build_feed("a"), build_feed("b", "a")])
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=next(feeds))
+
+    async def collect() -> list[str]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+            pypi_client = AsyncPyPIServices(http_client)
+            poller = pypi_client.poll_rss_feed(pypi_client.NEWEST_PACKAGES_FEED_URL, interval=0)
+            return [(await anext(poller)).title, (await anext(poller)).title]
+
+    assert asyncio.run(collect()) == ["a", "b"]
+
+
+def test_feed_state_is_bounded() -> None:
+    """Confirm the oldest keys are forgotten."""
+    feed_state = FeedState(max_seen=2)
+    for key in "abc":
+        feed_state.mark_seen(key)
+
+    assert not feed_state.has_seen("a")
+    assert feed_state.has_seen("c")
+
+
+def test_whole_feed_is_streamed() -> None:
+    """Confirm the full feed is parsed from a chunked response."""
+    feed = build_feed("c", "b", "a").encode()
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=httpx.ByteStream(feed))
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as http_client:
+        packages = PyPIServices(http_client).get_rss_feed(PyPIServices.NEWEST_PACKAGES_FEED_URL)
+
+    assert [package.title for package in packages] == ["c", "b", "a"]
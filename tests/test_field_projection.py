@@ -0,0 +1,44 @@
+"""Test fetching partial models of package metadata."""
+
+import httpx
+import pytest
+from sample_data import JSON_API_DATA
+
+from letsbuilda.pypi import JSONPackageMetadata, PyPIServices, project_model
+
+
+def test_projection_keeps_only_selected_fields() -> None:
+    """Confirm unselected fields are neither validated nor kept."""
+    projection = project_model(JSONPackageMetadata, {"info.name", "urls.digests.blake2_b_256"})
+
+    model = projection.model_validate(JSON_API_DATA)
+
+    assert model.model_dump() == {
+        "info": {"name": "letsbuilda-pypi"},
+        "urls": [
+            {"digests": {"blake2_b_256": "cb63f897bdaa98710f9cb96ca1391742192975a776dc70a5a7b0acfbab50b20b"}},
+            {"digests": {"blake2_b_256": "71a0d9b47f7a17efb1d296d189ae83c5381c80efa0e0984a96cb2f719136797e"}},
+        ],
+    }
+    assert projection is project_model(JSONPackageMetadata, ["urls.digests.blake2_b_256", "info.name"])
+
+
+def test_projection_rejects_unknown_fields() -> None:
+    """Confirm typos in field paths are reported."""
+    with pytest.raises(ValueError, match="no field 'nmae'"):
+        project_model(JSONPackageMetadata, {"info.nmae"})
+    with pytest.raises(ValueError, match="no fields to select"):
+        project_model(JSONPackageMetadata, {"last_serial.value"})
+
+
+def test_client_returns_projection() -> None:
+    """Confirm the client validates the response into the projection."""
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=JSON_API_DATA)
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as http_client:
+        pypi_client = PyPIServices(http_client)
+        model = pypi_client.get_package_json_metadata("letsbuilda-pypi", fields={"info.version", "last_serial"})
+
+    assert model.model_dump() == {"info": {"version": "4.0.0"}, "last_serial": 18988479}
@@ -0,0 +1,94 @@
+"""Test the on-disk HTTP cache."""
+
+import asyncio
+import threading
+from pathlib import Path
+
+import httpx
+from sample_data import JSON_API_DATA
+
+from letsbuilda.pypi import HTTPCache, PyPIServices
+from letsbuilda.pypi.async_client import PyPIServices as AsyncPyPIServices
+
+ETAG = '"v1"'
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    """Serve the sample metadata, honouring `If-None-Match`."""
+    if request.headers.get("If-None-Match") == ETAG:
+        return httpx.Response(304, headers={"ETag": ETAG})
+    return httpx.Response(200, json=JSON_API_DATA, headers={"ETag": ETAG})
+
+
+def test_not_modified_responses_are_served_from_disk(tmp_path: Path) -> None:
+    """Confirm a revalidated response is rebuilt from the cache by both clients."""
+    http_cache = HTTPCache(tmp_path)
+    statuses: list[int] = []
+
+    def recording_handler(request: httpx.Request) -> httpx.Response:
+        response = _handler(request)
+        statuses.append(response.status_code)
+        return response
+
+    with httpx.Client(transport=httpx.MockTransport(recording_handler)) as http_client:
+        pypi_client = PyPIServices(http_client, http_cache=http_cache)
+        first = pypi_client.get_package_json_metadata("letsbuilda-pypi")
+        second = pypi_client.get_package_json_metadata("letsbuilda-pypi")
+
+    async def fetch_async() -> None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(recording_handler)) as http_client:
+            pypi_client = AsyncPyPIServices(http_client, http_cache=http_cache)
+            assert await pypi_client.get_package_json_metadata("letsbuilda-pypi") == first
+
+    asyncio.run(fetch_async())
+
+    assert statuses == [200, 304, 304]
+    assert first == second
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    """Confirm the cache stays within its size bound."""
+    with httpx.Client(transport=httpx.MockTransport(_handler)) as http_client:
+        response = http_client.get("https://pypi.org/pypi/letsbuilda-pypi/json")
+    http_cache = HTTPCache(tmp_path, max_size=1)
+
+    http_cache.store("https://pypi.org/pypi/a/json", response)
+    http_cache.store("https://pypi.org/pypi/b/json", response)
+
+    assert http_cache.size <= 1
+    assert http_cache.load("https://pypi.org/pypi/a/json") is None
+
+
+class _ThreadRecordingCache(HTTPCache):
+    """An HTTP cache recording the threads it is used from."""
+
+    threads: set[int]
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        self.threads.add(threading.get_ident())
+        return super().conditional_headers(url)
+
+    def load(self, url: str) -> httpx.Response | None:
+        self.threads.add(threading.get_ident())
+        return super().load(url)
+
+    def store(self, url: str, response: httpx.Response) -> None:
+        self.threads.add(threading.get_ident())
+        super().store(url, response)
+
+
+def test_async_client_uses_the_cache_off_the_event_loop(tmp_path: Path) -> None:
+    """Confirm the async client reads and writes the cache in worker threads."""
+    http_cache = _ThreadRecordingCache(tmp_path)
+    http_cache.threads = set()
+
+    async def fetch() -> None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as http_client:
+            pypi_client = AsyncPyPIServices(http_client, http_cache=http_cache)
+            for _ in range(2):
+                await pypi_client.get_package_json_metadata("letsbuilda-pypi")
+
+    asyncio.run(fetch())
+
+    assert http_cache.threads
+    assert threading.get_ident() not in http_cache.threads
@@ -0,0 +1,90 @@
+"""Test instrumenting requests and parsing."""
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import httpx
+from sample_data import JSON_API_DATA, build_feed
+
+from letsbuilda.pypi import (
+    Histogram,
+    MetricsAggregator,
+    ParseFinished,
+    PyPIServices,
+    RequestFinished,
+    RequestStarted,
+)
+from letsbuilda.pypi.async_client import PyPIServices as AsyncPyPIServices
+
+if TYPE_CHECKING:
+    from letsbuilda.pypi.instrumentation import InstrumentationEvent
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    """Serve the sample metadata, an RSS feed, or a 404 for unknown packages."""
+    if request.url.path.startswith("/rss/"):
+        return httpx.Response(200, text=build_feed("b", "a"))
+    if "missing" in request.url.path:
+        return httpx.Response(404)
+    return httpx.Response(200, json=JSON_API_DATA)
+
+
+def test_requests_and_parses_are_reported() -> None:
+    """Confirm each request and parse fires events describing it."""
+    events: list[InstrumentationEvent] = []
+    with httpx.Client(transport=httpx.MockTransport(_handler)) as http_client:
+        pypi_client = PyPIServices(http_client, instruments=[events.append])
+        pypi_client.get_package_json_metadata("letsbuilda-pypi")
+
+    started, finished, parsed = events
+    assert started == RequestStarted("GET", "https://pypi.org/pypi/letsbuilda-pypi/json")
+    assert isinstance(finished, RequestFinished)
+    assert finished.status_code == 200  # noqa: PLR2004 - HTTP OK
+    assert finished.response_bytes > 0
+    assert isinstance(parsed, ParseFinished)
+    assert (parsed.model, parsed.phase) == ("JSONPackageMetadata", "decode_and_validate")
+    assert parsed.input_bytes == finished.response_bytes
+
+
+def test_streamed_feeds_report_decode_and_validation_separately() -> None:
+    """Confirm parsing a streamed RSS feed is split into decoding and validation."""
+    aggregator = MetricsAggregator()
+
+    async def fetch() -> None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as http_client:
+            pypi_client = AsyncPyPIServices(http_client, instruments=[aggregator])
+            assert len(await pypi_client.get_rss_feed(pypi_client.NEWEST_PACKAGES_FEED_URL)) == 2  # noqa: PLR2004
+            await pypi_client.get_package_json_metadata("letsbuilda-pypi")
+            await asyncio.gather(
+                pypi_client.get_package_json_metadata("missing"),
+                return_exceptions=True,
+            )
+
+    asyncio.run(fetch())
+
+    assert aggregator.status_codes == {200: 2, 404: 1}
+    assert aggregator.network_time.count == 3  # noqa: PLR2004
+    assert set(aggregator.parse_time) == {
+        ("RSSPackageMetadata", "decode"),
+        ("RSSPackageMetadata", "validate"),
+        ("JSONPackageMetadata", "decode_and_validate"),
+    }
+    slowest = aggregator.slowest_requests()
+    assert len(slowest) == 3  # noqa: PLR2004
+    assert slowest[0].network_time >= slowest[-1].network_time
+
+
+def test_histogram_quantiles() -> None:
+    """Confirm quantiles are accurate to within a bucket."""
+    histogram = Histogram()
+    for value in range(1, 1001):
+        histogram.record(value / 1000)
+    histogram.record(0)
+
+    assert histogram.count == 1001  # noqa: PLR2004
+    assert histogram.min == 0
+    assert histogram.max == 1
+    assert abs(histogram.quantile(0.5) - 0.5) / 0.5 < 2 ** (1 / 8) - 1
+    assert abs(histogram.quantile(0.99) - 0.99) / 0.99 < 2 ** (1 / 8) - 1
+    assert histogram.quantile(1) == 1
+    assert histogram.buckets()[0] == (0.0, 0.0, 1)
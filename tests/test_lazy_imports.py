@@ -0,0 +1,51 @@
+"""Test the package's lazy imports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import letsbuilda.pypi
+from letsbuilda.pypi import models
+
+
+def test_importing_the_package_is_cheap() -> None:
+    """Confirm importing the package imports neither `httpx` nor `pydantic` until something is used."""
+    statement = (
+        "import sys, letsbuilda.pypi\n"
+        "assert 'httpx' not in sys.modules and 'pydantic' not in sys.modules\n"
+        "letsbuilda.pypi.normalize_package_title\n"
+        "assert 'httpx' not in sys.modules and 'pydantic' not in sys.modules\n"
+        "letsbuilda.pypi.PyPIServices\n"
+        "assert 'httpx' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", statement], check=True)  # noqa: S603 - a fixed statement
+
+
+@pytest.mark.parametrize("package", [letsbuilda.pypi, models])
+def test_every_public_name_resolves(package: object) -> None:
+    """Confirm every name in `__all__` can be imported, and is listed by `dir`."""
+    for name in package.__all__:  # type: ignore[attr-defined]
+        assert getattr(package, name) is not None
+        assert name in dir(package)
+    with pytest.raises(AttributeError):
+        package.missing  # type: ignore[attr-defined]  # noqa: B018
+
+
+@pytest.mark.parametrize(
+    ("statement", "modules"),
+    [
+        (
+            "from letsbuilda.pypi import PyPIServices",
+            ["asyncio", "sqlite3", "tarfile", "xmlrpc.client", "xml.etree.ElementTree"],
+        ),
+        (
+            "from letsbuilda.pypi.async_client import PyPIServices",
+            ["sqlite3", "tarfile", "xmlrpc.client", "xml.etree.ElementTree"],
+        ),
+    ],
+)
+def test_importing_a_client_leaves_optional_features_unimported(statement: str, modules: list[str]) -> None:
+    """Confirm the modules behind the optional features are only imported when those features are used."""
+    statement = f"import sys\n{statement}\nassert not sys.modules.keys() & {modules!r}"
+    subprocess.run([sys.executable, "-c", statement], check=True)  # noqa: S603 - a fixed statement
@@ -0,0 +1,50 @@
+"""Test the in-memory cache of parsed metadata."""
+
+import httpx
+from sample_data import JSON_API_DATA
+
+from letsbuilda.pypi import JSONPackageMetadata, MetadataCache, PyPIServices
+
+METADATA = JSONPackageMetadata.model_validate(JSON_API_DATA)
+
+
+def test_hits_skip_the_network() -> None:
+    """Confirm a fresh entry is served without a request."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=JSON_API_DATA)
+
+    metadata_cache = MetadataCache()
+    with httpx.Client(transport=httpx.MockTransport(handler)) as http_client:
+        pypi_client = PyPIServices(http_client, metadata_cache=metadata_cache)
+        first = pypi_client.get_package_json_metadata("letsbuilda-pypi")
+        second = pypi_client.get_package_json_metadata("letsbuilda_pypi")
+
+    assert first is second
+    assert len(requests) == 1
+    assert metadata_cache.statistics.hits == 1
+    assert metadata_cache.statistics.misses == 1
+
+
+def test_expired_entries_are_reused_when_the_serial_is_unchanged() -> None:
+    """Confirm an expired entry at the current serial is reused rather than revalidated."""
+    metadata_cache = MetadataCache(ttl=0)
+    metadata_cache.put("letsbuilda-pypi", None, METADATA)
+
+    assert metadata_cache.get("letsbuilda-pypi", None) is None
+    assert metadata_cache.revalidate("letsbuilda-pypi", None, METADATA.last_serial + 1) is None
+    assert metadata_cache.revalidate("letsbuilda-pypi", None, METADATA.last_serial) is METADATA
+    assert metadata_cache.statistics.revalidations == 1
+
+
+def test_least_recently_used_entries_are_evicted() -> None:
+    """Confirm the cache stays within its size bound."""
+    metadata_cache = MetadataCache(max_size=1)
+    metadata_cache.put("first", None, METADATA)
+    metadata_cache.put("second", None, METADATA)
+
+    assert len(metadata_cache) == 1
+    assert metadata_cache.get("first", None) is None
+    assert metadata_cache.statistics.evictions == 1
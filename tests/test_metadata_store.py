@@ -0,0 +1,104 @@
+"""Test the local SQLite metadata store."""
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+from sample_data import JSON_API_DATA
+
+from letsbuilda.pypi import JSONPackageMetadata, MetadataStore, PyPIServices
+from letsbuilda.pypi.async_client import PyPIServices as AsyncPyPIServices
+
+METADATA = JSONPackageMetadata.model_validate(JSON_API_DATA)
+WHEEL_SHA256 = "67a5925e5a51f761ad3c28f3abf90d0b0b4270c26efd87f596d42e5706a63798"
+
+
+def test_metadata_round_trips(tmp_path: Path) -> None:
+    """Confirm stored metadata is rebuilt unchanged, and found by its indexed columns."""
+    with MetadataStore(tmp_path / "metadata.sqlite3") as metadata_store:
+        assert metadata_store.upsert(METADATA)
+
+        assert metadata_store.get("LetsBuilda_PyPI") == METADATA
+        ((package_name, url),) = metadata_store.find_by_sha256(WHEEL_SHA256)
+        assert package_name == "letsbuilda-pypi"
+        assert url == METADATA.urls[0]
+        assert metadata_store.find_by_filename("letsbuilda-pypi-4.0.0.tar.gz")[0][1] == METADATA.urls[1]
+        assert metadata_store.find_by_author("Bradley Reynolds <bradley.reynolds@darbia.dev>") == [METADATA.info]
+
+
+def test_unchanged_serials_are_skipped() -> None:
+    """Confirm only packages with a newer serial are written."""
+    newer = METADATA.model_copy(update={"last_serial": METADATA.last_serial + 1, "urls": METADATA.urls[:1]})
+    with MetadataStore() as metadata_store:
+        assert metadata_store.upsert_many([METADATA, METADATA]) == 1
+        assert metadata_store.upsert_many([METADATA]) == 0
+        assert metadata_store.upsert_many([newer]) == 1
+
+        assert metadata_store.get("letsbuilda-pypi") == newer
+        assert metadata_store.find_by_filename("letsbuilda-pypi-4.0.0.tar.gz") == []
+
+
+def _serve_releases(requests: list[httpx.Request]) -> httpx.MockTransport:
+    """Serve version 4.0.0 as the latest, then 5.0.0, recording the requests."""
+    serials = iter([METADATA.last_serial, METADATA.last_serial + 1])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        last_serial = next(serials)
+        version = "4.0.0" if last_serial == METADATA.last_serial else "5.0.0"
+        data = {**JSON_API_DATA, "info": {**JSON_API_DATA["info"], "version": version}, "last_serial": last_serial}  # type: ignore[dict-item]
+        return httpx.Response(200, json=data)
+
+    return httpx.MockTransport(handler)
+
+
+def test_client_reads_through_the_store(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Confirm the latest version is served from the store until it is older than `max_age`."""
+    requests: list[httpx.Request] = []
+    now = [1_000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+
+    with MetadataStore(max_age=60) as metadata_store, httpx.Client(transport=_serve_releases(requests)) as http_client:
+        pypi_client = PyPIServices(http_client, metadata_store=metadata_store)
+        assert pypi_client.get_package_json_metadata("letsbuilda-pypi").info.version == "4.0.0"
+        now[0] += 60
+        assert pypi_client.get_package_json_metadata("letsbuilda-pypi").info.version == "4.0.0"
+        assert len(requests) == 1
+
+        now[0] += 1
+        assert pypi_client.get_package_json_metadata("letsbuilda-pypi").info.version == "5.0.0"
+        now[0] += 3600
+        assert pypi_client.get_package_json_metadata("letsbuilda-pypi", "5.0.0").info.version == "5.0.0"
+
+    assert len(requests) == 2  # noqa: PLR2004
+
+
+def test_async_client_uses_the_store_off_the_event_loop() -> None:
+    """Confirm the async client reads and writes the store in worker threads."""
+    requests: list[httpx.Request] = []
+    threads: set[int] = set()
+
+    class ThreadRecordingStore(MetadataStore):
+        def get(self, package_title: str, *, max_age: float | None = None) -> JSONPackageMetadata | None:
+            threads.add(threading.get_ident())
+            return super().get(package_title, max_age=max_age)
+
+        def upsert(self, metadata: JSONPackageMetadata) -> bool:
+            threads.add(threading.get_ident())
+            return super().upsert(metadata)
+
+    async def fetch(metadata_store: MetadataStore) -> JSONPackageMetadata:
+        async with httpx.AsyncClient(transport=_serve_releases(requests)) as http_client:
+            pypi_client = AsyncPyPIServices(http_client, metadata_store=metadata_store)
+            await pypi_client.get_package_json_metadata("letsbuilda-pypi")
+            return await pypi_client.get_package_json_metadata("letsbuilda-pypi")
+
+    with ThreadRecordingStore() as metadata_store:
+        assert asyncio.run(fetch(metadata_store)).info.version == "4.0.0"
+
+    assert len(requests) == 1
+    assert threads
+    assert threading.get_ident() not in threads
@@ -0,0 +1,66 @@
+"""Test the options trading detail for memory when validating models."""
+
+import json
+
+import httpx
+from sample_data import JSON_API_DATA
+
+from letsbuilda.pypi import JSONPackageMetadata, MetadataCache, MetadataStore, ModelOptions, PyPIServices
+
+CONTENT = json.dumps(JSON_API_DATA).encode()
+# Long enough not to be shared by pydantic's own cache of short strings
+LICENSE = "Permission is hereby granted, free of charge, to any person obtaining a copy of this software"
+CLASSIFIER = "License :: OSI Approved :: GNU Lesser General Public License v3 or later (LGPLv3+)"
+LONG_CONTENT = json.dumps(
+    {**JSON_API_DATA, "info": {**JSON_API_DATA["info"], "license": LICENSE, "classifiers": [CLASSIFIER]}},  # type: ignore[dict-item]
+).encode()
+
+
+def test_repeated_strings_are_shared_when_interned() -> None:
+    """Confirm interned strings are shared between packages, and are otherwise separate copies."""
+    options: ModelOptions = {"intern_strings": True}
+    first, second = (JSONPackageMetadata.model_validate_json(LONG_CONTENT, context=options) for _ in range(2))
+
+    assert first.info.license is second.info.license
+    assert first.info.classifiers[0] is second.info.classifiers[0]
+    assert first.urls[0].packagetype is second.urls[0].packagetype
+    assert first == JSONPackageMetadata.model_validate_json(LONG_CONTENT)
+
+    first, second = (JSONPackageMetadata.model_validate_json(LONG_CONTENT) for _ in range(2))
+    assert first.info.license is not second.info.license
+
+
+def test_clients_drop_descriptions() -> None:
+    """Confirm clients validate responses with their model options."""
+    transport = httpx.MockTransport(lambda _: httpx.Response(200, content=CONTENT))
+    with httpx.Client(transport=transport) as http_client:
+        pypi_client = PyPIServices(http_client, model_options={"drop_description": True})
+        metadata = pypi_client.get_package_json_metadata("letsbuilda-pypi")
+
+    assert not metadata.info.description
+    assert metadata.info.summary == JSON_API_DATA["info"]["summary"]  # type: ignore[index]
+
+
+def test_dropped_descriptions_are_not_shared() -> None:
+    """Confirm models validated with options bypass a metadata cache and store shared with other clients."""
+    headers = {"X-PyPI-Last-Serial": str(JSON_API_DATA["last_serial"])}
+    transport = httpx.MockTransport(lambda _: httpx.Response(200, content=CONTENT, headers=headers))
+    with (
+        MetadataStore() as metadata_store,
+        httpx.Client(transport=transport) as http_client,
+    ):
+        metadata_cache = MetadataCache()
+        options_client = PyPIServices(
+            http_client,
+            metadata_cache=metadata_cache,
+            metadata_store=metadata_store,
+            model_options={"drop_description": True},
+        )
+        assert not options_client.get_package_json_metadata("letsbuilda-pypi").info.description
+        assert metadata_cache.get("letsbuilda-pypi", None) is None
+        assert metadata_store.get("letsbuilda-pypi") is None
+
+        pypi_client = PyPIServices(http_client, metadata_cache=metadata_cache, metadata_store=metadata_store)
+        assert pypi_client.get_package_json_metadata("letsbuilda-pypi").info.description
+        assert not options_client.get_package_json_metadata("letsbuilda-pypi").info.description
+        assert metadata_store.get("letsbuilda-pypi").info.description  # type: ignore[union-attr]
@@ -0,0 +1,44 @@
+"""Test building `Package` objects from the JSON API."""
+
+import json
+
+import httpx
+from sample_data import JSON_API_DATA
+
+from letsbuilda.pypi import Package, PyPIServices
+from letsbuilda.pypi.models.models_package import Distribution, Release
+
+RELEASES_DATA = {
+    "1.0.0": [{"filename": "example-1.0.0.tar.gz", "url": "https://files.example/example-1.0.0.tar.gz"}],
+    "2.0.0": [{"filename": "example-2.0.0.tar.gz", "url": "https://files.example/example-2.0.0.tar.gz"}],
+}
+
+
+def test_package_is_built_from_releases_map() -> None:
+    """Confirm every release in the `releases` map is available, in order."""
+    package = Package.from_json_api(json.dumps({**JSON_API_DATA, "releases": RELEASES_DATA}))
+
+    assert package.title == "letsbuilda-pypi"
+    assert isinstance(package.releases, list)
+    assert [release.version for release in package.releases] == ["1.0.0", "2.0.0"]
+    assert package.releases[1] == Release(
+        version="2.0.0",
+        distributions=[Distribution(filename="example-2.0.0.tar.gz", url="https://files.example/example-2.0.0.tar.gz")],
+    )
+    assert package.model_dump()["releases"][0]["version"] == "1.0.0"
+
+
+def test_package_without_releases_map_uses_urls() -> None:
+    """Confirm responses for a single version produce that release."""
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=JSON_API_DATA)
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as http_client:
+        package = PyPIServices(http_client).get_package_metadata("letsbuilda-pypi", "4.0.0")
+
+    assert [release.version for release in package.releases] == ["4.0.0"]
+    assert [distribution.filename for distribution in package.releases[0].distributions] == [
+        "letsbuilda_pypi-4.0.0-py3-none-any.whl",
+        "letsbuilda-pypi-4.0.0.tar.gz",
+    ]
@@ -0,0 +1,76 @@
+"""Test offloading the parsing of large responses from the event loop."""
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+import httpx
+from sample_data import JSON_API_DATA
+
+from letsbuilda.pypi import JSONPackageMetadata, Package, ParseFinished
+from letsbuilda.pypi.async_client import PyPIServices as AsyncPyPIServices
+
+if TYPE_CHECKING:
+    from letsbuilda.pypi.instrumentation import InstrumentationEvent
+
+TRANSPORT = httpx.MockTransport(lambda _: httpx.Response(200, json=JSON_API_DATA))
+
+
+class _RecordingExecutor(ThreadPoolExecutor):
+    """A thread pool recording the names of the functions submitted to it."""
+
+    def __init__(self) -> None:
+        super().__init__(max_workers=1)
+        self.submitted: list[str] = []
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future[Any]:  # noqa: ANN401
+        self.submitted.append(fn.__name__)
+        return super().submit(fn, *args, **kwargs)
+
+
+def test_large_responses_are_parsed_in_the_executor() -> None:
+    """Confirm only responses above the threshold are parsed in the executor, and partial models never are."""
+    events: list[InstrumentationEvent] = []
+
+    async def fetch(executor: _RecordingExecutor, threshold: int) -> tuple[JSONPackageMetadata, Package]:
+        async with httpx.AsyncClient(transport=TRANSPORT) as http_client:
+            pypi_client = AsyncPyPIServices(
+                http_client,
+                instruments=[events.append],
+                parse_executor=executor,
+                parse_offload_threshold=threshold,
+            )
+            partial_metadata = await pypi_client.get_package_json_metadata("other", fields={"info.name"})
+            assert partial_metadata.info.name == "letsbuilda-pypi"  # type: ignore[attr-defined]
+            metadata = await pypi_client.get_package_json_metadata("letsbuilda-pypi")
+            return metadata, await pypi_client.get_package_metadata("letsbuilda-pypi")
+
+    with _RecordingExecutor() as executor:
+        metadata, package = asyncio.run(fetch(executor, 0))
+    assert executor.submitted == ["model_validate_json", "from_json_api"]
+    assert metadata == JSONPackageMetadata.model_validate(JSON_API_DATA)
+    assert package.title == "letsbuilda-pypi"
+    assert [event.model for event in events if isinstance(event, ParseFinished)] == [
+        "JSONPackageMetadataProjection",
+        "JSONPackageMetadata",
+        "Package",
+    ]
+
+    with _RecordingExecutor() as executor:
+        asyncio.run(fetch(executor, 10_000_000))
+    assert executor.submitted == []
+
+
+def test_process_pools_parse_responses() -> None:
+    """Confirm a process pool can parse responses, as the parsers are picklable."""
+
+    async def fetch(executor: ProcessPoolExecutor) -> JSONPackageMetadata:
+        async with httpx.AsyncClient(transport=TRANSPORT) as http_client:
+            pypi_client = AsyncPyPIServices(http_client, parse_executor=executor, parse_offload_threshold=0)
+            return await pypi_client.get_package_json_metadata("letsbuilda-pypi")
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        metadata = asyncio.run(fetch(executor))
+
+    assert metadata.info.name == "letsbuilda-pypi"
@@ -0,0 +1,187 @@
+"""Test reading core metadata and file lists without downloading whole distributions."""
+
+import asyncio
+import gzip
+import hashlib
+import io
+import os
+import tarfile
+import tracemalloc
+import zipfile
+from collections.abc import Iterator
+
+import httpx
+import pytest
+
+from letsbuilda.pypi import DigestMismatchError, PyPIServices, SimpleFile, archives
+from letsbuilda.pypi.archives import MAX_CORE_METADATA_SIZE, TarGzStreamParser, is_core_metadata_path
+from letsbuilda.pypi.async_client import PyPIServices as AsyncPyPIServices
+
+CORE_METADATA = b"Metadata-Version: 2.1\nName: example\nVersion: 1.0\n"
+LONG_PATH = "example-1.0/" + "nested/" * 20 + "module.py"
+
+
+def _build_wheel() -> bytes:
+    """Build a wheel whose metadata comes first, followed by a lot of incompressible data."""
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as wheel:
+        wheel.writestr("example-1.0.dist-info/METADATA", CORE_METADATA)
+        for index in range(20):
+            wheel.writestr(f"example/data{index}.bin", os.urandom(100_000))
+    return archive.getvalue()
+
+
+def _build_sdist() -> bytes:
+    """Build a gzipped sdist whose `PKG-INFO` comes first, followed by a long path and a lot of data."""
+    archive = io.BytesIO()
+    with tarfile.open(fileobj=archive, mode="w:gz") as sdist:
+        for name, data in [
+            ("example-1.0/PKG-INFO", CORE_METADATA),
+            (LONG_PATH, b"print('hello')\n"),
+            ("example-1.0/data.bin", os.urandom(2_000_000)),
+        ]:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            sdist.addfile(info, io.BytesIO(data))
+    return archive.getvalue()
+
+
+WHEEL = _build_wheel()
+SDIST = _build_sdist()
+
+
+class _FileServer:
+    """A transport handler serving the test archives, honouring range requests and counting the bytes sent."""
+
+    def __init__(self) -> None:
+        self.bytes_sent = 0
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.path.endswith(".whl"):
+            return self._serve_range(request, WHEEL)
+        if request.url.path.endswith(".tar.gz"):
+            return httpx.Response(200, content=self._stream(SDIST))
+        return httpx.Response(404)
+
+    def _serve_range(self, request: httpx.Request, content: bytes) -> httpx.Response:
+        first, _, last = request.headers["Range"].removeprefix("bytes=").partition("-")
+        start, end = (len(content) - int(last), len(content)) if not first else (int(first), int(last) + 1)
+        self.bytes_sent += end - start
+        return httpx.Response(
+            206,
+            content=content[start:end],
+            headers={"Content-Range": f"bytes {start}-{end - 1}/{len(content)}"},
+        )
+
+    def _stream(self, content: bytes) -> Iterator[bytes]:
+        for start in range(0, len(content), 16_384):
+            self.bytes_sent += len(content[start : start + 16_384])
+            yield content[start : start + 16_384]
+
+
+def _simple_file(filename: str, **fields: object) -> SimpleFile:
+    """Build a Simple Repository API file entry."""
+    return SimpleFile.model_validate(
+        {"filename": filename, "url": f"https://files.pythonhosted.org/packages/{filename}", "hashes": {}, **fields},
+    )
+
+
+def test_wheel_metadata_is_read_with_ranges() -> None:
+    """Confirm wheel metadata is read from the end of the archive and its entry, not the whole file."""
+    server = _FileServer()
+
+    async def read() -> tuple[bytes, list[str]]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as http_client:
+            pypi_client = AsyncPyPIServices(http_client)
+            wheel = _simple_file("example-1.0-py3-none-any.whl")
+            return await pypi_client.get_core_metadata(wheel), await pypi_client.list_distribution_files(wheel)
+
+    metadata, files = asyncio.run(read())
+
+    assert metadata == CORE_METADATA
+    assert len(files) == 21  # noqa: PLR2004
+    assert server.bytes_sent < len(WHEEL) / 5
+    assert not any(request.url.path.endswith(".metadata") for request in server.requests)
+
+
+def test_pep_658_metadata_is_preferred_and_verified() -> None:
+    """Confirm the `.metadata` file is used when listed, and checked against its hash."""
+    transport = httpx.MockTransport(lambda _: httpx.Response(200, content=CORE_METADATA))
+    digest = hashlib.sha256(CORE_METADATA).hexdigest()
+    with httpx.Client(transport=transport) as http_client:
+        pypi_client = PyPIServices(http_client)
+        listed = _simple_file("example-1.0-py3-none-any.whl", **{"core-metadata": {"sha256": digest}})
+        assert pypi_client.get_core_metadata(listed) == CORE_METADATA
+        corrupt = _simple_file("example-1.0-py3-none-any.whl", **{"core-metadata": {"sha256": "0" * 64}})
+        with pytest.raises(DigestMismatchError):
+            pypi_client.get_core_metadata(corrupt)
+
+
+def test_sdists_are_streamed_until_their_metadata() -> None:
+    """Confirm gzipped sdists stop streaming once `PKG-INFO` has been read, and list long paths."""
+    server = _FileServer()
+    with httpx.Client(transport=httpx.MockTransport(server)) as http_client:
+        pypi_client = PyPIServices(http_client)
+        metadata = pypi_client.get_core_metadata(_simple_file("example-1.0.tar.gz"))
+        assert server.bytes_sent < len(SDIST) / 10
+        files = pypi_client.list_distribution_files(_simple_file("example-1.0.tar.gz"))
+
+    assert metadata == CORE_METADATA
+    assert files == ["example-1.0/PKG-INFO", LONG_PATH, "example-1.0/data.bin"]
+
+
+def test_tar_parser_handles_any_chunking() -> None:
+    """Confirm members are parsed the same whatever the chunk boundaries."""
+    compressed = gzip.compress(gzip.decompress(SDIST)[:4096] + bytes(1024))
+    for chunk_size in (1, 511, 4096):
+        parser = TarGzStreamParser(is_core_metadata_path)
+        members = [
+            member
+            for start in range(0, len(compressed), chunk_size)
+            for member in parser.feed(compressed[start : start + chunk_size])
+        ]
+        assert members[0] == ("example-1.0/PKG-INFO", CORE_METADATA)
+
+
+def test_oversized_core_metadata_is_refused(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Confirm core metadata larger than the limit is refused before it is decompressed or buffered."""
+    monkeypatch.setattr(archives, "MAX_CORE_METADATA_SIZE", len(CORE_METADATA) - 1)
+    with (
+        httpx.Client(transport=httpx.MockTransport(_FileServer())) as http_client,
+        pytest.raises(ValueError, match="more than the limit"),
+    ):
+        PyPIServices(http_client).get_core_metadata(_simple_file("example-1.0-py3-none-any.whl"))
+
+    header = tarfile.TarInfo("example-1.0/PKG-INFO")
+    header.size = MAX_CORE_METADATA_SIZE + 1
+    with pytest.raises(ValueError, match="more than the limit"):
+        list(TarGzStreamParser(is_core_metadata_path).feed(gzip.compress(header.tobuf())))
+
+
+def test_tar_parser_decompresses_a_bounded_amount_at_a_time() -> None:
+    """Confirm a highly compressed member is never decompressed all at once, even when fed in one chunk."""
+    size = 64 * 1024 * 1024
+    header = tarfile.TarInfo("example-1.0/data.bin")
+    header.size = size
+    bomb = gzip.compress(header.tobuf() + bytes(size))
+
+    tracemalloc.start()
+    try:
+        members = list(TarGzStreamParser(is_core_metadata_path).feed(bomb))
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    assert members == [("example-1.0/data.bin", None)]
+    assert peak < size / 16
+
+
+def test_unsupported_archives_are_rejected() -> None:
+    """Confirm distributions which are not zip or gzipped tar archives are rejected."""
+    with (
+        httpx.Client(transport=httpx.MockTransport(_FileServer())) as http_client,
+        pytest.raises(ValueError, match="neither"),
+    ):
+        PyPIServices(http_client).get_core_metadata(_simple_file("example-1.0.tar.bz2"))
@@ -0,0 +1,52 @@
+"""Test coalescing concurrent identical requests in the async client."""
+
+import asyncio
+
+import httpx
+from sample_data import JSON_API_DATA
+
+from letsbuilda.pypi import JSONPackageMetadata, SingleFlight
+from letsbuilda.pypi.async_client import PyPIServices as AsyncPyPIServices
+
+
+def test_concurrent_requests_share_one_response() -> None:
+    """Confirm concurrent callers for the same package await a single request."""
+    requests: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=JSON_API_DATA)
+
+    async def fetch() -> list[JSONPackageMetadata]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+            pypi_client = AsyncPyPIServices(http_client)
+            results = await asyncio.gather(
+                *(pypi_client.get_package_json_metadata("letsbuilda-pypi") for _ in range(5)),
+            )
+            assert pypi_client.single_flight.statistics.calls == 1
+            assert pypi_client.single_flight.statistics.coalesced == 4  # noqa: PLR2004 - all but the first caller
+            return results
+
+    results = asyncio.run(fetch())
+
+    assert len(requests) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_cancelled_caller_does_not_cancel_others() -> None:
+    """Confirm the shared call survives the cancellation of one of its callers."""
+
+    async def slow() -> int:
+        await asyncio.sleep(0.01)
+        return 42
+
+    async def run() -> int:
+        single_flight: SingleFlight[int] = SingleFlight()
+        first = asyncio.create_task(single_flight.run("key", slow))
+        second = asyncio.create_task(single_flight.run("key", slow))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(run()) == 42  # noqa: PLR2004 - the shared result
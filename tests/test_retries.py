@@ -0,0 +1,102 @@
+"""Test retrying throttled and failed requests."""
+
+import asyncio
+
+import httpx
+import pytest
+from sample_data import JSON_API_DATA, build_feed
+
+from letsbuilda.pypi import AdaptiveLimiter, AsyncAdaptiveLimiter, FeedState, PyPIServices, RetryPolicy
+from letsbuilda.pypi.async_client import PyPIServices as AsyncPyPIServices
+from letsbuilda.pypi.retries import parse_retry_after
+
+NO_BACKOFF = RetryPolicy(backoff_base=0)
+
+
+def _flaky_handler(failures: list[httpx.Response]) -> httpx.MockTransport:
+    """Build a transport that returns each failure in turn, then the sample metadata."""
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        if failures:
+            return failures.pop(0)
+        return httpx.Response(200, json=JSON_API_DATA)
+
+    return httpx.MockTransport(handler)
+
+
+def test_throttled_requests_are_retried() -> None:
+    """Confirm throttling and server errors are retried until the request succeeds."""
+    failures = [httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(503)]
+    limiter = AdaptiveLimiter(initial_limit=8)
+    with httpx.Client(transport=_flaky_handler(failures)) as http_client:
+        pypi_client = PyPIServices(http_client, retry_policy=NO_BACKOFF, concurrency_limiter=limiter)
+        metadata = pypi_client.get_package_json_metadata("letsbuilda-pypi")
+
+    assert metadata.info.name == "letsbuilda-pypi"
+    assert limiter.limit == 2  # noqa: PLR2004 - halved twice, then grown by less than one
+    assert limiter.in_flight == 0
+
+
+def test_exhausted_retries_raise_for_status() -> None:
+    """Confirm a persistent failure surfaces as an HTTP error rather than a validation error."""
+    failures = [httpx.Response(500) for _ in range(3)]
+
+    async def fetch() -> None:
+        async with httpx.AsyncClient(transport=_flaky_handler(failures)) as http_client:
+            pypi_client = AsyncPyPIServices(
+                http_client,
+                retry_policy=RetryPolicy(max_attempts=2, backoff_base=0),
+                concurrency_limiter=AsyncAdaptiveLimiter(),
+            )
+            await pypi_client.get_package_json_metadata("letsbuilda-pypi")
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(fetch())
+    assert len(failures) == 1
+
+
+def test_retry_after_is_honoured_and_capped() -> None:
+    """Confirm `Retry-After` takes precedence over backoff, up to `backoff_max`."""
+    policy = RetryPolicy(backoff_max=10)
+
+    assert policy.delay(1, httpx.Response(429, headers={"Retry-After": "3"})) == 3  # noqa: PLR2004 - from the header
+    assert policy.delay(1, httpx.Response(429, headers={"Retry-After": "120"})) == 10  # noqa: PLR2004 - the cap
+    assert 0 <= policy.delay(10, None) <= 10  # noqa: PLR2004 - the cap
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after("soon") is None
+
+
+def _throttled_feed_handler(failures: list[httpx.Response]) -> httpx.MockTransport:
+    """Build a transport that returns each failure in turn, then a feed of two new packages."""
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        if failures:
+            return failures.pop(0)
+        return httpx.Response(200, text=build_feed("b", "a"))
+
+    return httpx.MockTransport(handler)
+
+
+def test_streamed_requests_are_retried() -> None:
+    """Confirm streamed feed requests are retried and limited like any other request, by both clients."""
+    failures = [httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(503)]
+    limiter = AdaptiveLimiter(initial_limit=8)
+    with httpx.Client(transport=_throttled_feed_handler(failures)) as http_client:
+        pypi_client = PyPIServices(http_client, retry_policy=NO_BACKOFF, concurrency_limiter=limiter)
+        entries = pypi_client.get_new_rss_entries(pypi_client.NEWEST_PACKAGES_FEED_URL, FeedState())
+
+    assert [entry.title for entry in entries] == ["a", "b"]
+    assert limiter.limit == 2  # noqa: PLR2004 - halved twice, then grown by less than one
+    assert limiter.in_flight == 0
+
+    failures.append(httpx.Response(429))
+    async_limiter = AsyncAdaptiveLimiter(initial_limit=8)
+
+    async def iterate() -> list[str]:
+        async with httpx.AsyncClient(transport=_throttled_feed_handler(failures)) as http_client:
+            pypi_client = AsyncPyPIServices(http_client, retry_policy=NO_BACKOFF, concurrency_limiter=async_limiter)
+            return [entry.title async for entry in pypi_client.iter_rss_feed(pypi_client.NEWEST_PACKAGES_FEED_URL)]
+
+    assert asyncio.run(iterate()) == ["b", "a"]
+    assert async_limiter.limit < 8  # noqa: PLR2004 - halved once
+    assert async_limiter.in_flight == 0
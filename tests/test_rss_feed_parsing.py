@@ -1,23 +1,15 @@
 """Test parsing metadata from the RSS feeds."""
 
 from datetime import UTC, datetime
-from typing import Final
+from email.utils import parsedate_to_datetime
 
-from letsbuilda.pypi import RSSPackageMetadata
+import httpx
+import pytest
+from sample_data import NEW_PACKAGE_DATA, UPDATED_PACKAGE_DATA, build_feed
 
-NEW_PACKAGE_DATA: Final[dict[str, str]] = {
-    "title": "test-package added to PyPI",
-    "link": "https://pypi.org/project/test-package",
-    "guid": "https://pypi.org/project/test-package",
-    "pubDate": "Wed, 29 Mar 2023 21:30:05 GMT",
-}
-
-UPDATED_PACKAGE_DATA: Final[dict[str, str]] = {
-    "title": "test-package 1.0.0",
-    "link": "https://pypi.org/project/test-package/1.0.0",
-    "author": "test-author@example.com",
-    "pubDate": "Wed, 29 Mar 2023 21:30:05 GMT",
-}
+from letsbuilda.pypi import PyPIServices, RSSPackageMetadata, RSSPackageRecord
+from letsbuilda.pypi.feeds import RSSItemParser
+from letsbuilda.pypi.models.models_rss import parse_rss_date
 
 
 def test_parsing_new_package_data() -> None:
@@ -33,3 +25,53 @@ def test_parsing_updated_package_data() -> None:
     """Confirm sample updated package data gets parsed correctly."""
     parsed_data = RSSPackageMetadata.model_validate(UPDATED_PACKAGE_DATA)
     assert parsed_data.version == "1.0.0"
+
+
+def test_items_are_parsed_incrementally() -> None:
+    """Confirm each item is produced as soon as its closing tag arrives."""
+    parser = RSSItemParser()
+    first_chunk = (
+        b'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>PyPI</title>'
+        b"<item><title>test-package 1.0.0</title><link>https://pypi.org/project/test-package/1.0.0/</link>"
+        b"<pubDate>Wed, 29 Mar 2023 21:30:05 GMT</pubDate></item><item><title>other"
+    )
+
+    items = list(parser.feed(first_chunk))
+
+    assert len(items) == 1
+    assert RSSPackageMetadata.model_validate(items[0]).version == "1.0.0"
+    assert list(parser.feed(b" 2.0.0</title></item></channel></rss>")) == [{"title": "other 2.0.0"}]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "Wed, 29 Mar 2023 21:30:05 GMT",
+        "Wed, 9 Mar 2023 21:30:05 GMT",
+        "Wed, 29 Mar 2023 21:30:05 +0200",
+        "Wed, 29 Mar 2023 21:30:05 -0000",
+    ],
+)
+def test_fast_date_parsing_matches_the_standard_library(value: str) -> None:
+    """Confirm the fast path and its fallback agree with `parsedate_to_datetime`."""
+    assert parse_rss_date(value) == parsedate_to_datetime(value)
+
+
+def test_compact_records_convert_to_models() -> None:
+    """Confirm compact records hold the same data as models, apart from the description."""
+    for data in (NEW_PACKAGE_DATA, UPDATED_PACKAGE_DATA):
+        record = RSSPackageRecord.from_rss_item(dict(data))
+        assert record.to_model() == RSSPackageMetadata.model_validate(dict(data))
+    assert not hasattr(record, "__dict__")
+    with pytest.raises(ValueError, match="missing"):
+        RSSPackageRecord.from_rss_item({"title": "test-package 1.0.0"})
+
+
+def test_compact_feed() -> None:
+    """Confirm the client can return compact records."""
+    transport = httpx.MockTransport(lambda _: httpx.Response(200, text=build_feed("b", "a")))
+    with httpx.Client(transport=transport) as http_client:
+        records = PyPIServices(http_client).get_rss_feed(PyPIServices.NEWEST_PACKAGES_FEED_URL, compact=True)
+
+    assert [record.title for record in records] == ["b", "a"]
+    assert all(isinstance(record, RSSPackageRecord) for record in records)
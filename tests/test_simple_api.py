@@ -0,0 +1,68 @@
+"""Test listing files with the Simple Repository API."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from letsbuilda.pypi import PackageNotFoundError, PyPIServices, SimpleProject
+from letsbuilda.pypi.async_client import PyPIServices as AsyncPyPIServices
+
+SIMPLE_API_DATA = {
+    "meta": {"api-version": "1.1", "_last-serial": 18988479},
+    "name": "letsbuilda-pypi",
+    "versions": ["4.0.0"],
+    "files": [
+        {
+            "filename": "letsbuilda_pypi-4.0.0-py3-none-any.whl",
+            "url": "https://files.pythonhosted.org/packages/cb/63/letsbuilda_pypi-4.0.0-py3-none-any.whl",
+            "hashes": {"sha256": "67a5925e5a51f761ad3c28f3abf90d0b0b4270c26efd87f596d42e5706a63798"},
+            "requires-python": ">=3.10",
+            "core-metadata": {"sha256": "0c1c8d1f3b0f7e3cd2e8c23a0bfb2d63a2a4c2c4a4e3b9d4b1f6f3f1b6d0c2e1"},
+            "data-dist-info-metadata": {"sha256": "0c1c8d1f3b0f7e3cd2e8c23a0bfb2d63a2a4c2c4a4e3b9d4b1f6f3f1b6d0c2e1"},
+            "size": 4772,
+            "upload-time": "2023-04-26T02:40:03.919027Z",
+            "yanked": False,
+        },
+        {
+            "filename": "letsbuilda-pypi-4.0.0.tar.gz",
+            "url": "https://files.pythonhosted.org/packages/71/a0/letsbuilda-pypi-4.0.0.tar.gz",
+            "hashes": {"sha256": "0060a9380a89bf772c84c4f39d89417b6529378c4ce39f3b525b40f83c883287"},
+            "requires-python": ">=3.10",
+            "yanked": "Broken build",
+        },
+    ],
+}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    """Serve the sample project, only to clients asking for PEP 691 JSON."""
+    assert request.headers["Accept"] == PyPIServices.SIMPLE_API_CONTENT_TYPE
+    if request.url.path != "/simple/letsbuilda-pypi/":
+        return httpx.Response(404)
+    return httpx.Response(200, json=SIMPLE_API_DATA)
+
+
+def test_simple_project_parsing() -> None:
+    """Confirm the files of a project are listed by both clients, with normalized names."""
+    with httpx.Client(transport=httpx.MockTransport(_handler)) as http_client:
+        project = PyPIServices(http_client).get_simple_project("LetsBuilda_PyPI")
+
+    async def fetch_async() -> SimpleProject:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as http_client:
+            return await AsyncPyPIServices(http_client).get_simple_project("letsbuilda.pypi")
+
+    assert asyncio.run(fetch_async()) == project
+    wheel, sdist = project.files
+    assert wheel.requires_python == ">=3.10"
+    assert wheel.metadata_url == f"{wheel.url}.metadata"
+    assert not wheel.is_yanked
+    assert sdist.metadata_url is None
+    assert sdist.is_yanked
+    assert project.meta.last_serial == 18988479  # noqa: PLR2004 - from the sample data
+
+
+def test_missing_simple_project() -> None:
+    """Confirm missing projects raise `PackageNotFoundError`."""
+    with httpx.Client(transport=httpx.MockTransport(_handler)) as http_client, pytest.raises(PackageNotFoundError):
+        PyPIServices(http_client).get_simple_project("missing")